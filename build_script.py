@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 HWPX 자동화 도구 EXE 빌드 스크립트
-PyInstaller를 사용하여 단일 EXE 파일 생성
+PyInstaller를 사용하여 실행 파일 폴더(onedir) 생성
 """
 
 import os
@@ -10,36 +10,177 @@ import shutil
 import subprocess
 from pathlib import Path
 import platform
+import importlib.util
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# 운영체제별 Tesseract 실행 파일 후보 경로
+_TESSERACT_CANDIDATES = {
+    "Windows": (
+        "C:\\Program Files\\Tesseract-OCR\\tesseract.exe",
+        "C:\\Program Files (x86)\\Tesseract-OCR\\tesseract.exe",
+    ),
+    "Darwin": (
+        "/usr/local/bin/tesseract",
+        "/opt/homebrew/bin/tesseract",
+    ),
+    "Linux": (
+        "/usr/bin/tesseract",
+        "/usr/local/bin/tesseract",
+    ),
+}
+
+# 빌드 설정
+APP_NAME = "HWPX_Automation"
+MAIN_SCRIPT = "hwpx_automation_gui_final.py"
+SPEC_FILE = f"{APP_NAME}.spec"
+
+# 숨겨진 임포트
+# 표준 라이브러리·tkinter 등 PyInstaller가 자동으로 찾는 모듈은 적지 않고,
+# 동적으로 로드되는 패키지는 spec 실행 시점에 collect_submodules로 수집
+_HIDDEN_IMPORTS = [
+    "PIL._tkinter_finder",
+]
+_HIDDEN_IMPORT_PACKAGES = [
+    "lxml",
+    "pdfplumber",
+]
+
+# 제외할 모듈 (크기 줄이기)
+# pdfplumber/Pillow 등을 통해 간접적으로 끌려오는 모듈들도 제외
+# (pandas 제외 시 EXE에서는 엑셀 참조 파일을 지원하지 않음 - GUI는 사용하지 않음)
+_EXCLUDED_MODULES = [
+    "matplotlib",
+    "matplotlib.tests",
+    "numpy.random._pickle",
+    "numpy.tests",
+    "tkinter.test",
+    "unittest",
+    "test",
+    "pydoc",
+    "doctest",
+    # GUI 프레임워크 (tkinter만 사용)
+    "PyQt5",
+    "PyQt6",
+    "PySide2",
+    "PySide6",
+    # 대화형/과학 계산 패키지
+    "IPython",
+    "jupyter",
+    "notebook",
+    "scipy",
+    "pandas",
+    # 패키징/문서 도구
+    "setuptools",
+    "pip",
+    "wheel",
+    "distutils",
+    "sphinx",
+    # 사용하지 않는 pygments 렉서
+    "pygments.lexers.matlab",
+    "pygments.lexers.web",
+    "pygments.lexers.php",
+    "pygments.lexers.ruby",
+    "pygments.lexers.perl",
+    "pygments.lexers.jvm",
+    "pygments.lexers.sql",
+    "pygments.lexers.fortran",
+    "pygments.lexers.r",
+]
+
+# PyInstaller spec 템플릿
+_SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
+# build_script.py에서 자동 생성된 파일입니다.
+from PyInstaller import __version__ as pyinstaller_version
+from PyInstaller.utils.hooks import collect_submodules
+
+# 바이트코드 최적화(assert·docstring 제거)는 PyInstaller 6부터 Analysis의 optimize 인자로 지정
+# (5.x는 build_script.py가 PyInstaller를 python -O로 실행하는 것으로 대신함)
+analysis_options = {{}}
+if int(pyinstaller_version.split('.')[0]) >= 6:
+    analysis_options['optimize'] = 2
+
+hiddenimports = {hidden_imports!r}
+for package in {hidden_import_packages!r}:
+    hiddenimports += collect_submodules(package)
+
+a = Analysis(
+    [{main_script!r}],
+    pathex=[],
+    binaries={binaries!r},
+    datas={datas!r},
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    runtime_hooks=[],
+    excludes={excludes!r},
+    noarchive=False,
+    **analysis_options,
+)
+
+# 간접적으로 포함되는 Qt 바이너리 제거
+# (tcl/tk는 GUI에서 tkinter를 사용하므로 유지)
+a.binaries = [b for b in a.binaries if not any(x in b[0].lower() for x in ('qt5', 'qt6'))]
+
+# 패키지에 딸려오는 테스트/예제 데이터와 타입 스텁(.pyi) 제거
+def _is_unneeded_data(dest):
+    parts = dest.lower().replace('\\\\', '/').split('/')
+    return parts[-1].endswith('.pyi') or any(p in ('test', 'tests', 'example', 'examples') for p in parts[:-1])
+
+a.datas = [d for d in a.datas if not _is_unneeded_data(d[0])]
+
+pyz = PYZ(a.pure)
+
+# 단일 파일(onefile) 대신 폴더(onedir) 배포: 실행 시 임시 폴더 압축 해제가 없음
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name={app_name!r},
+    debug=False,
+    strip={strip!r},
+    upx=True,
+    upx_exclude=[],
+    console=False,
+    icon={icon!r},
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip={strip!r},
+    upx=True,
+    upx_exclude=[],
+    name={app_name!r},
+)
+"""
 
 def check_dependencies():
-    """필수 의존성 확인"""
+    """필수 의존성 확인 (모듈을 실제로 임포트하지 않고 탐색만 수행)"""
     print("🔍 의존성 확인 중...")
     
-    required_packages = [
-        'pyinstaller', 'tkinter', 'pdfplumber', 'Pillow', 
-        'pytesseract', 'lxml', 'pathlib'
-    ]
+    # 패키지 이름 -> 임포트 모듈 이름
+    # tkinter는 패키지만 있고 바이너리가 없는 경우가 있어 _tkinter로 확인
+    required_packages = {
+        'pyinstaller': 'PyInstaller',
+        'tkinter': '_tkinter',
+        'pdfplumber': 'pdfplumber',
+        'Pillow': 'PIL',
+        'pytesseract': 'pytesseract',
+        'lxml': 'lxml',
+    }
     
     missing_packages = []
     
-    for package in required_packages:
-        try:
-            if package == 'tkinter':
-                import tkinter
-            elif package == 'pyinstaller':
-                import PyInstaller
-            elif package == 'pdfplumber':
-                import pdfplumber
-            elif package == 'Pillow':
-                import PIL
-            elif package == 'pytesseract':
-                import pytesseract
-            elif package == 'lxml':
-                import lxml
-            elif package == 'pathlib':
-                import pathlib
+    # 모듈 탐색은 파일시스템 조회 위주이므로 스레드로 병렬 처리
+    with ThreadPoolExecutor(max_workers=len(required_packages)) as executor:
+        specs = list(executor.map(importlib.util.find_spec, required_packages.values()))
+    
+    for package, spec in zip(required_packages, specs):
+        if spec is not None:
             print(f"✅ {package}")
-        except ImportError:
+        else:
             missing_packages.append(package)
             print(f"❌ {package}")
     
@@ -51,28 +192,20 @@ def check_dependencies():
     
     return True
 
+@lru_cache(maxsize=1)
 def find_tesseract():
-    """Tesseract 설치 경로 찾기"""
-    possible_paths = [
-        "C:\\Program Files\\Tesseract-OCR",
-        "C:\\Program Files (x86)\\Tesseract-OCR",
-        "/usr/bin",
-        "/usr/local/bin",
-        "/opt/homebrew/bin"
-    ]
-    
-    for path in possible_paths:
-        tesseract_exe = os.path.join(path, "tesseract.exe" if platform.system() == "Windows" else "tesseract")
-        if os.path.exists(tesseract_exe):
+    """Tesseract 설치 경로 찾기 (결과는 캐시됨)"""
+    for tesseract_exe in _TESSERACT_CANDIDATES.get(platform.system(), ()):
+        if os.path.isfile(tesseract_exe):
+            path = os.path.dirname(tesseract_exe)
             print(f"✅ Tesseract 발견: {path}")
             return path
     
     print("⚠️ Tesseract를 찾을 수 없습니다. 수동으로 설치해주세요.")
     return None
 
-def create_requirements_txt():
-    """requirements.txt 파일 생성"""
-    requirements = """
+# requirements.txt 내용 (모듈 로드 시 한 번만 인코딩)
+_REQUIREMENTS_BYTES = """
 # HWPX 자동화 도구 의존성
 pyinstaller>=5.0.0
 pdfplumber>=0.7.0
@@ -86,66 +219,18 @@ colorlog>=6.0.0
 regex>=2021.0.0
 opencv-python>=4.5.0
 pathlib2>=2.3.0
-""".strip()
-    
-    with open("requirements.txt", "w", encoding="utf-8") as f:
-        f.write(requirements)
+""".strip().encode("utf-8")
+
+def create_requirements_txt():
+    """requirements.txt 파일 생성"""
+    Path("requirements.txt").write_bytes(_REQUIREMENTS_BYTES)
     print("📝 requirements.txt 생성됨")
 
-def build_exe():
-    """EXE 파일 빌드"""
-    print("\n🚀 EXE 빌드 시작")
-    
-    # 프로젝트 설정
-    main_script = "hwpx_automation_gui_final.py"
-    app_name = "HWPX_Automation"
-    
-    # 메인 스크립트 존재 확인
-    if not os.path.exists(main_script):
-        print(f"❌ 메인 스크립트를 찾을 수 없습니다: {main_script}")
-        return False
-    
-    # 기본 PyInstaller 명령어
-    cmd = [
-        "pyinstaller",
-        "--name", app_name,
-        "--onefile",                    # 단일 EXE 파일
-        "--windowed",                   # 콘솔 창 숨기기
-        "--clean",                      # 임시 파일 정리
-        "--noconfirm",                 # 기존 파일 덮어쓰기
-        
-        # 숨겨진 임포트
-        "--hidden-import", "PIL._tkinter_finder",
-        "--hidden-import", "tkinter",
-        "--hidden-import", "tkinter.ttk",
-        "--hidden-import", "tkinter.scrolledtext",
-        "--hidden-import", "tkinter.filedialog",
-        "--hidden-import", "tkinter.messagebox",
-        "--hidden-import", "pdfplumber",
-        "--hidden-import", "pytesseract",
-        "--hidden-import", "lxml",
-        "--hidden-import", "lxml.etree",
-        "--hidden-import", "xml.etree.ElementTree",
-        "--hidden-import", "zipfile",
-        "--hidden-import", "tempfile",
-        "--hidden-import", "pathlib",
-        "--hidden-import", "threading",
-        "--hidden-import", "json",
-        "--hidden-import", "csv",
-        "--hidden-import", "re",
-        "--hidden-import", "datetime",
-        
-        # 제외할 모듈 (크기 줄이기)
-        "--exclude-module", "matplotlib",
-        "--exclude-module", "numpy.random._pickle",
-        "--exclude-module", "tkinter.test",
-        "--exclude-module", "unittest",
-        "--exclude-module", "test",
-        "--exclude-module", "pydoc",
-        "--exclude-module", "doctest",
-        
-        main_script
-    ]
+def create_spec_file():
+    """PyInstaller spec 파일 생성 (기존 파일과 내용이 같으면 그대로 둠)"""
+    datas = []
+    binaries = []
+    icon = None
     
     # 추가 Python 파일들 포함
     additional_files = [
@@ -154,9 +239,13 @@ def build_exe():
         "hwpx_image_inserter.py"
     ]
     
+    # 현재 폴더의 파일 목록을 한 번만 읽어 존재 여부 확인
+    with os.scandir('.') as entries:
+        present_files = {entry.name for entry in entries if entry.is_file()}
+    
     for file in additional_files:
-        if os.path.exists(file):
-            cmd.extend(["--add-data", f"{file};."])
+        if file in present_files:
+            datas.append((file, "."))
             print(f"📄 포함됨: {file}")
     
     # Tesseract 포함 (Windows)
@@ -167,29 +256,95 @@ def build_exe():
             tessdata_path = os.path.join(tesseract_path, "tessdata")
             
             if os.path.exists(tesseract_exe):
-                cmd.extend(["--add-binary", f"{tesseract_exe};tesseract"])
+                binaries.append((tesseract_exe, "tesseract"))
             
             if os.path.exists(tessdata_path):
-                cmd.extend(["--add-data", f"{tessdata_path};tessdata"])
+                datas.append((tessdata_path, "tessdata"))
     
     # 아이콘 파일 (있는 경우)
     icon_files = ["icon.ico", "assets/icon.ico", "resources/icon.ico"]
     for icon_file in icon_files:
-        if os.path.exists(icon_file):
-            cmd.extend(["--icon", icon_file])
+        # 하위 폴더 경로만 개별 확인
+        if icon_file in present_files or ("/" in icon_file and os.path.isfile(icon_file)):
+            icon = icon_file
             print(f"🎨 아이콘 설정: {icon_file}")
             break
     
+    spec_content = _SPEC_TEMPLATE.format(
+        main_script=MAIN_SCRIPT,
+        app_name=APP_NAME,
+        datas=datas,
+        binaries=binaries,
+        hidden_imports=_HIDDEN_IMPORTS,
+        hidden_import_packages=_HIDDEN_IMPORT_PACKAGES,
+        excludes=_EXCLUDED_MODULES,
+        # Windows에는 strip 도구가 없는 경우가 많아 제외
+        strip=platform.system() != "Windows",
+        icon=icon
+    )
+    
+    # 내용이 같으면 그대로 두어 PyInstaller가 이전 빌드의 분석 결과를 재사용하도록 하고,
+    # 템플릿이나 포함 파일이 바뀌었으면 다시 씀
+    try:
+        with open(SPEC_FILE, "r", encoding="utf-8") as f:
+            if f.read() == spec_content:
+                print(f"♻️ 기존 spec 파일 사용: {SPEC_FILE}")
+                return
+    except OSError:
+        pass
+    
+    with open(SPEC_FILE, "w", encoding="utf-8") as f:
+        f.write(spec_content)
+    print(f"📝 spec 파일 생성됨: {SPEC_FILE}")
+
+def build_exe():
+    """EXE 파일 빌드"""
+    print("\n🚀 EXE 빌드 시작")
+    
+    # 메인 스크립트 존재 확인
+    if not os.path.exists(MAIN_SCRIPT):
+        print(f"❌ 메인 스크립트를 찾을 수 없습니다: {MAIN_SCRIPT}")
+        return False
+    
+    # spec 파일은 템플릿과 내용이 다를 때만 다시 생성 (같으면 이전 빌드 결과 재사용)
+    create_spec_file()
+    
+    # PyInstaller 명령어 (분석 캐시 재사용을 위해 --clean 미사용)
+    # PyInstaller 5.x는 실행 중인 인터프리터의 최적화 수준으로 바이트코드를 묶으므로 -O로 실행
+    # (6 이상은 이 옵션을 쓰지 않고 spec의 optimize=2 사용)
+    cmd = [
+        sys.executable, "-O", "-m", "PyInstaller",
+        SPEC_FILE,
+        "--noconfirm",                 # 기존 파일 덮어쓰기
+    ]
+    
+    # UPX 압축 (설치된 경우)
+    upx_path = shutil.which("upx")
+    if upx_path:
+        cmd.extend(["--upx-dir", os.path.dirname(upx_path)])
+        print(f"🗜️ UPX 압축 사용: {upx_path}")
+    
     try:
         print("📦 PyInstaller 실행 중...")
         print(f"💻 명령어: {' '.join(cmd)}")
         
-        # PyInstaller 실행
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # PyInstaller 실행 (출력을 메모리에 모으지 않고 바로 표시)
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            encoding="utf-8",
+            errors="replace"
+        )
+        for line in process.stdout:
+            sys.stdout.write(line)
+        returncode = process.wait()
         
-        if result.returncode == 0:
+        if returncode == 0:
             # 성공
-            exe_path = Path("dist") / f"{app_name}.exe"
+            exe_path = Path("dist") / APP_NAME / f"{APP_NAME}.exe"
             if exe_path.exists():
                 file_size = exe_path.stat().st_size / (1024 * 1024)  # MB
                 print(f"\n✅ 빌드 성공!")
@@ -204,10 +359,8 @@ def build_exe():
                 print("❌ EXE 파일이 생성되지 않았습니다.")
                 return False
         else:
-            # 실패
-            print(f"❌ PyInstaller 실행 실패:")
-            print(f"stdout: {result.stdout}")
-            print(f"stderr: {result.stderr}")
+            # 실패 (상세 로그는 위에 이미 출력됨)
+            print(f"❌ PyInstaller 실행 실패 (종료 코드: {returncode})")
             return False
             
     except Exception as e:
@@ -215,8 +368,8 @@ def build_exe():
         return False
 
 def copy_additional_files():
-    """추가 파일들을 dist 폴더에 복사"""
-    dist_dir = Path("dist")
+    """추가 파일들을 배포 폴더(dist/HWPX_Automation)에 복사"""
+    dist_dir = Path("dist") / APP_NAME
     
     # 복사할 파일들
     files_to_copy = [
@@ -226,20 +379,30 @@ def copy_additional_files():
         "sample_terms.json"
     ]
     
-    for file_name in files_to_copy:
-        if os.path.exists(file_name):
-            try:
-                shutil.copy2(file_name, dist_dir / file_name)
-                print(f"📄 복사됨: {file_name}")
-            except Exception as e:
-                print(f"⚠️ 복사 실패 {file_name}: {e}")
+    def _copy(file_name):
+        try:
+            # 메타데이터가 필요 없는 문서 파일이므로 copyfile 사용
+            # (Linux는 sendfile, Windows는 CopyFileEx 경로를 탐)
+            shutil.copyfile(file_name, dist_dir / file_name)
+            print(f"📄 복사됨: {file_name}")
+        except Exception as e:
+            print(f"⚠️ 복사 실패 {file_name}: {e}")
     
-    # 사용자 가이드 생성
-    create_user_guide(dist_dir)
+    # 파일 복사와 사용자 가이드 생성은 서로 독립적인 I/O이므로 동시에 수행
+    # (사용법.txt는 가이드 생성이 어차피 덮어쓰므로 복사 대상에서 제외해 경합을 막음)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(_copy, f)
+            for f in files_to_copy
+            if f != "사용법.txt" and os.path.exists(f)
+        ]
+        guide_future = executor.submit(create_user_guide, dist_dir)
+        wait(futures + [guide_future])
+    
+    guide_future.result()
 
-def create_user_guide(dist_dir):
-    """사용자 가이드 파일 생성"""
-    guide_content = """
+# 배포 폴더에 들어가는 사용자 가이드 (모듈 로드 시 한 번만 인코딩)
+_USER_GUIDE_BYTES = """
 # HWPX 자동화 도구 사용법
 
 ## 📋 개요
@@ -296,41 +459,54 @@ HWPX 파일의 텍스트를 자동으로 치환하고 이미지를 삽입하는
 
 ## 📞 지원
 문제 발생 시 로그 메시지를 참조하거나 개발자에게 문의하세요.
-""".strip()
-    
+""".strip().encode("utf-8")
+
+def create_user_guide(dist_dir):
+    """사용자 가이드 파일 생성"""
     guide_path = dist_dir / "사용법.txt"
-    with open(guide_path, "w", encoding="utf-8") as f:
-        f.write(guide_content)
+    guide_path.write_bytes(_USER_GUIDE_BYTES)
     print(f"📖 사용자 가이드 생성: {guide_path}")
 
 def clean_build():
     """빌드 임시 파일 정리"""
-    dirs_to_clean = ["build", "__pycache__", "*.egg-info"]
-    files_to_clean = ["*.spec"]
-    
     print("🧹 임시 파일 정리 중...")
     
-    # 디렉토리 삭제
-    for dir_pattern in dirs_to_clean:
-        if "*" in dir_pattern:
-            # 와일드카드 패턴
-            import glob
-            for path in glob.glob(dir_pattern):
-                if os.path.isdir(path):
-                    shutil.rmtree(path)
-                    print(f"🗑️ 삭제됨: {path}")
-        else:
-            # 일반 디렉토리
-            if os.path.exists(dir_pattern):
-                shutil.rmtree(dir_pattern)
-                print(f"🗑️ 삭제됨: {dir_pattern}")
+    dirs_to_remove = []
+    files_to_remove = []
+    
+    # 현재 폴더는 한 번만 훑어서 빌드 산출물을 골라냄
+    with os.scandir(".") as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name == "build" or entry.name.endswith(".egg-info"):
+                    dirs_to_remove.append(entry.path)
+            elif entry.name.endswith(".spec"):
+                files_to_remove.append(entry.path)
+    
+    # 하위 패키지의 __pycache__까지 정리 (가상환경·숨김 폴더·빌드 폴더는 건너뜀)
+    for root, dirs, _ in os.walk("."):
+        if "__pycache__" in dirs:
+            dirs_to_remove.append(os.path.join(root, "__pycache__"))
+        dirs[:] = [
+            d for d in dirs
+            if d not in ("__pycache__", "build", "dist", "venv")
+            and not d.startswith(".")
+            and not d.endswith(".egg-info")
+        ]
+    
+    def _remove_dir(path):
+        shutil.rmtree(path, ignore_errors=True)
+        print(f"🗑️ 삭제됨: {path}")
+    
+    # 디렉토리 삭제는 I/O 위주이므로 스레드로 동시에 처리
+    if dirs_to_remove:
+        with ThreadPoolExecutor(max_workers=min(8, len(dirs_to_remove))) as executor:
+            list(executor.map(_remove_dir, dirs_to_remove))
     
     # 파일 삭제
-    import glob
-    for file_pattern in files_to_clean:
-        for file_path in glob.glob(file_pattern):
-            os.remove(file_path)
-            print(f"🗑️ 삭제됨: {file_path}")
+    for file_path in files_to_remove:
+        os.remove(file_path)
+        print(f"🗑️ 삭제됨: {file_path}")
 
 def main():
     """메인 함수"""
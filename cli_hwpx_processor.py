@@ -9,19 +9,44 @@ HWPX 텍스트 처리 CLI 도구
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 import json
+import hashlib
 from datetime import datetime
+import logging
+from typing import TYPE_CHECKING
 
-# 기존 EnhancedHWPXProcessor 임포트
-from enhanced_hwpx_processor import EnhancedHWPXProcessor
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-def create_sample_reference_files():
-    """샘플 참조 데이터 파일들 생성"""
-    
-    # 샘플 CSV 파일
-    csv_content = """검색어,치환어
+# EnhancedHWPXProcessor는 lxml/pandas 등 무거운 모듈을 끌어오므로
+# --version, --create-samples 처럼 바로 끝나는 경로에서는 임포트하지 않음
+if TYPE_CHECKING:
+    from enhanced_hwpx_processor import EnhancedHWPXProcessor
+
+# 콘솔 출력용 로거 (메시지만 그대로 출력, 프로세서 로그 레벨과 무관)
+log = logging.getLogger("hwpx_cli")
+log.setLevel(logging.INFO)
+log.propagate = False
+if not log.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(_handler)
+
+# 파싱된 참조 데이터 캐시 폴더
+REFERENCE_CACHE_DIR = Path.home() / ".cache" / "hwpx"
+# 참조 데이터 로더/캐시 형식 버전 (파싱 결과가 달라지는 변경 시 올려서 이전 캐시 무효화)
+REFERENCE_CACHE_VERSION = 2
+# 캐시 폴더에 남겨 둘 최대 파일 수 (오래 쓰지 않은 것부터 삭제)
+REFERENCE_CACHE_MAX = 32
+
+# 샘플 참조 파일 내용 (모듈 로드 시 한 번만 인코딩)
+_SAMPLE_CSV_BYTES = """검색어,치환어
 HWPX,한글문서파일
 변환,치환
 검색,탐색
@@ -30,32 +55,99 @@ HWPX,한글문서파일
 빅데이터,대용량데이터
 AI,인공지능
 IoT,사물인터넷
-머신러닝,기계학습"""
+머신러닝,기계학습""".encode('utf-8')
+
+_SAMPLE_JSON_BYTES = json.dumps({
+    "Old Brand": "New Brand",
+    "구브랜드": "신브랜드", 
+    "legacy": "modern",
+    "deprecated": "updated",
+    "obsolete": "current"
+}, ensure_ascii=False, indent=2).encode('utf-8')
+
+def create_sample_reference_files():
+    """샘플 참조 데이터 파일들 생성"""
+    Path('sample_terms.csv').write_bytes(_SAMPLE_CSV_BYTES)
+    Path('sample_terms.json').write_bytes(_SAMPLE_JSON_BYTES)
     
-    with open('sample_terms.csv', 'w', encoding='utf-8') as f:
-        f.write(csv_content)
+    log.info("📁 샘플 참조 파일 생성 완료:")
+    log.info("  - sample_terms.csv")
+    log.info("  - sample_terms.json")
+
+def load_reference_with_cache(processor: "EnhancedHWPXProcessor", reference_path: Path) -> dict:
+    """참조 데이터 로드 (로더 버전 + 파일 내용 해시 기준으로 파싱 결과를 디스크에 캐시)"""
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(f"v{REFERENCE_CACHE_VERSION}".encode('utf-8'))
+    hasher.update(reference_path.suffix.lower().encode('utf-8'))
+    hasher.update(reference_path.read_bytes())
+    cache_file = REFERENCE_CACHE_DIR / f"{hasher.hexdigest()}.json"
     
-    # 샘플 JSON 파일
-    json_content = {
-        "Old Brand": "New Brand",
-        "구브랜드": "신브랜드", 
-        "legacy": "modern",
-        "deprecated": "updated",
-        "obsolete": "current"
-    }
+    if cache_file.exists():
+        try:
+            if HAS_ORJSON:
+                reference_dict = orjson.loads(cache_file.read_bytes())
+            else:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    reference_dict = json.load(f)
+            log.info(f"   ♻️  캐시된 참조 데이터 사용 ({len(reference_dict)}개 항목)")
+            try:
+                os.utime(cache_file)  # 최근 사용 표시 (정리 시 남길 순서)
+            except OSError:
+                pass
+            return reference_dict
+        except (OSError, ValueError):
+            pass  # 손상된 캐시는 무시하고 다시 파싱
+    
+    reference_dict = processor.load_reference_data(str(reference_path))
+    
+    try:
+        REFERENCE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if HAS_ORJSON:
+            cache_file.write_bytes(orjson.dumps(reference_dict))
+        else:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(reference_dict, f, ensure_ascii=False)
+    except OSError as e:
+        log.warning(f"   ⚠️  참조 데이터 캐시 저장 실패: {e}")
+    else:
+        prune_reference_cache()
     
-    with open('sample_terms.json', 'w', encoding='utf-8') as f:
-        json.dump(json_content, f, ensure_ascii=False, indent=2)
+    return reference_dict
+
+def prune_reference_cache(max_entries: int = REFERENCE_CACHE_MAX):
+    """캐시 파일이 max_entries개를 넘으면 오래 쓰지 않은 것부터 삭제"""
+    try:
+        with os.scandir(REFERENCE_CACHE_DIR) as entries:
+            cached = [(entry.stat().st_mtime, entry.path) for entry in entries
+                      if entry.is_file() and entry.name.endswith('.json')]
+    except OSError:
+        return
     
-    print("📁 샘플 참조 파일 생성 완료:")
-    print("  - sample_terms.csv")
-    print("  - sample_terms.json")
+    cached.sort(reverse=True)
+    for _, path in cached[max_entries:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def iter_hwpx(root: Path, recursive: bool = False):
+    """폴더의 HWPX 파일 경로를 하나씩 반환 (os.scandir 기반)"""
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.name.lower().endswith('.hwpx'):
+                    yield entry.path
 
 def validate_file_exists(file_path: str, file_type: str = "파일") -> Path:
     """파일 존재 여부 확인"""
     path = Path(file_path)
     if not path.exists():
-        print(f"❌ 오류: {file_type}을(를) 찾을 수 없습니다: {file_path}")
+        log.error(f"❌ 오류: {file_type}을(를) 찾을 수 없습니다: {file_path}")
         sys.exit(1)
     return path
 
@@ -68,29 +160,31 @@ def get_output_path(input_file: Path, output_dir: Path = None, suffix: str = "_p
         return input_file.parent / f"{input_file.stem}{suffix}.txt"
 
 def print_processing_result(result: dict, file_name: str):
-    """처리 결과 출력"""
+    """처리 결과 출력 (여러 줄을 모아 한 번에 출력)"""
     if result['success']:
-        print(f"✅ {file_name} 처리 완료!")
-        print(f"   📊 총 {result['total_replacements']}개 항목이 치환되었습니다.")
-        print(f"   ⏱️  처리 시간: {result.get('processing_time', 0):.2f}초")
+        lines = [
+            f"✅ {file_name} 처리 완료!",
+            f"   📊 총 {result['total_replacements']}개 항목이 치환되었습니다.",
+            f"   ⏱️  처리 시간: {result.get('processing_time', 0):.2f}초",
+        ]
         
         if result['replacements']:
-            print("   📝 치환 내역:")
+            lines.append("   📝 치환 내역:")
             for replacement in result['replacements'][:10]:  # 최대 10개만 표시
                 if isinstance(replacement, dict):
                     search_term = replacement['search_term']
                     replace_term = replacement['replacement_term']
                     count = replacement['count']
-                    print(f"      '{search_term}' → '{replace_term}' ({count}회)")
+                    lines.append(f"      '{search_term}' → '{replace_term}' ({count}회)")
             
             if len(result['replacements']) > 10:
-                print(f"      ... 및 {len(result['replacements']) - 10}개 더")
+                lines.append(f"      ... 및 {len(result['replacements']) - 10}개 더")
         
         if 'output_file' in result:
-            print(f"   📄 결과 파일: {result['output_file']}")
+            lines.append(f"   📄 결과 파일: {result['output_file']}")
+        log.info("\n".join(lines))
     else:
-        print(f"❌ {file_name} 처리 실패!")
-        print(f"   오류: {result.get('error', '알 수 없는 오류')}")
+        log.error(f"❌ {file_name} 처리 실패!\n   오류: {result.get('error', '알 수 없는 오류')}")
 
 def main():
     parser = argparse.ArgumentParser(
@@ -132,9 +226,22 @@ def main():
         metavar='FOLDER_PATH'
     )
     
+    parser.add_argument(
+        '--recursive',
+        action='store_true',
+        help='일괄 처리시 하위 폴더까지 검색'
+    )
+    
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='일괄 처리시 동시에 처리할 파일 수 (기본값: CPU 코어 수, 1: 순차 처리)'
+    )
+    
     parser.add_argument(
         '--output-dir',
-        help='출력 디렉토리 (일괄 처리시)',
+        help='출력 디렉토리 (일괄 처리시, --recursive면 하위 폴더 구조 유지)',
         default='./processed'
     )
     
@@ -156,6 +263,12 @@ def main():
         help='전체 단어만 매칭'
     )
     
+    parser.add_argument(
+        '--hyperscan',
+        action='store_true',
+        help='Hyperscan으로 모든 검색어를 한 번에 검색/치환 (hyperscan 패키지 필요)'
+    )
+    
     parser.add_argument(
         '--no-backup',
         action='store_true',
@@ -176,6 +289,12 @@ def main():
         help='로그 레벨'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'참조 데이터 캐시 사용 안함 (캐시 위치: {REFERENCE_CACHE_DIR}, 최근 {REFERENCE_CACHE_MAX}개만 보관)'
+    )
+    
     parser.add_argument(
         '--create-samples',
         action='store_true',
@@ -200,23 +319,28 @@ def main():
         parser.error("HWPX 파일 경로 또는 --batch 옵션이 필요합니다.")
     
     # 프로세서 초기화
-    print(f"🚀 HWPX 텍스트 처리기 시작 (로그 레벨: {args.log_level})")
+    from enhanced_hwpx_processor import EnhancedHWPXProcessor
+    
+    log.info(f"🚀 HWPX 텍스트 처리기 시작 (로그 레벨: {args.log_level})")
     processor = EnhancedHWPXProcessor(log_level=args.log_level)
     
     # 참조 데이터 파일 확인
     if Path(args.reference).exists():
-        print(f"📋 참조 데이터: {args.reference}")
-        reference_data = args.reference
+        log.info(f"📋 참조 데이터: {args.reference}")
+        if args.no_cache:
+            reference_data = args.reference
+        else:
+            reference_data = load_reference_with_cache(processor, Path(args.reference))
     else:
-        print(f"⚠️  참조 데이터 파일이 없습니다: {args.reference}")
-        print("   sample_terms.csv 파일을 생성하려면 --create-samples 옵션을 사용하세요.")
+        log.warning(f"⚠️  참조 데이터 파일이 없습니다: {args.reference}")
+        log.info("   sample_terms.csv 파일을 생성하려면 --create-samples 옵션을 사용하세요.")
         
         # 기본 참조 데이터 사용
         reference_data = {
             "예시용어": "변경된용어",
             "HWPX": "한글문서"
         }
-        print("   기본 참조 데이터를 사용합니다.")
+        log.info("   기본 참조 데이터를 사용합니다.")
     
     # 치환 옵션 설정
     replacement_options = {
@@ -224,6 +348,7 @@ def main():
         'whole_word_only': args.whole_word,
         'preview_only': args.preview,
         'backup_original': not args.no_backup,
+        'use_hyperscan': args.hyperscan,
         'max_replacements_per_term': args.max_replacements,
         'use_advanced_regex': True
     }
@@ -231,12 +356,20 @@ def main():
     # 일괄 처리
     if args.batch:
         batch_folder = validate_file_exists(args.batch, "폴더")
-        print(f"📁 폴더 일괄 처리: {batch_folder}")
+        log.info(f"📁 폴더 일괄 처리: {batch_folder}")
+        
+        hwpx_files = iter_hwpx(batch_folder, recursive=args.recursive)
+        
+        if args.jobs > 1:
+            # 파일별로 독립적인 작업이므로 여러 프로세스에서 병렬 처리
+            log.info(f"⚙️  병렬 처리: {args.jobs}개 프로세스")
         
-        results = processor.batch_process_folder(
-            folder_path=str(batch_folder),
+        results = processor.batch_process_iter(
+            hwpx_files,
             reference_data=reference_data,
             output_folder=args.output_dir,
+            max_workers=args.jobs,
+            input_root=batch_folder,  # --recursive 시 하위 폴더 구조를 출력 폴더에 그대로 반영
             replacement_options=replacement_options
         )
         
@@ -244,17 +377,17 @@ def main():
         successful = len([r for r in results if r.get('success')])
         total_replacements = sum(r.get('total_replacements', 0) for r in results)
         
-        print(f"\n📊 일괄 처리 완료!")
-        print(f"   성공: {successful}/{len(results)}개 파일")
-        print(f"   총 치환: {total_replacements}개")
-        print(f"   결과 폴더: {args.output_dir}")
+        log.info(f"\n📊 일괄 처리 완료!")
+        log.info(f"   성공: {successful}/{len(results)}개 파일")
+        log.info(f"   총 치환: {total_replacements}개")
+        log.info(f"   결과 폴더: {args.output_dir}")
         
     # 단일 파일 처리
     else:
         input_file = validate_file_exists(args.input_path, "HWPX 파일")
         
         if input_file.suffix.lower() != '.hwpx':
-            print(f"⚠️  경고: {input_file.name}은 HWPX 파일이 아닐 수 있습니다.")
+            log.warning(f"⚠️  경고: {input_file.name}은 HWPX 파일이 아닐 수 있습니다.")
         
         # 출력 파일 경로 결정
         if args.output:
@@ -262,11 +395,11 @@ def main():
         else:
             output_file = get_output_path(input_file)
         
-        print(f"📄 파일 처리: {input_file.name}")
+        log.info(f"📄 파일 처리: {input_file.name}")
         if args.preview:
-            print("👀 미리보기 모드 (실제 변경하지 않음)")
+            log.info("👀 미리보기 모드 (실제 변경하지 않음)")
         else:
-            print(f"💾 결과 저장: {output_file}")
+            log.info(f"💾 결과 저장: {output_file}")
         
         # 처리 실행
         result = processor.search_and_replace_text(
@@ -281,19 +414,19 @@ def main():
         
         # 미리보기 결과 상세 출력
         if args.preview and result.get('success') and result.get('replacements'):
-            print(f"\n🔍 미리보기 상세:")
+            log.info(f"\n🔍 미리보기 상세:")
             for replacement in result['replacements'][:5]:  # 최대 5개
                 if isinstance(replacement, dict) and 'positions' in replacement:
                     search_term = replacement['search_term']
                     positions = replacement['positions'][:3]  # 최대 3개 위치
-                    print(f"   '{search_term}' 발견 위치: {positions}")
+                    log.info(f"   '{search_term}' 발견 위치: {positions}")
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print("\n\n⏹️  사용자에 의해 중단되었습니다.")
+        log.info("\n\n⏹️  사용자에 의해 중단되었습니다.")
         sys.exit(1)
     except Exception as e:
-        print(f"\n❌ 예상치 못한 오류 발생: {e}")
+        log.error(f"\n❌ 예상치 못한 오류 발생: {e}")
         sys.exit(1)
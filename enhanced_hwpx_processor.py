@@ -1,14 +1,16 @@
+import os
+import mmap
 import zipfile
 import xml.etree.ElementTree as ET
 from pathlib import Path
 import re
 import json
-import tempfile
 import shutil
 import csv
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 import logging
 
 # 추가 패키지들
@@ -36,6 +38,31 @@ try:
 except ImportError:
     HAS_PANDAS = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
 try:
     import colorlog
     HAS_COLORLOG = True
@@ -49,6 +76,24 @@ except ImportError:
     import re as advanced_re
     HAS_REGEX = False
 
+# 연속 공백 정규화 패턴
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# pandas로 CSV 참조 데이터를 읽을 때 한 번에 처리할 행 수
+CSV_CHUNK_SIZE = 100_000
+
+# 이 크기(압축 해제 기준)를 넘는 섹션 XML은 스트리밍으로 파싱
+SECTION_STREAM_THRESHOLD = 16 * 1024 * 1024
+
+# CSV 첫 행이 헤더인지 판단할 때 쓰는 첫 컬럼 이름들
+_CSV_HEADER_NAMES = frozenset({'search', '검색어', 'original'})
+
+class _MappedFile(mmap.mmap):
+    """zipfile이 요구하는 seekable()을 갖춘 읽기 전용 메모리 맵 (mmap은 3.13부터 제공)"""
+    
+    def seekable(self):
+        return True
+
 @dataclass
 class ProcessingStats:
     """처리 통계"""
@@ -64,10 +109,12 @@ class EnhancedHWPXProcessor:
     """향상된 HWPX 텍스트 처리기"""
     
     def __init__(self, log_level: str = "INFO"):
-        self.temp_dir = None
         self.sections = []
         self.document_info = {}
         self.stats = ProcessingStats()
+        self._hyperscan_cache = {}
+        self._automaton_cache = {}
+        self._encoding_cache = {}
         
         # 로거 설정
         self._setup_logger(log_level)
@@ -103,6 +150,10 @@ class EnhancedHWPXProcessor:
             "CharDet (인코딩 감지)": HAS_CHARDET,
             "TQDM (진행률 표시)": HAS_TQDM,
             "Pandas (데이터 분석)": HAS_PANDAS,
+            "OrJSON (고속 JSON)": HAS_ORJSON,
+            "PyArrow (고속 CSV)": HAS_PYARROW,
+            "Aho-Corasick (단일 패스 치환)": HAS_AHOCORASICK,
+            "Hyperscan (다중 패턴 검색)": HAS_HYPERSCAN,
             "ColorLog (컬러 로그)": HAS_COLORLOG,
             "Regex (고급 정규식)": HAS_REGEX
         }
@@ -117,28 +168,57 @@ class EnhancedHWPXProcessor:
         if not HAS_CHARDET:
             return 'utf-8'
         
+        # 같은 파일(경로·수정 시각·크기 동일)은 다시 감지하지 않음
+        try:
+            stat = file_path.stat()
+            cache_key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+        if cache_key in self._encoding_cache:
+            return self._encoding_cache[cache_key]
+        
+        encoding = self._detect_encoding_uncached(file_path)
+        if cache_key is not None:
+            self._encoding_cache[cache_key] = encoding
+        return encoding
+    
+    def _detect_encoding_uncached(self, file_path: Path) -> str:
+        """chardet으로 파일 인코딩 감지"""
         try:
+            # 2KB씩 넣다가 판정이 끝나면 중단 (최대 10KB)
+            detector = chardet.UniversalDetector()
             with open(file_path, 'rb') as f:
-                raw_data = f.read(10000)  # 첫 10KB만 읽어서 감지
-                result = chardet.detect(raw_data)
-                encoding = result['encoding']
-                confidence = result['confidence']
-                
-                self.logger.debug(f"인코딩 감지: {encoding} (신뢰도: {confidence:.2f})")
-                
-                # 신뢰도가 낮으면 기본값 사용
-                if confidence < 0.7:
-                    self.logger.warning(f"인코딩 감지 신뢰도 낮음. UTF-8 사용")
-                    return 'utf-8'
-                
-                return encoding or 'utf-8'
+                for _ in range(5):
+                    chunk = f.read(2048)
+                    if not chunk:
+                        break
+                    detector.feed(chunk)
+                    if detector.done:
+                        break
+            detector.close()
+            
+            encoding = detector.result['encoding']
+            confidence = detector.result['confidence'] or 0.0
+            
+            self.logger.debug(f"인코딩 감지: {encoding} (신뢰도: {confidence:.2f})")
+            
+            # 신뢰도가 낮으면 기본값 사용
+            if confidence < 0.7:
+                self.logger.warning(f"인코딩 감지 신뢰도 낮음. UTF-8 사용")
+                return 'utf-8'
+            
+            return encoding or 'utf-8'
         except Exception as e:
             self.logger.warning(f"인코딩 감지 실패: {e}. UTF-8 사용")
             return 'utf-8'
     
     def load_reference_data(self, data_source: Union[str, Dict, List]) -> Dict[str, str]:
         """향상된 참조 데이터 로드"""
-        self.logger.info(f"참조 데이터 로드 시작: {data_source}")
+        if isinstance(data_source, str):
+            self.logger.info(f"참조 데이터 로드 시작: {data_source}")
+        elif isinstance(data_source, (dict, list)):
+            # 일괄 처리에서는 파일마다 같은 사전이 넘어오므로 내용 대신 형식과 개수만 기록
+            self.logger.info(f"참조 데이터 로드 시작: {type(data_source).__name__} {len(data_source)}개 항목")
         
         if isinstance(data_source, str):
             file_path = Path(data_source)
@@ -173,21 +253,47 @@ class EnhancedHWPXProcessor:
         reference_dict = {}
         
         try:
-            if HAS_PANDAS:
-                # Pandas를 사용한 로드
-                df = pd.read_csv(csv_path, encoding=encoding)
+            if HAS_PYARROW:
+                # PyArrow를 사용한 로드 (멀티스레드 C++ 파서)
+                # 첫 행은 헤더로 건너뛰고, 검색어/치환어는 타입 추론 없이 문자열 그대로 ('001'이 1로 바뀌지 않도록)
+                table = pa_csv.read_csv(
+                    csv_path,
+                    read_options=pa_csv.ReadOptions(
+                        encoding=encoding, skip_rows=1, autogenerate_column_names=True
+                    ),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={'f0': pa.string(), 'f1': pa.string()},
+                        strings_can_be_null=False
+                    )
+                )
                 
                 # 첫 두 컬럼을 검색어-치환어로 사용
-                if len(df.columns) >= 2:
-                    search_col = df.columns[0]
-                    replace_col = df.columns[1]
+                if table.num_columns >= 2:
+                    search_terms = table.column(0).to_pylist()
+                    replace_terms = table.column(1).to_pylist()
                     
-                    for _, row in df.iterrows():
-                        search_term = str(row[search_col]).strip()
-                        replace_term = str(row[replace_col]).strip()
-                        
-                        if search_term and search_term != 'nan':
-                            reference_dict[search_term] = replace_term
+                    for search_term, replace_term in zip(search_terms, replace_terms):
+                        if search_term is None:
+                            continue
+                        search_term = str(search_term).strip()
+                        if search_term:
+                            reference_dict[search_term] = '' if replace_term is None else str(replace_term).strip()
+                
+                self.logger.info(f"PyArrow로 CSV에서 {len(reference_dict)}개 항목 로드")
+            elif HAS_PANDAS:
+                # Pandas를 사용한 로드 (모든 값을 문자열로 읽어 타입 추론과 NaN 변환 생략)
+                # 큰 용어 사전도 메모리에 한꺼번에 올리지 않도록 청크 단위로 읽고 첫 두 컬럼만 파싱
+                # (usecols=[0, 1]은 컬럼이 하나뿐이면 오류이므로 헤더로 컬럼 수를 먼저 확인)
+                column_count = len(pd.read_csv(csv_path, encoding=encoding, nrows=0).columns)
+                if column_count >= 2:
+                    chunks = pd.read_csv(
+                        csv_path, encoding=encoding, dtype=str, keep_default_na=False,
+                        usecols=[0, 1], chunksize=CSV_CHUNK_SIZE
+                    )
+                    for chunk in chunks:
+                        reference_dict.update(self._frame_to_reference_dict(chunk))
+                else:
+                    self.logger.warning(f"CSV에 검색어/치환어 두 컬럼이 없습니다: {csv_path}")
                 
                 self.logger.info(f"Pandas로 CSV에서 {len(reference_dict)}개 항목 로드")
             else:
@@ -197,7 +303,7 @@ class EnhancedHWPXProcessor:
                     
                     # 헤더 처리
                     first_row = next(reader, None)
-                    if first_row and not (first_row[0].lower() in ['search', '검색어', 'original']):
+                    if first_row and first_row[0].lower() not in _CSV_HEADER_NAMES:
                         if len(first_row) >= 2:
                             reference_dict[first_row[0].strip()] = first_row[1].strip()
                     
@@ -214,25 +320,24 @@ class EnhancedHWPXProcessor:
         
         return reference_dict
     
+    def _frame_to_reference_dict(self, df) -> Dict[str, str]:
+        """DataFrame의 첫 두 컬럼을 검색어-치환어 딕셔너리로 변환 (행 단위 반복 없이 컬럼 연산)"""
+        if len(df.columns) < 2:
+            return {}
+        
+        search_terms = df.iloc[:, 0].astype(str).str.strip()
+        replace_terms = df.iloc[:, 1].astype(str).str.strip()
+        mask = search_terms != ''
+        return dict(zip(search_terms[mask].tolist(), replace_terms[mask].tolist()))
+    
     def _load_excel_reference(self, excel_path: Path) -> Dict[str, str]:
         """엑셀 파일에서 참조 데이터 로드 (Pandas 필요)"""
         if not HAS_PANDAS:
             raise ImportError("엑셀 파일 처리를 위해 pandas가 필요합니다: pip install pandas openpyxl")
         
         try:
-            df = pd.read_excel(excel_path)
-            reference_dict = {}
-            
-            if len(df.columns) >= 2:
-                search_col = df.columns[0]
-                replace_col = df.columns[1]
-                
-                for _, row in df.iterrows():
-                    search_term = str(row[search_col]).strip()
-                    replace_term = str(row[replace_col]).strip()
-                    
-                    if search_term and search_term != 'nan':
-                        reference_dict[search_term] = replace_term
+            df = pd.read_excel(excel_path, dtype=str, keep_default_na=False)
+            reference_dict = self._frame_to_reference_dict(df)
             
             self.logger.info(f"엑셀에서 {len(reference_dict)}개 항목 로드")
             return reference_dict
@@ -246,8 +351,15 @@ class EnhancedHWPXProcessor:
         encoding = self.detect_file_encoding(json_path)
         
         try:
-            with open(json_path, 'r', encoding=encoding) as f:
-                data = json.load(f)
+            if HAS_ORJSON:
+                # orjson은 UTF-8 바이트를 바로 파싱
+                raw_data = json_path.read_bytes()
+                if encoding.lower() not in ('utf-8', 'ascii'):
+                    raw_data = raw_data.decode(encoding)
+                data = orjson.loads(raw_data)
+            else:
+                with open(json_path, 'r', encoding=encoding) as f:
+                    data = json.load(f)
             
             if isinstance(data, dict):
                 self.logger.info(f"JSON에서 {len(data)}개 항목 로드")
@@ -259,17 +371,30 @@ class EnhancedHWPXProcessor:
             self.logger.error(f"JSON 로드 실패: {e}")
             raise
     
-    def search_and_replace_text(self, 
-                              hwpx_file: str, 
-                              reference_data: Union[str, Dict, List],
-                              output_file: Optional[str] = None,
-                              replacement_options: Optional[Dict] = None) -> Dict:
-        """향상된 텍스트 검색 및 치환"""
-        
-        start_time = datetime.now()
-        self.logger.info(f"파일 처리 시작: {hwpx_file}")
+    def _create_backup(self, source: Path, backup_path: Path):
+        """원본 파일 백업 (가능하면 커널 내부 복사로 사용자 공간 버퍼를 거치지 않음)"""
+        # 하드 링크는 원본이 제자리에서 수정되면 백업도 함께 바뀌므로 사용하지 않음
+        if hasattr(os, 'copy_file_range'):
+            try:
+                # Linux: 같은 파일시스템이면 btrfs/XFS 등에서 블록 공유(reflink)로 처리됨
+                with open(source, 'rb') as src, open(backup_path, 'wb') as dst:
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                if remaining == 0:
+                    shutil.copystat(source, backup_path)
+                    return
+            except OSError:
+                pass
         
-        # 기본 옵션 설정
+        # 그 외 플랫폼은 copy2 (Windows CopyFileEx, macOS fcopyfile 경로 사용)
+        shutil.copy2(source, backup_path)
+    
+    def _resolve_options(self, replacement_options: Optional[Dict] = None) -> Dict:
+        """기본 치환 옵션에 사용자 옵션을 덮어써서 반환"""
         options = {
             'case_sensitive': False,
             'whole_word_only': False,
@@ -277,10 +402,123 @@ class EnhancedHWPXProcessor:
             'use_advanced_regex': HAS_REGEX,
             'max_replacements_per_term': -1,
             'preview_only': False,
-            'backup_original': True
+            'backup_original': True,
+            'use_hyperscan': False
         }
         if replacement_options:
             options.update(replacement_options)
+        return options
+    
+    def _compile_reference(self, reference_dict: Dict, options: Dict) -> Dict:
+        """검색 패턴을 미리 컴파일 (여러 파일에 같은 참조 데이터를 적용할 때 재사용)"""
+        re_module = advanced_re if options['use_advanced_regex'] else re
+        flags = 0 if options['case_sensitive'] else re_module.IGNORECASE
+        
+        # JSON 숫자 등 문자열이 아닌 값은 문자열로 맞춤 (없는 치환어는 빈 문자열)
+        reference_dict = {
+            str(k): v if isinstance(v, str) else ('' if v is None else str(v))
+            for k, v in reference_dict.items()
+        }
+        
+        # 한 글자 → 한 글자 치환은 str.translate 테이블로 분리 (나머지만 패턴으로 처리)
+        translate_terms, literal_terms = {}, reference_dict
+        if (not options['use_regex'] and not options['preview_only']
+                and options['max_replacements_per_term'] <= 0):
+            translate_terms, literal_terms = self._split_single_char_terms(reference_dict, options)
+        
+        # 리터럴 검색어는 결합 정규식 하나로 처리
+        combined = (None, [])
+        if not options['use_regex']:
+            combined = self.build_search_pattern(list(literal_terms), options)
+        
+        # 정규식 검색어나 검색어별 최대 치환 횟수가 있으면 검색어마다 따로 치환
+        per_term = []
+        if options['use_regex'] or (options['max_replacements_per_term'] > 0 and not options['preview_only']):
+            for search_term, replacement_term in reference_dict.items():
+                if not search_term.strip():
+                    continue
+                
+                if options['use_regex']:
+                    pattern = search_term
+                else:
+                    escaped_term = re_module.escape(search_term)
+                    if options['whole_word_only']:
+                        pattern = r'\b' + escaped_term + r'\b'
+                    else:
+                        pattern = escaped_term
+                
+                per_term.append((search_term, replacement_term, re_module.compile(pattern, flags)))
+        
+        return {
+            'combined': combined,
+            'per_term': per_term,
+            'translate_terms': translate_terms,
+            'translate_table': str.maketrans(translate_terms) if translate_terms else None,
+            'literal_terms': literal_terms
+        }
+    
+    def _split_single_char_terms(self, reference_dict: Dict, options: Dict):
+        """str.translate로 처리해도 결과가 같은 한 글자 검색어를 분리 ({한 글자: 치환어}, 나머지) 반환"""
+        # 전체 단어 매칭은 글자 단위 치환으로 표현할 수 없음
+        if options['whole_word_only']:
+            return {}, reference_dict
+        
+        case_sensitive = options['case_sensitive']
+        
+        def candidate(term, replacement):
+            # 공백 검색어는 다른 치환 경로와 마찬가지로 치환하지 않음
+            # 대소문자 무시 모드에서는 대소문자 구분이 없는 글자(한글·숫자·기호 등)만 해당
+            return (len(term) == 1 and term.strip() and len(replacement) <= 1
+                    and (case_sensitive or term.lower() == term.upper()))
+        
+        single = {k: v for k, v in reference_dict.items() if candidate(k, v)}
+        rest = {k: v for k, v in reference_dict.items() if k not in single}
+        
+        # 먼저 글자 치환을 하고 나머지를 검색하므로, 나머지 검색어에 쓰인 글자를 바꾸거나
+        # 만들어내는 치환, 글자를 지우는 치환은 결과가 달라질 수 있어 패턴 쪽에 남김
+        # (옮긴 검색어가 다시 다른 글자를 막을 수 있으므로 더 옮길 것이 없을 때까지 반복)
+        while single and rest:
+            rest_text = ''.join(rest)
+            rest_chars = set(rest_text)
+            if not case_sensitive:
+                rest_chars |= set(rest_text.lower()) | set(rest_text.upper())
+            unsafe = [k for k, v in single.items() if len(v) != 1 or k in rest_chars or v in rest_chars]
+            if not unsafe:
+                break
+            for k in unsafe:
+                rest[k] = single.pop(k)
+        rest = {k: v for k, v in reference_dict.items() if k not in single}
+        
+        return single, rest
+    
+    def _apply_translate(self, text: str, compiled_reference: Dict):
+        """한 글자 치환을 str.translate 한 번으로 적용 (검색어별 치환 횟수 집계)"""
+        replacement_results = []
+        for search_term, replacement_term in compiled_reference['translate_terms'].items():
+            count = text.count(search_term)
+            if count > 0:
+                replacement_results.append({
+                    'search_term': search_term,
+                    'replacement_term': replacement_term,
+                    'count': count
+                })
+        return text.translate(compiled_reference['translate_table']), replacement_results
+    
+    def search_and_replace_text(self, 
+                              hwpx_file: str, 
+                              reference_data: Union[str, Dict, List],
+                              output_file: Optional[str] = None,
+                              replacement_options: Optional[Dict] = None,
+                              compiled_reference: Optional[Dict] = None) -> Dict:
+        """향상된 텍스트 검색 및 치환 (compiled_reference: _compile_reference 결과 재사용)"""
+        
+        start_time = datetime.now()
+        self.logger.info(f"파일 처리 시작: {hwpx_file}")
+        
+        options = self._resolve_options(replacement_options)
+        
+        if options['use_hyperscan'] and not HAS_HYPERSCAN:
+            self.logger.warning("hyperscan 패키지가 없어 기본 정규식 엔진을 사용합니다")
         
         try:
             # HWPX 파일 읽기
@@ -288,14 +526,16 @@ class EnhancedHWPXProcessor:
             if not result['success']:
                 return result
             
-            # 참조 데이터 로드
+            # 참조 데이터 로드 및 패턴 컴파일 (일괄 처리에서는 미리 만든 것을 재사용)
             reference_dict = self.load_reference_data(reference_data)
+            if compiled_reference is None:
+                compiled_reference = self._compile_reference(reference_dict, options)
             
             # 백업 생성
             if options['backup_original'] and not options['preview_only']:
                 backup_path = Path(hwpx_file).with_suffix('.hwpx.backup')
                 if not backup_path.exists():
-                    shutil.copy2(hwpx_file, backup_path)
+                    self._create_backup(Path(hwpx_file), backup_path)
                     self.logger.info(f"백업 파일 생성: {backup_path}")
             
             # 텍스트 치환 수행
@@ -303,59 +543,99 @@ class EnhancedHWPXProcessor:
             modified_text = result['text']
             total_replacements = 0
             
-            # 진행률 표시
-            items = reference_dict.items()
-            if HAS_TQDM:
-                items = tqdm(items, desc="텍스트 치환", unit="terms")
+            # 한 글자 치환은 str.translate로 먼저 적용하고 나머지 검색어만 아래 경로로 처리
+            literal_terms = compiled_reference['literal_terms']
+            if compiled_reference['translate_table'] is not None:
+                modified_text, replacement_results = self._apply_translate(modified_text, compiled_reference)
             
-            for search_term, replacement_term in items:
-                if not search_term.strip():
-                    continue
-                
-                # 정규식 엔진 선택
-                re_module = advanced_re if options['use_advanced_regex'] else re
-                
-                # 검색 패턴 생성
-                if options['use_regex']:
-                    pattern = search_term
-                else:
-                    escaped_term = re_module.escape(search_term)
-                    if options['whole_word_only']:
-                        pattern = r'\b' + escaped_term + r'\b'
-                    else:
-                        pattern = escaped_term
-                
-                # 검색 및 치환
-                flags = 0 if options['case_sensitive'] else re_module.IGNORECASE
-                
-                if options['preview_only']:
-                    matches = list(re_module.finditer(pattern, modified_text, flags))
-                    if matches:
-                        replacement_results.append({
+            # 미리보기는 모든 검색어를 하나의 정규식으로 묶어 텍스트를 한 번만 훑음
+            if options['preview_only'] and not options['use_regex']:
+                replacement_results = self._preview_matches(
+                    modified_text, reference_dict, compiled_reference['combined']
+                )
+                items = ()
+            elif (options['use_hyperscan'] and HAS_HYPERSCAN and not options['use_regex']
+                  and not options['whole_word_only'] and options['max_replacements_per_term'] <= 0):
+                # Hyperscan은 UCP 모드에서 \b를 지원하지 않으므로 전체 단어 매칭은 re로 처리
+                modified_text, results = self._replace_with_hyperscan(
+                    modified_text, literal_terms, options
+                )
+                replacement_results.extend(results)
+                items = ()
+            elif (HAS_AHOCORASICK and not options['use_regex']
+                  and options['max_replacements_per_term'] <= 0
+                  and (options['case_sensitive'] or len(modified_text.lower()) == len(modified_text))):
+                # 리터럴 검색어는 Aho-Corasick 오토마톤으로 텍스트를 한 번만 훑어 치환
+                # (소문자 변환 시 길이가 바뀌는 문자가 있으면 위치가 어긋나므로 정규식 경로 사용)
+                modified_text, results = self._replace_with_automaton(
+                    modified_text, literal_terms, options
+                )
+                replacement_results.extend(results)
+                items = ()
+            elif not options['use_regex'] and options['max_replacements_per_term'] <= 0:
+                # 리터럴 검색어는 하나의 결합 정규식으로 한 번에 치환
+                modified_text, results = self._replace_with_pattern(
+                    modified_text, literal_terms, compiled_reference['combined']
+                )
+                replacement_results.extend(results)
+                items = ()
+            else:
+                items = compiled_reference['per_term']
+            
+            if not options['preview_only']:
+                total_replacements = sum(r['count'] for r in replacement_results)
+            
+            # 진행률 표시 (검색어당 처리 시간이 짧으므로 갱신은 약 1%마다, 0.5초 간격 이상으로)
+            if HAS_TQDM and items:
+                items = tqdm(
+                    items, desc="텍스트 치환", unit="terms",
+                    mininterval=0.5, miniters=max(1, len(items) // 100)
+                )
+            
+            # 리터럴 검색어는 본문에 없으면 정규식을 돌리지 않음 (str 포함 검사는 C 수준)
+            # 앞선 치환으로 본문이 바뀔 수 있으므로 현재 본문 기준으로 검사
+            prefilter = not options['use_regex']
+            case_sensitive = options['case_sensitive']
+            haystack = modified_text if case_sensitive else modified_text.casefold()
+            
+            # 호출 동안 바뀌지 않는 옵션은 반복문 밖에서 지역 변수로 고정
+            append_result = replacement_results.append
+            max_count = max(options['max_replacements_per_term'], 0)
+            log_debug = self.logger.isEnabledFor(logging.DEBUG)
+            
+            # 검색 및 치환 (패턴은 _compile_reference에서 미리 컴파일됨)
+            if options['preview_only']:
+                for search_term, replacement_term, pattern in items:
+                    if prefilter and (search_term if case_sensitive else search_term.casefold()) not in haystack:
+                        continue
+                    
+                    positions = [m.start() for m in pattern.finditer(modified_text)]
+                    if positions:
+                        append_result({
                             'search_term': search_term,
                             'replacement_term': replacement_term,
-                            'matches': len(matches),
-                            'positions': [m.start() for m in matches]
+                            'count': len(positions),
+                            'matches': len(positions),
+                            'positions': positions
                         })
-                else:
-                    if options['max_replacements_per_term'] > 0:
-                        modified_text, count = re_module.subn(
-                            pattern, replacement_term, modified_text, 
-                            count=options['max_replacements_per_term'], flags=flags
-                        )
-                    else:
-                        modified_text, count = re_module.subn(
-                            pattern, replacement_term, modified_text, flags=flags
-                        )
+            else:
+                for search_term, replacement_term, pattern in items:
+                    if prefilter and (search_term if case_sensitive else search_term.casefold()) not in haystack:
+                        continue
                     
-                    total_replacements += count
+                    modified_text, count = pattern.subn(replacement_term, modified_text, count=max_count)
+                    if count == 0:
+                        continue
                     
-                    if count > 0:
-                        replacement_results.append({
-                            'search_term': search_term,
-                            'replacement_term': replacement_term,
-                            'count': count
-                        })
+                    total_replacements += count
+                    if prefilter:
+                        haystack = modified_text if case_sensitive else modified_text.casefold()
+                    append_result({
+                        'search_term': search_term,
+                        'replacement_term': replacement_term,
+                        'count': count
+                    })
+                    if log_debug:
                         self.logger.debug(f"'{search_term}' → '{replacement_term}' ({count}회)")
             
             # 처리 시간 계산
@@ -382,6 +662,9 @@ class EnhancedHWPXProcessor:
             # 결과 파일 저장
             if output_file and not options['preview_only']:
                 self._save_output_file(output_file, replacement_summary, modified_text)
+                # 파일로 저장한 본문은 결과에 다시 들고 있지 않음 (일괄 처리 시 메모리 절약)
+                if 'output_file' in replacement_summary:
+                    del replacement_summary['modified_text']
             
             self.logger.info(f"처리 완료: {total_replacements}개 치환, {processing_time:.2f}초 소요")
             return replacement_summary
@@ -394,6 +677,213 @@ class EnhancedHWPXProcessor:
                 'processing_time': (datetime.now() - start_time).total_seconds()
             }
     
+    def build_search_pattern(self, terms: List[str], options: Dict):
+        """여러 검색어를 이름 있는 그룹의 단일 정규식으로 결합 (그룹 이름 → 검색어 목록 반환)"""
+        re_module = advanced_re if options.get('use_advanced_regex') else re
+        flags = 0 if options.get('case_sensitive') else re_module.IGNORECASE
+        
+        # 긴 검색어를 먼저 두어 짧은 검색어가 앞부분만 잡아먹지 않도록 함
+        ordered_terms = sorted((t for t in terms if t.strip()), key=len, reverse=True)
+        
+        alternatives = []
+        for i, term in enumerate(ordered_terms):
+            escaped_term = re_module.escape(term)
+            if options.get('whole_word_only'):
+                escaped_term = r'\b' + escaped_term + r'\b'
+            alternatives.append(f"(?P<t{i}>{escaped_term})")
+        
+        if not alternatives:
+            return None, []
+        return re_module.compile("|".join(alternatives), flags), ordered_terms
+    
+    def _preview_matches(self, text: str, reference_dict: Dict, combined) -> List[Dict]:
+        """결합 정규식으로 한 번만 탐색하여 검색어별 발견 위치 수집"""
+        pattern, ordered_terms = combined
+        if pattern is None:
+            return []
+        
+        positions = {}
+        for match in pattern.finditer(text):
+            term = ordered_terms[int(match.lastgroup[1:])]
+            positions.setdefault(term, []).append(match.start())
+        
+        # 참조 데이터 순서대로 결과 구성
+        results = []
+        for search_term, replacement_term in reference_dict.items():
+            if search_term in positions:
+                results.append({
+                    'search_term': search_term,
+                    'replacement_term': replacement_term,
+                    'count': len(positions[search_term]),
+                    'matches': len(positions[search_term]),
+                    'positions': positions[search_term]
+                })
+        return results
+    
+    def _replace_with_pattern(self, text: str, reference_dict: Dict, combined):
+        """결합 정규식 하나로 모든 검색어를 한 번에 치환 (검색어별 치환 횟수 집계)"""
+        pattern, ordered_terms = combined
+        if pattern is None:
+            return text, []
+        
+        counts = {}
+        
+        def replace(match):
+            term = ordered_terms[int(match.lastgroup[1:])]
+            counts[term] = counts.get(term, 0) + 1
+            return reference_dict[term]
+        
+        modified_text = pattern.sub(replace, text)
+        
+        # 참조 데이터 순서대로 결과 구성
+        replacement_results = [
+            {
+                'search_term': search_term,
+                'replacement_term': replacement_term,
+                'count': counts[search_term]
+            }
+            for search_term, replacement_term in reference_dict.items()
+            if search_term in counts
+        ]
+        return modified_text, replacement_results
+    
+    def _get_automaton(self, terms: List[str], case_sensitive: bool):
+        """검색어 목록으로 Aho-Corasick 오토마톤 생성 (같은 검색어/옵션이면 재사용)"""
+        key = (tuple(terms), case_sensitive)
+        if key in self._automaton_cache:
+            return self._automaton_cache[key]
+        
+        automaton = ahocorasick.Automaton()
+        for term_id, term in enumerate(terms):
+            word = term if case_sensitive else term.lower()
+            # 대소문자만 다른 검색어는 먼저 나온 것을 우선
+            if not automaton.exists(word):
+                automaton.add_word(word, (term_id, len(word)))
+        automaton.make_automaton()
+        
+        self._automaton_cache[key] = automaton
+        return automaton
+    
+    def _replace_with_automaton(self, text: str, reference_dict: Dict, options: Dict):
+        """Aho-Corasick으로 모든 검색어를 한 번에 찾아 위치 순서대로 한 번에 치환
+        
+        순차 치환과 달리 치환된 결과를 다른 검색어가 다시 검색하지 않음
+        """
+        terms = [t for t in reference_dict if t.strip()]
+        if not terms:
+            return text, []
+        
+        case_sensitive = options.get('case_sensitive', False)
+        automaton = self._get_automaton(terms, case_sensitive)
+        haystack = text if case_sensitive else text.lower()
+        whole_word_only = options.get('whole_word_only', False)
+        
+        def is_word_char(ch):
+            return ch.isalnum() or ch == '_'
+        
+        def is_boundary(pos):
+            # \b와 같은 의미: 위치 앞뒤 글자 중 하나만 단어 문자 (문자열 양 끝 밖은 단어 문자가 아님)
+            before = pos > 0 and is_word_char(text[pos - 1])
+            after = pos < len(text) and is_word_char(text[pos])
+            return before != after
+        
+        matches = []
+        for end_index, (term_id, length) in automaton.iter(haystack):
+            start = end_index - length + 1
+            end = end_index + 1
+            if whole_word_only and not (is_boundary(start) and is_boundary(end)):
+                continue
+            matches.append((start, end, term_id))
+        
+        # 같은 위치에서는 긴 매치를 우선하고, 겹치는 매치는 버림
+        matches.sort(key=lambda m: (m[0], m[0] - m[1]))
+        counts = [0] * len(terms)
+        segments = []
+        last_end = 0
+        for start, end, term_id in matches:
+            if start < last_end:
+                continue
+            segments.append(text[last_end:start])
+            segments.append(reference_dict[terms[term_id]])
+            counts[term_id] += 1
+            last_end = end
+        segments.append(text[last_end:])
+        
+        replacement_results = []
+        for term_id, count in enumerate(counts):
+            if count > 0:
+                replacement_results.append({
+                    'search_term': terms[term_id],
+                    'replacement_term': reference_dict[terms[term_id]],
+                    'count': count
+                })
+        return "".join(segments), replacement_results
+    
+    def _get_hyperscan_database(self, terms: List[str], options: Dict):
+        """검색어 목록으로 Hyperscan 데이터베이스 컴파일 (같은 검색어/옵션이면 재사용)"""
+        key = (tuple(terms), options.get('case_sensitive'))
+        if key in self._hyperscan_cache:
+            return self._hyperscan_cache[key]
+        
+        flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SOM_LEFTMOST
+        if not options.get('case_sensitive'):
+            flags |= hyperscan.HS_FLAG_CASELESS
+        
+        expressions = [re.escape(term).encode('utf-8') for term in terms]
+        
+        database = hyperscan.Database()
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(terms))),
+            elements=len(terms),
+            flags=[flags] * len(terms)
+        )
+        self._hyperscan_cache[key] = database
+        return database
+    
+    def _replace_with_hyperscan(self, text: str, reference_dict: Dict, options: Dict):
+        """Hyperscan으로 모든 검색어를 한 번에 찾아 위치 순서대로 한 번에 치환
+        
+        순차 치환과 달리 치환된 결과를 다른 검색어가 다시 검색하지 않음
+        """
+        terms = [t for t in reference_dict if t.strip()]
+        if not terms:
+            return text, []
+        
+        database = self._get_hyperscan_database(terms, options)
+        data = text.encode('utf-8')
+        matches = []
+        
+        def on_match(term_id, start, end, flags, context):
+            matches.append((start, end, term_id))
+        
+        database.scan(data, match_event_handler=on_match)
+        
+        # 같은 위치에서는 긴 매치를 우선하고, 겹치는 매치는 버림
+        matches.sort(key=lambda m: (m[0], m[0] - m[1]))
+        replacements = [reference_dict[t].encode('utf-8') for t in terms]
+        counts = [0] * len(terms)
+        output = bytearray()
+        last_end = 0
+        for start, end, term_id in matches:
+            if start < last_end:
+                continue
+            output += data[last_end:start]
+            output += replacements[term_id]
+            counts[term_id] += 1
+            last_end = end
+        output += data[last_end:]
+        
+        replacement_results = []
+        for term_id, count in enumerate(counts):
+            if count > 0:
+                replacement_results.append({
+                    'search_term': terms[term_id],
+                    'replacement_term': reference_dict[terms[term_id]],
+                    'count': count
+                })
+        return output.decode('utf-8'), replacement_results
+    
     def _save_output_file(self, output_file: str, summary: Dict, modified_text: str):
         """출력 파일 저장"""
         try:
@@ -403,8 +893,7 @@ class EnhancedHWPXProcessor:
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(modified_text)
             elif output_path.suffix.lower() == '.json':
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(summary, f, ensure_ascii=False, indent=2, default=str)
+                self._write_json(output_path, summary, pretty=True)
             
             summary['output_file'] = str(output_path)
             self.logger.info(f"결과 파일 저장: {output_path}")
@@ -421,11 +910,7 @@ class EnhancedHWPXProcessor:
                            **kwargs) -> List[Dict]:
         """향상된 폴더 일괄 처리"""
         
-        self.stats = ProcessingStats()
-        self.stats.start_time = datetime.now()
-        
         folder = Path(folder_path)
-        results = []
         
         # 출력 폴더 설정
         if output_folder:
@@ -433,53 +918,104 @@ class EnhancedHWPXProcessor:
         else:
             output_dir = folder / "processed"
         
+        # 파일 목록 가져오기 (기본 패턴은 scandir로 확장자만 확인, DirEntry의 캐시된 정보 사용)
+        if file_pattern == "*.hwpx":
+            with os.scandir(folder) as entries:
+                hwpx_files = [
+                    Path(entry.path) for entry in entries
+                    if os.path.normcase(entry.name).endswith('.hwpx') and entry.is_file()
+                ]
+        else:
+            hwpx_files = list(folder.glob(file_pattern))
+        self.logger.info(f"일괄 처리 대상: {len(hwpx_files)}개 파일")
+        
+        return self.batch_process_iter(hwpx_files, reference_data, output_dir, **kwargs)
+    
+    @staticmethod
+    def _batch_output_path(file_path: Union[str, Path], output_dir: Path,
+                           input_root: Optional[Union[str, Path]] = None) -> Path:
+        """일괄 처리 결과 파일 경로 (input_root가 있으면 하위 폴더 구조를 그대로 반영)"""
+        file_path = Path(file_path)
+        target_dir = output_dir
+        if input_root is not None:
+            relative_dir = os.path.relpath(file_path.parent, input_root)
+            if relative_dir != os.curdir:
+                target_dir = output_dir / relative_dir
+                target_dir.mkdir(parents=True, exist_ok=True)
+        return target_dir / f"{file_path.stem}_processed.txt"
+    
+    def batch_process_iter(self, 
+                         hwpx_files: Iterable[Union[str, Path]], 
+                         reference_data: Union[str, Dict, List],
+                         output_folder: Union[str, Path],
+                         max_workers: int = 1,
+                         input_root: Optional[Union[str, Path]] = None,
+                         **kwargs) -> List[Dict]:
+        """파일 경로 이터레이터 일괄 처리 (max_workers > 1이면 여러 프로세스에서 병렬 처리)
+        
+        input_root를 주면 출력 파일을 input_root 기준 상대 경로 그대로 output_folder 아래에
+        만들어, 하위 폴더의 같은 이름 파일끼리 결과를 덮어쓰지 않음
+        """
+        
+        self.stats = ProcessingStats()
+        self.stats.start_time = datetime.now()
+        
+        results = []
+        
+        output_dir = Path(output_folder)
         output_dir.mkdir(exist_ok=True)
         
-        # 파일 목록 가져오기
-        hwpx_files = list(folder.glob(file_pattern))
-        self.stats.files_processed = len(hwpx_files)
+        self.logger.info("일괄 처리 시작")
+        
+        # 참조 데이터 로드와 패턴 컴파일은 모든 파일에 대해 한 번만 수행
+        reference_dict = self.load_reference_data(reference_data)
+        compiled_reference = self._compile_reference(
+            reference_dict, self._resolve_options(kwargs.get('replacement_options'))
+        )
         
-        self.logger.info(f"일괄 처리 시작: {len(hwpx_files)}개 파일")
+        tasks = (
+            (str(file_path), str(self._batch_output_path(file_path, output_dir, input_root)))
+            for file_path in hwpx_files
+        )
+        
+        executor = None
+        if max_workers > 1:
+            # 파일마다 독립적인 작업이므로 프로세스 풀에 나눠 처리
+            # (참조 데이터와 컴파일된 패턴은 작업 프로세스마다 한 번만 전달)
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_batch_worker,
+                initargs=(logging.getLevelName(self.logger.level), reference_dict, compiled_reference, kwargs)
+            )
+            result_iterator = executor.map(_process_batch_task, tasks, chunksize=4)
+        else:
+            result_iterator = (
+                self._process_batch_file(file_path, output_file, reference_dict, compiled_reference, kwargs)
+                for file_path, output_file in tasks
+            )
         
         # 진행률 표시
-        file_iterator = hwpx_files
         if HAS_TQDM:
-            file_iterator = tqdm(hwpx_files, desc="파일 처리", unit="files")
+            result_iterator = tqdm(result_iterator, desc="파일 처리", unit="files")
         
-        for file_path in file_iterator:
-            try:
-                output_file = output_dir / f"{file_path.stem}_processed.txt"
-                
-                result = self.search_and_replace_text(
-                    str(file_path), 
-                    reference_data,
-                    str(output_file),
-                    **kwargs
-                )
-                
-                result['source_file'] = str(file_path)
+        try:
+            for result in result_iterator:
+                self.stats.files_processed += 1
                 results.append(result)
+                file_name = Path(result['source_file']).name
                 
                 if result['success']:
                     self.stats.files_successful += 1
                     self.stats.total_replacements += result.get('total_replacements', 0)
                     if not HAS_TQDM:  # TQDM이 없을 때만 개별 로그
-                        self.logger.info(f"✓ {file_path.name}: {result['total_replacements']}개 치환")
+                        self.logger.info(f"✓ {file_name}: {result['total_replacements']}개 치환")
                 else:
                     self.stats.files_failed += 1
                     if not HAS_TQDM:
-                        self.logger.error(f"✗ {file_path.name}: {result.get('error', '알 수 없는 오류')}")
-                    
-            except Exception as e:
-                self.stats.files_failed += 1
-                error_result = {
-                    'source_file': str(file_path),
-                    'success': False,
-                    'error': str(e)
-                }
-                results.append(error_result)
-                if not HAS_TQDM:
-                    self.logger.error(f"✗ {file_path.name}: {str(e)}")
+                        self.logger.error(f"✗ {file_name}: {result.get('error', '알 수 없는 오류')}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         # 통계 업데이트
         self.stats.end_time = datetime.now()
@@ -494,6 +1030,30 @@ class EnhancedHWPXProcessor:
         
         return results
     
+    def _process_batch_file(self, file_path: str, output_file: str, reference_dict: Dict,
+                            compiled_reference: Dict, kwargs: Dict) -> Dict:
+        """일괄 처리 중 파일 하나 처리 (예외는 실패 결과로 변환)"""
+        try:
+            result = self.search_and_replace_text(
+                file_path, 
+                reference_dict,
+                output_file,
+                compiled_reference=compiled_reference,
+                **kwargs
+            )
+            result['source_file'] = file_path
+            
+            # 모든 파일의 결과를 모아두므로 큰 위치 목록은 버리고 개수만 남김
+            for replacement in result.get('replacements', []):
+                replacement.pop('positions', None)
+            return result
+        except Exception as e:
+            return {
+                'source_file': file_path,
+                'success': False,
+                'error': str(e)
+            }
+    
     def _save_batch_summary(self, output_dir: Path, results: List[Dict]):
         """일괄 처리 결과 요약 저장"""
         summary_file = output_dir / "batch_processing_summary.json"
@@ -511,22 +1071,46 @@ class EnhancedHWPXProcessor:
             'detailed_results': results
         }
         
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, ensure_ascii=False, indent=2, default=str)
+        # 파일 수가 많으면 커지는 기계용 산출물이므로 공백 없이 저장
+        self._write_json(summary_file, summary_data, pretty=False)
         
         self.logger.info(f"처리 요약 저장: {summary_file}")
     
+    def _write_json(self, path: Path, data, pretty: bool = False):
+        """JSON 파일 저장 (orjson이 있으면 바이트로 한 번에 기록)"""
+        if HAS_ORJSON:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            Path(path).write_bytes(orjson.dumps(data, default=str, option=option))
+            return
+        
+        with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            if pretty:
+                json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+            else:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'), default=str)
+    
     # 기존 메서드들 (간략화)
     def read_hwpx(self, file_path: str) -> Dict:
-        """HWPX 파일 읽기"""
+        """HWPX 파일 읽기 (임시 폴더에 풀지 않고 ZIP 항목을 바로 파싱)"""
+        # 이전 파일의 내용이 누적되지 않도록 초기화
+        self.sections = []
+        self.document_info = {}
+        
         try:
-            self.temp_dir = tempfile.mkdtemp()
-            
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                zip_ref.extractall(self.temp_dir)
-            
-            self._parse_document_info()
-            self._parse_sections()
+            # 메모리 맵으로 열어 ZIP 항목 읽기를 read 시스템 호출 대신 페이지 캐시에서 바로 처리
+            with open(file_path, 'rb') as f:
+                try:
+                    source = _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    source = None  # 빈 파일 등 매핑할 수 없으면 일반 파일 읽기
+                
+                try:
+                    with zipfile.ZipFile(source if source is not None else f, 'r') as zip_ref:
+                        self._parse_document_info(zip_ref)
+                        self._parse_sections(zip_ref)
+                finally:
+                    if source is not None:
+                        source.close()
             
             full_text = self._extract_full_text()
             
@@ -539,78 +1123,112 @@ class EnhancedHWPXProcessor:
             
         except Exception as e:
             return {'error': str(e), 'success': False}
-        finally:
-            if self.temp_dir and Path(self.temp_dir).exists():
-                shutil.rmtree(self.temp_dir)
     
-    def _parse_document_info(self):
-        """문서 정보 파싱"""
+    def _parse_xml_entry(self, zip_ref: zipfile.ZipFile, name: str):
+        """ZIP 항목을 XML로 파싱하여 루트 요소 반환"""
+        with zip_ref.open(name) as fp:
+            if HAS_LXML:
+                return LXML_ET.parse(fp).getroot()
+            return ET.parse(fp).getroot()
+    
+    def _iterparse(self, fp, events):
+        """스트리밍 XML 파서 (LXML 사용 가능하면 사용, 주석/처리 명령은 제외)"""
+        if HAS_LXML:
+            return LXML_ET.iterparse(fp, events=events, remove_comments=True, remove_pis=True)
+        return ET.iterparse(fp, events=events)
+    
+    def _parse_document_info(self, zip_ref: zipfile.ZipFile):
+        """문서 정보 파싱 (SUMMARYINFO 시작 태그를 만나면 나머지는 읽지 않음)"""
         try:
-            doc_info_path = Path(self.temp_dir) / "DocInfo" / "document.xml"
-            if doc_info_path.exists():
-                # LXML 사용 가능하면 사용
-                if HAS_LXML:
-                    tree = LXML_ET.parse(str(doc_info_path))
-                    root = tree.getroot()
-                else:
-                    tree = ET.parse(doc_info_path)
-                    root = tree.getroot()
-                
-                summary_info = root.find('.//SUMMARYINFO')
-                if summary_info is not None:
-                    self.document_info = {
-                        'title': summary_info.get('title', ''),
-                        'author': summary_info.get('author', ''),
-                        'date': summary_info.get('date', ''),
-                    }
+            if "DocInfo/document.xml" in zip_ref.NameToInfo:
+                with zip_ref.open("DocInfo/document.xml") as fp:
+                    for _, elem in self._iterparse(fp, ('start',)):
+                        if elem.tag == 'SUMMARYINFO':
+                            self.document_info = {
+                                'title': elem.get('title', ''),
+                                'author': elem.get('author', ''),
+                                'date': elem.get('date', ''),
+                            }
+                            break
         except Exception as e:
             self.logger.debug(f"문서 정보 파싱 오류: {e}")
     
-    def _parse_sections(self):
+    def _parse_sections(self, zip_ref: zipfile.ZipFile):
         """섹션 파싱"""
         try:
-            bodytext_dir = Path(self.temp_dir) / "BodyText"
-            if bodytext_dir.exists():
-                section_files = sorted(bodytext_dir.glob("Section*.xml"))
-                
-                for i, section_file in enumerate(section_files):
-                    if HAS_LXML:
-                        tree = LXML_ET.parse(str(section_file))
-                        root = tree.getroot()
-                    else:
-                        tree = ET.parse(section_file)
-                        root = tree.getroot()
-                    
+            section_names = sorted(
+                name for name in zip_ref.namelist()
+                if name.startswith("BodyText/Section") and name.endswith(".xml") and name.count("/") == 1
+            )
+            
+            for i, name in enumerate(section_names):
+                # 아주 큰 섹션은 트리 전체를 메모리에 올리지 않고 스트리밍으로 텍스트 추출
+                if zip_ref.getinfo(name).file_size > SECTION_STREAM_THRESHOLD:
+                    with zip_ref.open(name) as fp:
+                        text_content = self._extract_text_streaming(fp)
+                else:
+                    root = self._parse_xml_entry(zip_ref, name)
                     text_content = self._extract_text_from_element(root)
-                    
-                    self.sections.append({
-                        'section_index': i,
-                        'text': text_content,
-                        'file_name': section_file.name
-                    })
+                
+                self.sections.append({
+                    'section_index': i,
+                    'text': text_content,
+                    'file_name': name.rsplit("/", 1)[1]
+                })
         except Exception as e:
             self.logger.debug(f"섹션 파싱 오류: {e}")
     
     def _extract_text_from_element(self, element):
-        """XML 요소에서 텍스트 추출"""
-        text_parts = []
-        
-        def extract_recursive(elem):
-            if elem.text:
-                text_parts.append(elem.text)
-            for child in elem:
-                extract_recursive(child)
-                if child.tail:
-                    text_parts.append(child.tail)
+        """XML 요소에서 텍스트 추출 (itertext로 파이썬 재귀 없이 수집)"""
+        full_text = ''.join(element.itertext())
+        return _WHITESPACE_RE.sub(' ', full_text).strip()
+    
+    def _extract_text_streaming(self, fp):
+        """iterparse로 텍스트 추출 (처리가 끝난 하위 요소는 바로 버려 메모리를 일정하게 유지)"""
+        # 열린 요소마다 자식들의 텍스트를 모아두는 스택
+        stack = [[]]
+        for event, elem in self._iterparse(fp, ('start', 'end')):
+            if event == 'start':
+                stack.append([])
+                continue
+            
+            # 끝 태그 시점에는 자신의 text와 자식들의 tail이 모두 파싱되어 있음
+            child_texts = stack.pop()
+            parts = [elem.text or '']
+            for child, child_text in zip(elem, child_texts):
+                parts.append(child_text)
+                parts.append(child.tail or '')
+            stack[-1].append(''.join(parts))
+            
+            # 자신의 tail은 부모가 읽어야 하므로 자식만 제거
+            del elem[:]
         
-        extract_recursive(element)
-        full_text = ''.join(text_parts)
-        return re.sub(r'\s+', ' ', full_text).strip()
+        return _WHITESPACE_RE.sub(' ', ''.join(stack[0])).strip()
     
     def _extract_full_text(self):
         """전체 텍스트 추출"""
         return '\n\n'.join(section['text'] for section in self.sections if section['text'])
 
+# 병렬 일괄 처리용 작업 프로세스 상태 (프로세스마다 한 번만 생성)
+_batch_worker_state = {}
+
+def _init_batch_worker(log_level: str, reference_dict: Dict, compiled_reference: Dict, kwargs: Dict):
+    """작업 프로세스 초기화: 프로세서 생성 및 참조 데이터 보관"""
+    _batch_worker_state['processor'] = EnhancedHWPXProcessor(log_level=log_level)
+    _batch_worker_state['reference_dict'] = reference_dict
+    _batch_worker_state['compiled_reference'] = compiled_reference
+    _batch_worker_state['kwargs'] = kwargs
+
+def _process_batch_task(task) -> Dict:
+    """작업 프로세스에서 (입력 파일, 출력 파일) 하나 처리"""
+    file_path, output_file = task
+    return _batch_worker_state['processor']._process_batch_file(
+        file_path, output_file,
+        _batch_worker_state['reference_dict'],
+        _batch_worker_state['compiled_reference'],
+        _batch_worker_state['kwargs']
+    )
+
 # 사용 예시
 if __name__ == "__main__":
     # 향상된 프로세서 생성
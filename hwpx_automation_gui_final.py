@@ -8,25 +8,152 @@ HWPX 자동화 통합 GUI 애플리케이션 (타입 오류 해결 버전)
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import codecs
+import csv
+import functools
+import hashlib
+import importlib.util
 import json
 import os
 import threading
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
-# 기존 모듈들 임포트
 try:
-    from universal_tax_invoice_extractor import UniversalTaxInvoiceExtractor
-    from enhanced_hwpx_processor import EnhancedHWPXProcessor
-    from hwpx_image_inserter import HWPXImageInserter
-    MODULES_AVAILABLE = True
-except ImportError as e:
-    MODULES_AVAILABLE = False
-    IMPORT_ERROR = str(e)
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# pyarrow와 처리 모듈(pdfplumber, lxml, PIL 등을 끌어옴)은 임포트가 무거우므로
+# 시작 시에는 존재 여부만 확인하고 처음 사용할 때 임포트
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+HAS_CHARDET = importlib.util.find_spec('chardet') is not None
+
+_REQUIRED_MODULES = (
+    'universal_tax_invoice_extractor',
+    'enhanced_hwpx_processor',
+    'hwpx_image_inserter',
+)
+_MISSING_MODULES = [name for name in _REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+MODULES_AVAILABLE = not _MISSING_MODULES
+if _MISSING_MODULES:
+    IMPORT_ERROR = f"No module named {', '.join(_MISSING_MODULES)}"
+
+# 로그 큐 비우기 주기 (밀리초)
+LOG_DRAIN_INTERVAL_MS = 50
+
+# 화면에 출력되지 않은 로그를 보관할 최대 줄 수 (창이 최소화된 동안 등)
+LOG_BUFFER_MAX = 2000
+
+# 한 번에 출력할 최대 로그 줄 수 (많이 쌓이면 다음 주기로 나눠 출력해 화면이 멈추지 않도록)
+LOG_DRAIN_BATCH = 256
+
+# 선택하지 않은 탭을 만들기 전 대기 시간 (밀리초, 첫 화면 표시 후 생성)
+DEFERRED_TAB_BUILD_MS = 200
+
+# 분석 결과 중 참조 데이터 생성에 쓰는 항목 (나머지는 보관하지 않음)
+EXTRACTED_KEYS = ('document_info', 'supplier', 'buyer', 'amounts', 'items', 'contacts')
+
+# 보관할 최대 품목 수 (참조 데이터 생성에는 첫 품목만 사용)
+EXTRACTED_ITEMS_MAX = 50
+
+# 버튼 작업을 동시에 실행할 최대 스레드 수 (HWPX 재작성끼리 디스크/CPU를 다투지 않도록 제한)
+WORKER_POOL_SIZE = 2
+
+# 단계별 결과 캐시 (같은 입력으로 다시 실행하면 이전 결과를 재사용, 출력 파일 내용까지 메모리에 보관)
+STAGE_CACHE_MAX = 16
+
+# 파일 지문(SHA-256) 계산 시 읽기 단위
+FINGERPRINT_CHUNK = 1 << 20
+
+# 참조 CSV 읽기 버퍼 크기
+REFERENCE_READ_BUFFER = 1 << 20
+
+# 이 크기를 넘는 참조 CSV는 PyArrow로 읽음
+PYARROW_CSV_THRESHOLD = 64 * 1024
+
+# 참조 CSV 인코딩/구분자 판정에 쓰는 앞부분 크기
+CSV_DETECT_BYTES = 64 * 1024
+
+# 참조 CSV 구분자 후보 (같은 개수면 앞쪽 우선)와 구분자를 찾을 앞부분 크기
+CSV_DELIMITERS = ',\t;|'
+CSV_SNIFF_BYTES = 512
+
+# 추출 데이터별 자동 생성 참조 데이터를 보관할 최대 개수
+REF_CACHE_MAX = 16
+
+# 파일 선택 대화상자 형식 목록 (클릭마다 새로 만들지 않도록 한 번만 정의)
+TAX_INVOICE_FILETYPES = (
+    ("모든 지원 형식", "*.pdf;*.png;*.jpg;*.jpeg;*.txt"),
+    ("PDF 파일", "*.pdf"),
+    ("이미지 파일", "*.png;*.jpg;*.jpeg"),
+    ("텍스트 파일", "*.txt"),
+    ("모든 파일", "*.*")
+)
+REFERENCE_FILETYPES = (("JSON 파일", "*.json"), ("CSV 파일", "*.csv"), ("모든 파일", "*.*"))
+REFERENCE_SAVE_FILETYPES = (("JSON 파일", "*.json"), ("CSV 파일", "*.csv"))
+HWPX_FILETYPES = (("HWPX 파일", "*.hwpx"), ("모든 파일", "*.*"))
+IMAGE_FILETYPES = (
+    ("이미지 파일", "*.png;*.jpg;*.jpeg;*.bmp;*.gif"),
+    ("PNG 파일", "*.png"),
+    ("JPG 파일", "*.jpg;*.jpeg"),
+    ("모든 파일", "*.*")
+)
+
+@functools.lru_cache(maxsize=256)
+def _file_name_parts(path):
+    """경로의 (파일명, 확장자 뺀 이름) 반환 (Path 객체를 만들지 않음)"""
+    name = path[max(path.rfind('/'), path.rfind(os.sep)) + 1:]
+    dot = name.rfind('.')
+    return name, (name if dot <= 0 or dot == len(name) - 1 else name[:dot])
+
+
+def _basename(path):
+    """경로의 파일명"""
+    return _file_name_parts(path)[0]
+
+
+def _stem(path):
+    """경로의 확장자 뺀 파일명"""
+    return _file_name_parts(path)[1]
+
+
+def _shutdown_pools(*pools):
+    """GUI 종료 시 작업 스레드 풀 정리"""
+    for pool in pools:
+        pool.shutdown(wait=False)
+
 
 class HWPXAutomationGUI:
     """HWPX 자동화 통합 GUI"""
     
+    # 인스턴스 속성을 고정해 속성 딕셔너리 없이 접근
+    __slots__ = (
+        '__weakref__',
+        # 상태
+        'root', 'style', 'notebook', 'log_text', 'current_step', 'files',
+        'extracted_data', 'reference_terms',
+        # 내부 작업 자원
+        '_log_queue', '_io_pool', '_cpu_pool', '_inflight', '_extractor', '_processor', '_processor_lock', '_inserter', '_inserter_lock',
+        '_compiled_terms', '_pending_tabs', '_stage_cache', '_stage_lock', '_ref_cache',
+        '_file_hash_cache', '_stage_inputs', '_default_output_hwpx', '_default_final_output',
+        # 1단계
+        'tax_invoice_var', 'page_workers_var', 'analyze_btn', 'step1_result',
+        # 2단계
+        'auto_generate_btn', 'terms_tree',
+        # 3단계
+        'hwpx_template_var', 'case_sensitive_var', 'whole_word_var', 'backup_var',
+        'output_hwpx_var', 'process_hwpx_btn',
+        # 4단계
+        'image_file_var', 'table_index_var', 'row_index_var', 'col_index_var',
+        'analyze_table_btn', 'img_width_var', 'img_height_var', 'maintain_ratio_var',
+        'alignment_var', 'final_output_var', 'insert_image_btn',
+    )
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("HWPX 자동화 도구 v1.0")
@@ -37,6 +164,11 @@ class HWPXAutomationGUI:
         self.style = ttk.Style()
         self.style.theme_use('clam')
         
+        # 제목/소제목 글꼴은 스타일로 한 번만 지정
+        self.style.configure('Title.TLabel', font=('Arial', 16, 'bold'))
+        self.style.configure('Panel.TLabel', font=('Arial', 12, 'bold'))
+        self.style.configure('Hdr.TLabel', font=('Arial', 10, 'bold'))
+        
         # 변수들
         self.current_step = 0
         self.files = {
@@ -50,8 +182,51 @@ class HWPXAutomationGUI:
         self.extracted_data = {}
         self.reference_terms = {}
         
+        # 템플릿 선택 시 정해 두는 기본 출력 파일명
+        self._default_output_hwpx = ''
+        self._default_final_output = ''
+        
+        # 작업 스레드 로그 큐 (메인 루프에서 일괄 출력)
+        self._log_queue = deque(maxlen=LOG_BUFFER_MAX)
+        
+        # 파일 읽기 등 I/O 작업용 스레드 풀
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        
+        # 버튼 작업용 스레드 풀 (클릭마다 스레드를 새로 만들지 않고 동시 실행 수 제한)
+        self._cpu_pool = ThreadPoolExecutor(
+            max_workers=WORKER_POOL_SIZE,
+            thread_name_prefix="hwpx-worker"
+        )
+        self._inflight = {}
+        self._extractor = None
+        weakref.finalize(self, _shutdown_pools, self._io_pool, self._cpu_pool)
+        
+        # 단계별 결과 캐시 (세금계산서 정보가 디스크에 남지 않도록 메모리에만 보관)
+        self._stage_cache = {}
+        self._stage_lock = threading.Lock()
+        
+        # 파일 해시 캐시 ((경로, 수정 시각, 크기) → SHA-256)
+        self._file_hash_cache = {}
+        
+        # 전체 프로세스 단계별로 현재 결과를 만든 입력 (같으면 해당 단계 건너뜀)
+        self._stage_inputs = {'extract': None, 'terms': None, 'replace': None, 'image': None}
+        
+        # 텍스트 치환기 (참조 데이터/옵션이 같으면 컴파일된 검색 패턴 재사용)
+        # 치환기는 문서를 읽으며 인스턴스 상태를 바꾸므로 생성·컴파일·치환 모두 한 번에 하나의 작업만
+        self._processor = None
+        self._processor_lock = threading.RLock()
+        self._compiled_terms = None
+        
+        # 이미지 삽입기 (한 번 만들어 재사용, 변환 이미지 캐시는 삽입기가 자체 잠금으로 보호)
+        self._inserter = None
+        self._inserter_lock = threading.Lock()
+        
+        # 자동 생성 참조 데이터 (추출 데이터 해시별 LRU)
+        self._ref_cache = OrderedDict()
+        
         # GUI 초기화
         self.create_widgets()
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log)
         
         # 모듈 가용성 확인
         if not MODULES_AVAILABLE:
@@ -72,7 +247,7 @@ class HWPXAutomationGUI:
         
         # 제목
         title_label = ttk.Label(main_frame, text="HWPX 자동화 통합 도구", 
-                               font=('Arial', 16, 'bold'))
+                               style='Title.TLabel')
         title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
         
         # 왼쪽 패널 - 단계별 탭
@@ -89,11 +264,24 @@ class HWPXAutomationGUI:
         left_frame.columnconfigure(0, weight=1)
         left_frame.rowconfigure(0, weight=1)
         
-        # 단계별 탭 생성
-        self.create_step1_tab()  # 세금계산서 분석
-        self.create_step2_tab()  # 참조 데이터 생성
-        self.create_step3_tab()  # HWPX 텍스트 치환
-        self.create_step4_tab()  # 이미지 삽입
+        # 단계별 탭 생성 (첫 탭만 바로 만들고 나머지는 처음 선택할 때 생성)
+        tab_specs = [
+            ("1단계: 세금계산서 분석", self.create_step1_tab),
+            ("2단계: 참조 데이터", self.create_step2_tab),
+            ("3단계: 텍스트 치환", self.create_step3_tab),
+            ("4단계: 이미지 삽입", self.create_step4_tab),
+        ]
+        self._pending_tabs = {}
+        for title, builder in tab_specs:
+            frame = ttk.Frame(self.notebook, padding="10")
+            self.notebook.add(frame, text=title)
+            self._pending_tabs[str(frame)] = (builder, frame)
+        
+        self._build_tab(self.notebook.select())
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        
+        # 선택하지 않은 탭도 첫 화면이 뜬 뒤 유휴 시간에 생성
+        self.root.after(DEFERRED_TAB_BUILD_MS, self._build_pending_tabs)
         
         # 오른쪽 패널 - 로그 영역
         self.create_log_panel(right_frame)
@@ -101,15 +289,12 @@ class HWPXAutomationGUI:
         # 하단 버튼
         self.create_bottom_buttons(main_frame)
     
-    def create_step1_tab(self):
+    def create_step1_tab(self, step1_frame):
         """1단계: 세금계산서 정보 추출"""
         
-        step1_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(step1_frame, text="1단계: 세금계산서 분석")
-        
         # 파일 선택
         ttk.Label(step1_frame, text="세금계산서 파일 선택:", 
-                 font=('Arial', 10, 'bold')).grid(row=0, column=0, sticky="w", pady=(0, 5))
+                 style='Hdr.TLabel').grid(row=0, column=0, sticky="w", pady=(0, 5))
         
         file_frame = ttk.Frame(step1_frame)
         file_frame.grid(row=1, column=0, sticky="ew", pady=(0, 10))
@@ -129,27 +314,33 @@ class HWPXAutomationGUI:
         support_label.grid(row=2, column=0, sticky="w", pady=(0, 10))
         
         # 분석 버튼
-        self.analyze_btn = ttk.Button(step1_frame, text="세금계산서 분석", 
+        analyze_frame = ttk.Frame(step1_frame)
+        analyze_frame.grid(row=3, column=0, pady=10)
+        
+        self.analyze_btn = ttk.Button(analyze_frame, text="세금계산서 분석", 
                                      command=self.analyze_tax_invoice, state='disabled')
-        self.analyze_btn.grid(row=3, column=0, pady=10)
+        self.analyze_btn.grid(row=0, column=0, padx=(0, 10))
+        
+        # 여러 페이지 PDF 추출 병렬 처리
+        ttk.Label(analyze_frame, text="페이지 추출 프로세스 수:").grid(row=0, column=1, padx=(0, 5))
+        self.page_workers_var = tk.IntVar(value=1)
+        ttk.Spinbox(analyze_frame, from_=1, to=os.cpu_count() or 4, width=5,
+                   textvariable=self.page_workers_var).grid(row=0, column=2)
         
         # 결과 미리보기
         ttk.Label(step1_frame, text="추출된 정보 미리보기:", 
-                 font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky="w", pady=(10, 5))
+                 style='Hdr.TLabel').grid(row=4, column=0, sticky="w", pady=(10, 5))
         
         self.step1_result = scrolledtext.ScrolledText(step1_frame, height=8, width=50)
         self.step1_result.grid(row=5, column=0, sticky="nsew", pady=(0, 10))
         step1_frame.columnconfigure(0, weight=1)
         step1_frame.rowconfigure(5, weight=1)
     
-    def create_step2_tab(self):
+    def create_step2_tab(self, step2_frame):
         """2단계: 참조 데이터 생성"""
         
-        step2_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(step2_frame, text="2단계: 참조 데이터")
-        
         ttk.Label(step2_frame, text="텍스트 치환을 위한 참조 데이터 설정", 
-                 font=('Arial', 10, 'bold')).grid(row=0, column=0, sticky="w", pady=(0, 10))
+                 style='Hdr.TLabel').grid(row=0, column=0, sticky="w", pady=(0, 10))
         
         # 자동 생성 버튼
         auto_frame = ttk.Frame(step2_frame)
@@ -164,7 +355,7 @@ class HWPXAutomationGUI:
         
         # 참조 데이터 편집
         ttk.Label(step2_frame, text="참조 데이터 편집:", 
-                 font=('Arial', 10, 'bold')).grid(row=2, column=0, sticky="w", pady=(10, 5))
+                 style='Hdr.TLabel').grid(row=2, column=0, sticky="w", pady=(10, 5))
         
         # 테이블 프레임
         table_frame = ttk.Frame(step2_frame)
@@ -198,15 +389,12 @@ class HWPXAutomationGUI:
         step2_frame.columnconfigure(0, weight=1)
         step2_frame.rowconfigure(3, weight=1)
     
-    def create_step3_tab(self):
+    def create_step3_tab(self, step3_frame):
         """3단계: HWPX 텍스트 치환"""
         
-        step3_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(step3_frame, text="3단계: 텍스트 치환")
-        
         # HWPX 템플릿 파일 선택
         ttk.Label(step3_frame, text="HWPX 템플릿 파일:", 
-                 font=('Arial', 10, 'bold')).grid(row=0, column=0, sticky="w", pady=(0, 5))
+                 style='Hdr.TLabel').grid(row=0, column=0, sticky="w", pady=(0, 5))
         
         hwpx_frame = ttk.Frame(step3_frame)
         hwpx_frame.grid(row=1, column=0, sticky="ew", pady=(0, 10))
@@ -235,7 +423,7 @@ class HWPXAutomationGUI:
         
         # 출력 파일명
         ttk.Label(step3_frame, text="출력 파일명:", 
-                 font=('Arial', 10, 'bold')).grid(row=3, column=0, sticky="w", pady=(10, 5))
+                 style='Hdr.TLabel').grid(row=3, column=0, sticky="w", pady=(10, 5))
         
         output_frame = ttk.Frame(step3_frame)
         output_frame.grid(row=4, column=0, sticky="ew", pady=(0, 10))
@@ -254,15 +442,15 @@ class HWPXAutomationGUI:
         
         step3_frame.columnconfigure(0, weight=1)
     
-    def create_step4_tab(self):
+    def create_step4_tab(self, step4_frame):
         """4단계: 이미지 삽입"""
         
-        step4_frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(step4_frame, text="4단계: 이미지 삽입")
+        # 숫자 입력칸은 입력 단계에서 숫자만 허용
+        digits_only = (self.root.register(self._is_digits), '%P')
         
         # 이미지 파일 선택
         ttk.Label(step4_frame, text="삽입할 이미지 파일:", 
-                 font=('Arial', 10, 'bold')).grid(row=0, column=0, sticky="w", pady=(0, 5))
+                 style='Hdr.TLabel').grid(row=0, column=0, sticky="w", pady=(0, 5))
         
         img_frame = ttk.Frame(step4_frame)
         img_frame.grid(row=1, column=0, sticky="ew", pady=(0, 10))
@@ -280,17 +468,20 @@ class HWPXAutomationGUI:
         
         ttk.Label(pos_frame, text="표 번호:").grid(row=0, column=0, sticky="w", padx=(0, 5))
         self.table_index_var = tk.StringVar(value="0")
-        ttk.Entry(pos_frame, textvariable=self.table_index_var, width=10).grid(
+        ttk.Spinbox(pos_frame, textvariable=self.table_index_var, width=10, from_=0, to=999,
+                   validate='key', validatecommand=digits_only).grid(
             row=0, column=1, padx=(0, 20))
         
         ttk.Label(pos_frame, text="행 번호:").grid(row=0, column=2, sticky="w", padx=(0, 5))
         self.row_index_var = tk.StringVar(value="0")
-        ttk.Entry(pos_frame, textvariable=self.row_index_var, width=10).grid(
+        ttk.Spinbox(pos_frame, textvariable=self.row_index_var, width=10, from_=0, to=999,
+                   validate='key', validatecommand=digits_only).grid(
             row=0, column=3, padx=(0, 20))
         
         ttk.Label(pos_frame, text="열 번호:").grid(row=0, column=4, sticky="w", padx=(0, 5))
         self.col_index_var = tk.StringVar(value="0")
-        ttk.Entry(pos_frame, textvariable=self.col_index_var, width=10).grid(
+        ttk.Spinbox(pos_frame, textvariable=self.col_index_var, width=10, from_=0, to=999,
+                   validate='key', validatecommand=digits_only).grid(
             row=0, column=5)
         
         # 표 구조 분석 버튼
@@ -304,12 +495,14 @@ class HWPXAutomationGUI:
         
         ttk.Label(img_opt_frame, text="너비(mm):").grid(row=0, column=0, sticky="w", padx=(0, 5))
         self.img_width_var = tk.StringVar(value="80")
-        ttk.Entry(img_opt_frame, textvariable=self.img_width_var, width=10).grid(
+        ttk.Spinbox(img_opt_frame, textvariable=self.img_width_var, width=10, from_=1, to=9999,
+                   validate='key', validatecommand=digits_only).grid(
             row=0, column=1, padx=(0, 20))
         
         ttk.Label(img_opt_frame, text="높이(mm):").grid(row=0, column=2, sticky="w", padx=(0, 5))
         self.img_height_var = tk.StringVar(value="60")
-        ttk.Entry(img_opt_frame, textvariable=self.img_height_var, width=10).grid(
+        ttk.Spinbox(img_opt_frame, textvariable=self.img_height_var, width=10, from_=1, to=9999,
+                   validate='key', validatecommand=digits_only).grid(
             row=0, column=3, padx=(0, 20))
         
         self.maintain_ratio_var = tk.BooleanVar(value=True)
@@ -325,7 +518,7 @@ class HWPXAutomationGUI:
         
         # 최종 출력 파일명
         ttk.Label(step4_frame, text="최종 출력 파일명:", 
-                 font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky="w", pady=(10, 5))
+                 style='Hdr.TLabel').grid(row=4, column=0, sticky="w", pady=(10, 5))
         
         final_frame = ttk.Frame(step4_frame)
         final_frame.grid(row=5, column=0, sticky="ew", pady=(0, 10))
@@ -344,11 +537,27 @@ class HWPXAutomationGUI:
         
         step4_frame.columnconfigure(0, weight=1)
     
+    def _build_tab(self, tab_name):
+        """아직 만들지 않은 탭이면 내용 생성"""
+        pending = self._pending_tabs.pop(tab_name, None)
+        if pending:
+            builder, frame = pending
+            builder(frame)
+    
+    def _build_pending_tabs(self):
+        """남은 탭을 모두 생성 (다른 탭의 위젯을 사용하는 작업 전에 호출)"""
+        for tab_name in list(self._pending_tabs):
+            self._build_tab(tab_name)
+    
+    def _on_tab_changed(self, event):
+        """탭을 처음 선택할 때 내용 생성"""
+        self._build_tab(self.notebook.select())
+    
     def create_log_panel(self, parent):
         """로그 패널 생성"""
         
         ttk.Label(parent, text="처리 로그", 
-                 font=('Arial', 12, 'bold')).grid(row=0, column=0, sticky="w", pady=(0, 10))
+                 style='Panel.TLabel').grid(row=0, column=0, sticky="w", pady=(0, 10))
         
         self.log_text = scrolledtext.ScrolledText(parent, height=20, width=50)
         self.log_text.grid(row=1, column=0, sticky="nsew")
@@ -370,10 +579,20 @@ class HWPXAutomationGUI:
                   command=self.root.quit).grid(row=0, column=2, padx=10)
     
     def log(self, message):
-        """로그 메시지 추가"""
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.root.update()
+        """로그 메시지 추가 (스레드 안전, 메인 루프에서 일괄 출력)"""
+        self._log_queue.append(message)
+    
+    def _drain_log(self):
+        """쌓인 로그 메시지를 한 번에 출력 (창이 최소화된 동안에는 모아 두기만 함)"""
+        if self._log_queue and self.root.state() != 'iconic':
+            queue = self._log_queue
+            messages = [queue.popleft() for _ in range(min(len(queue), LOG_DRAIN_BATCH))]
+            
+            self.log_text.insert(tk.END, "\n".join(messages) + "\n")
+            self.log_text.see(tk.END)
+            self.root.update_idletasks()
+        
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log)
     
     def clear_log(self):
         """로그 지우기"""
@@ -381,24 +600,17 @@ class HWPXAutomationGUI:
     
     def select_tax_invoice(self):
         """세금계산서 파일 선택"""
-        filetypes = [
-            ("모든 지원 형식", "*.pdf;*.png;*.jpg;*.jpeg;*.txt"),
-            ("PDF 파일", "*.pdf"),
-            ("이미지 파일", "*.png;*.jpg;*.jpeg"),
-            ("텍스트 파일", "*.txt"),
-            ("모든 파일", "*.*")
-        ]
-        
         filename = filedialog.askopenfilename(
             title="세금계산서 파일 선택",
-            filetypes=filetypes
+            filetypes=TAX_INVOICE_FILETYPES
         )
         
         if filename:
             self.tax_invoice_var.set(filename)
             self.files['tax_invoice'] = filename
             self.analyze_btn.config(state='normal')
-            self.log(f"세금계산서 파일 선택: {os.path.basename(filename)}")
+            self._prefetch_hash(filename)
+            self.log(f"세금계산서 파일 선택: {_basename(filename)}")
     
     def analyze_tax_invoice(self):
         """세금계산서 분석"""
@@ -407,81 +619,130 @@ class HWPXAutomationGUI:
             return
         
         self.log("세금계산서 분석 시작...")
+        self._build_pending_tabs()
+        page_workers = self._page_workers()
         
         def analyze_worker():
             try:
-                extractor = UniversalTaxInvoiceExtractor()
-                result = extractor.extract_from_file(self.files['tax_invoice'])
+                result = self._extract_invoice(page_workers)
                 
                 if result['success']:
-                    self.extracted_data = result
-                    
-                    # 결과 표시
-                    self.step1_result.delete(1.0, tk.END)
-                    
                     # 주요 정보 요약
-                    summary = "=== 추출된 정보 요약 ===\n\n"
+                    parts = ["=== 추출된 정보 요약 ===\n\n"]
                     
                     # 문서 정보
                     doc_info = result.get('document_info', {})
                     if doc_info:
-                        summary += "📄 문서 정보:\n"
-                        summary += f"  승인번호: {doc_info.get('approval_number', 'N/A')}\n"
-                        summary += f"  발행일자: {doc_info.get('issue_date', 'N/A')}\n\n"
+                        parts.append("📄 문서 정보:\n")
+                        parts.append(f"  승인번호: {doc_info.get('approval_number', 'N/A')}\n")
+                        parts.append(f"  발행일자: {doc_info.get('issue_date', 'N/A')}\n\n")
                     
                     # 공급자 정보
                     supplier = result.get('supplier', {})
                     if supplier:
-                        summary += "🏢 공급자:\n"
-                        summary += f"  회사명: {supplier.get('company_name', 'N/A')}\n"
-                        summary += f"  등록번호: {supplier.get('registration_number', 'N/A')}\n\n"
+                        parts.append("🏢 공급자:\n")
+                        parts.append(f"  회사명: {supplier.get('company_name', 'N/A')}\n")
+                        parts.append(f"  등록번호: {supplier.get('registration_number', 'N/A')}\n\n")
                     
                     # 공급받는자 정보
                     buyer = result.get('buyer', {})
                     if buyer:
-                        summary += "🏛️ 공급받는자:\n"
-                        summary += f"  회사명: {buyer.get('company_name', 'N/A')}\n"
-                        summary += f"  등록번호: {buyer.get('registration_number', 'N/A')}\n\n"
+                        parts.append("🏛️ 공급받는자:\n")
+                        parts.append(f"  회사명: {buyer.get('company_name', 'N/A')}\n")
+                        parts.append(f"  등록번호: {buyer.get('registration_number', 'N/A')}\n\n")
                     
                     # 금액 정보
                     amounts = result.get('amounts', {})
                     if amounts:
-                        summary += "💰 금액 정보:\n"
+                        parts.append("💰 금액 정보:\n")
                         if amounts.get('total_amount'):
-                            summary += f"  총액: {amounts['total_amount']:,}원\n"
+                            parts.append(f"  총액: {amounts['total_amount']:,}원\n")
                         if amounts.get('supply_amount'):
-                            summary += f"  공급가액: {amounts['supply_amount']:,}원\n"
+                            parts.append(f"  공급가액: {amounts['supply_amount']:,}원\n")
                         if amounts.get('tax_amount'):
-                            summary += f"  세액: {amounts['tax_amount']:,}원\n\n"
+                            parts.append(f"  세액: {amounts['tax_amount']:,}원\n\n")
                     
                     # 품목 정보
                     items = result.get('items', [])
                     if items:
-                        summary += f"📦 품목 정보 ({len(items)}개):\n"
-                        for i, item in enumerate(items[:3], 1):
-                            summary += f"  {i}. {item.get('item_name', 'N/A')}\n"
+                        parts.append(f"📦 품목 정보 ({len(items)}개):\n")
+                        parts.extend(f"  {i}. {item.get('item_name', 'N/A')}\n"
+                                     for i, item in enumerate(items[:3], 1))
                         if len(items) > 3:
-                            summary += f"  ... 및 {len(items) - 3}개 더\n"
+                            parts.append(f"  ... 및 {len(items) - 3}개 더\n")
                     
-                    self.step1_result.insert(tk.END, summary)
+                    summary = "".join(parts)
                     
-                    # 다음 단계 활성화
-                    self.auto_generate_btn.config(state='normal')
+                    # 위젯 갱신은 메인 스레드에서 수행
+                    self.root.after(0, self._apply_step1_result, result, summary)
                     
                     self.log("세금계산서 분석 완료!")
                     
                 else:
-                    self.log(f"세금계산서 분석 실패: {result.get('error', '알 수 없는 오류')}")
-                    messagebox.showerror("오류", f"분석 실패: {result.get('error', '알 수 없는 오류')}")
+                    error = result.get('error', '알 수 없는 오류')
+                    self.log(f"세금계산서 분석 실패: {error}")
+                    self.root.after(0, messagebox.showerror, "오류", f"분석 실패: {error}")
                     
             except Exception as e:
                 self.log(f"분석 중 오류 발생: {str(e)}")
-                messagebox.showerror("오류", f"분석 중 오류 발생: {str(e)}")
+                self.root.after(0, messagebox.showerror, "오류", f"분석 중 오류 발생: {str(e)}")
         
-        # 별도 스레드에서 실행
-        thread = threading.Thread(target=analyze_worker)
-        thread.daemon = True
-        thread.start()
+        # 작업 스레드 풀에서 실행
+        self._submit_task('analyze_invoice', analyze_worker)
+    
+    def _submit_task(self, stage, worker):
+        """버튼 작업을 스레드 풀에 제출 (같은 작업이 실행 중이면 건너뜀)"""
+        running = self._inflight.get(stage)
+        if running is not None and not running.done():
+            self.log(f"⏳ 이전 작업이 아직 실행 중입니다: {stage}")
+            return None
+        
+        def finished(future):
+            if self._inflight.get(stage) is future:
+                del self._inflight[stage]
+        
+        future = self._cpu_pool.submit(worker)
+        self._inflight[stage] = future
+        future.add_done_callback(finished)
+        return future
+    
+    @staticmethod
+    def _is_digits(value):
+        """숫자 입력칸 검증 (빈 값은 입력 중으로 허용)"""
+        return value == '' or value.isdecimal()
+    
+    def _page_workers(self):
+        """페이지 추출 프로세스 수 (잘못된 입력은 1)"""
+        try:
+            return max(1, int(self.page_workers_var.get()))
+        except (tk.TclError, ValueError):
+            return 1
+    
+    def _get_extractor(self):
+        """세금계산서 추출기 (한 번 만들어 재사용)"""
+        if self._extractor is None:
+            from universal_tax_invoice_extractor import UniversalTaxInvoiceExtractor
+            self._extractor = UniversalTaxInvoiceExtractor()
+        return self._extractor
+    
+    def _apply_step1_result(self, result, summary):
+        """세금계산서 분석 결과를 화면에 반영 (메인 스레드 전용)"""
+        self.extracted_data = self._extracted_view(result)
+        
+        # 결과 표시
+        self.step1_result.delete(1.0, tk.END)
+        self.step1_result.insert(tk.END, summary)
+        
+        # 다음 단계 활성화
+        self.auto_generate_btn.config(state='normal')
+    
+    @staticmethod
+    def _extracted_view(result):
+        """분석 결과에서 이후 단계에 필요한 항목만 남긴 사본"""
+        data = {key: result[key] for key in EXTRACTED_KEYS if key in result}
+        if data.get('items'):
+            data['items'] = data['items'][:EXTRACTED_ITEMS_MAX]
+        return data
     
     def auto_generate_terms(self):
         """자동 참조 데이터 생성"""
@@ -492,66 +753,21 @@ class HWPXAutomationGUI:
         self.log("참조 데이터 자동 생성 중...")
         
         try:
-            # 추출된 데이터를 기반으로 참조 데이터 생성
-            terms = {}
-            
-            # 회사명 치환
-            supplier = self.extracted_data.get('supplier', {})
-            buyer = self.extracted_data.get('buyer', {})
-            
-            if supplier.get('company_name'):
-                terms["[공급자명]"] = supplier['company_name']
-            if supplier.get('registration_number'):
-                terms["[공급자등록번호]"] = supplier['registration_number']
-            
-            if buyer.get('company_name'):
-                terms["[공급받는자명]"] = buyer['company_name']
-            if buyer.get('registration_number'):
-                terms["[공급받는자등록번호]"] = buyer['registration_number']
-            
-            # 문서 정보
-            doc_info = self.extracted_data.get('document_info', {})
-            if doc_info.get('approval_number'):
-                terms["[승인번호]"] = doc_info['approval_number']
-            if doc_info.get('issue_date'):
-                terms["[발행일자]"] = doc_info['issue_date']
-            
-            # 금액 정보
-            amounts = self.extracted_data.get('amounts', {})
-            if amounts.get('total_amount'):
-                terms["[총금액]"] = f"{amounts['total_amount']:,}원"
-            if amounts.get('supply_amount'):
-                terms["[공급가액]"] = f"{amounts['supply_amount']:,}원"
-            if amounts.get('tax_amount'):
-                terms["[세액]"] = f"{amounts['tax_amount']:,}원"
-            
-            # 품목 정보 (첫 번째 품목)
-            items = self.extracted_data.get('items', [])
-            if items:
-                first_item = items[0]
-                if first_item.get('item_name'):
-                    terms["[주요품목]"] = first_item['item_name']
-                if first_item.get('quantity'):
-                    terms["[수량]"] = str(first_item['quantity'])
-            
-            # 연락처 정보
-            contacts = self.extracted_data.get('contacts', {})
-            if contacts.get('phones'):
-                terms["[연락처]"] = contacts['phones'][0]
-            if contacts.get('emails'):
-                terms["[이메일]"] = contacts['emails'][0]
-            
-            # 기본 템플릿 용어 추가
-            default_terms = {
-                "[오늘날짜]": "2025-07-07",
-                "[작성자]": "담당자",
-                "[부서]": "영업부",
-                "[제목]": "세금계산서 관련 문서"
-            }
-            terms.update(default_terms)
+            # 같은 추출 데이터면 이전에 만든 참조 데이터 재사용
+            key = self._extracted_key()
+            cached = self._ref_cache.get(key)
+            if cached is not None:
+                self._ref_cache.move_to_end(key)
+                terms = dict(cached)
+            else:
+                terms = self._terms_from_extracted(self.extracted_data)
+                self._ref_cache[key] = dict(terms)
+                if len(self._ref_cache) > REF_CACHE_MAX:
+                    self._ref_cache.popitem(last=False)
             
             # 참조 데이터 저장
             self.reference_terms = terms
+            self._stage_inputs['terms'] = key
             
             # 테이블에 표시
             self.update_terms_table()
@@ -563,49 +779,200 @@ class HWPXAutomationGUI:
             self.log(f"참조 데이터 생성 중 오류: {str(e)}")
             messagebox.showerror("오류", f"참조 데이터 생성 실패: {str(e)}")
     
+    def _extracted_key(self):
+        """추출 데이터 해시 (참조 데이터 캐시 키)"""
+        return self._digest(self.extracted_data)
+    
+    @staticmethod
+    def _digest(value):
+        """JSON으로 직렬화한 값의 짧은 해시"""
+        payload = json.dumps(value, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _terms_from_extracted(data):
+        """추출된 데이터로 참조 데이터 생성"""
+        terms = {}
+        
+        # 회사명 치환
+        supplier = data.get('supplier') or {}
+        buyer = data.get('buyer') or {}
+        
+        if name := supplier.get('company_name'):
+            terms["[공급자명]"] = name
+        if reg := supplier.get('registration_number'):
+            terms["[공급자등록번호]"] = reg
+        
+        if name := buyer.get('company_name'):
+            terms["[공급받는자명]"] = name
+        if reg := buyer.get('registration_number'):
+            terms["[공급받는자등록번호]"] = reg
+        
+        # 문서 정보
+        doc_info = data.get('document_info') or {}
+        if approval := doc_info.get('approval_number'):
+            terms["[승인번호]"] = approval
+        if issue_date := doc_info.get('issue_date'):
+            terms["[발행일자]"] = issue_date
+        
+        # 금액 정보
+        amounts = data.get('amounts') or {}
+        if amount := amounts.get('total_amount'):
+            terms["[총금액]"] = f"{amount:,}원"
+        if amount := amounts.get('supply_amount'):
+            terms["[공급가액]"] = f"{amount:,}원"
+        if amount := amounts.get('tax_amount'):
+            terms["[세액]"] = f"{amount:,}원"
+        
+        # 품목 정보 (첫 번째 품목)
+        if items := data.get('items'):
+            first_item = items[0]
+            if item_name := first_item.get('item_name'):
+                terms["[주요품목]"] = item_name
+            if quantity := first_item.get('quantity'):
+                terms["[수량]"] = str(quantity)
+        
+        # 연락처 정보
+        contacts = data.get('contacts') or {}
+        if phones := contacts.get('phones'):
+            terms["[연락처]"] = phones[0]
+        if emails := contacts.get('emails'):
+            terms["[이메일]"] = emails[0]
+        
+        # 기본 템플릿 용어 추가
+        default_terms = {
+            "[오늘날짜]": "2025-07-07",
+            "[작성자]": "담당자",
+            "[부서]": "영업부",
+            "[제목]": "세금계산서 관련 문서"
+        }
+        terms.update(default_terms)
+        return terms
+    
     def load_reference_file(self):
         """기존 참조 파일 불러오기"""
-        filetypes = [
-            ("JSON 파일", "*.json"),
-            ("CSV 파일", "*.csv"),
-            ("모든 파일", "*.*")
-        ]
-        
         filename = filedialog.askopenfilename(
             title="참조 데이터 파일 선택",
-            filetypes=filetypes
+            filetypes=REFERENCE_FILETYPES
         )
         
         if filename:
+            # 파일 파싱은 I/O 스레드에서 수행
+            future = self._io_pool.submit(self._read_reference_file, filename)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._apply_reference_terms, filename, f))
+    
+    @staticmethod
+    def _read_reference_file(filename):
+        """참조 데이터 파일(JSON/CSV) 읽기"""
+        if filename.endswith('.json'):
+            data = Path(filename).read_bytes()
+            return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+        
+        if filename.endswith('.csv'):
+            # 인코딩/구분자는 앞부분만 보고 한 번에 정한 뒤 파일은 한 번만 읽음
+            encoding, delimiter = HWPXAutomationGUI._detect_csv_format(filename)
+            
+            if HAS_PYARROW and os.path.getsize(filename) > PYARROW_CSV_THRESHOLD:
+                terms = HWPXAutomationGUI._read_reference_csv_arrow(filename, encoding, delimiter)
+                if terms is not None:
+                    return terms
+            
+            with open(filename, 'r', encoding=encoding, newline='',
+                      buffering=REFERENCE_READ_BUFFER) as f:
+                reader = csv.reader(f, delimiter=delimiter)
+                next(reader, None)  # 헤더 건너뛰기
+                return dict(row[:2] for row in reader if len(row) >= 2)
+        
+        # 지원하지 않는 형식은 기존 데이터 유지
+        return None
+    
+    @staticmethod
+    def _detect_csv_format(filename):
+        """참조 CSV의 인코딩과 구분자 (UTF-8이 아니면 chardet 또는 CP949, 구분자를 모르면 쉼표)"""
+        with open(filename, 'rb') as f:
+            head = f.read(CSV_DETECT_BYTES)
+        
+        if head.startswith(codecs.BOM_UTF8):
+            encoding = 'utf-8-sig'
+        else:
             try:
-                if filename.endswith('.json'):
-                    with open(filename, 'r', encoding='utf-8') as f:
-                        self.reference_terms = json.load(f)
-                elif filename.endswith('.csv'):
-                    import csv
-                    self.reference_terms = {}
-                    with open(filename, 'r', encoding='utf-8') as f:
-                        reader = csv.reader(f)
-                        next(reader, None)  # 헤더 건너뛰기
-                        for row in reader:
-                            if len(row) >= 2:
-                                self.reference_terms[row[0]] = row[1]
-                
-                self.update_terms_table()
-                self.log(f"참조 데이터 로드 완료: {os.path.basename(filename)}")
-                
-            except Exception as e:
-                messagebox.showerror("오류", f"파일 로드 실패: {str(e)}")
+                # 앞부분이 멀티바이트 문자 중간에서 잘려도 오류가 나지 않도록 증분 디코더 사용
+                codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+                encoding = 'utf-8'
+            except UnicodeDecodeError:
+                encoding = 'cp949'
+                if HAS_CHARDET:
+                    import chardet
+                    encoding = chardet.detect(head)['encoding'] or encoding
+        
+        # 두 컬럼짜리 용어 목록이므로 csv.Sniffer 대신 첫 줄에 가장 많이 나온 후보 구분자를 사용
+        first_line = head[:CSV_SNIFF_BYTES].decode(encoding, errors='replace').splitlines()[:1]
+        first_line = first_line[0] if first_line else ''
+        delimiter = max(CSV_DELIMITERS, key=first_line.count)
+        return encoding, delimiter if first_line.count(delimiter) else ','
+    
+    @staticmethod
+    def _read_reference_csv_arrow(filename, encoding='utf-8', delimiter=','):
+        """PyArrow로 큰 참조 CSV 읽기 (헤더 제외, 모든 값을 문자열로, 읽을 수 없으면 None)"""
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        
+        try:
+            table = pa_csv.read_csv(
+                filename,
+                read_options=pa_csv.ReadOptions(
+                    skip_rows=1, autogenerate_column_names=True,
+                    encoding='utf8' if encoding.startswith('utf-8') else encoding
+                ),
+                parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={'f0': pa.string(), 'f1': pa.string()},
+                    strings_can_be_null=False
+                )
+            )
+        except pa.ArrowInvalid:
+            # 열 개수가 일정하지 않은 CSV 등은 csv 모듈로 처리
+            return None
+        if table.num_columns < 2:
+            return {}
+        return dict(zip(table.column(0).to_pylist(), table.column(1).to_pylist()))
+    
+    def _apply_reference_terms(self, filename, future):
+        """읽어 온 참조 데이터를 화면에 반영 (메인 스레드 전용)"""
+        try:
+            terms = future.result()
+        except Exception as e:
+            messagebox.showerror("오류", f"파일 로드 실패: {str(e)}")
+            return
+        
+        if terms is not None:
+            self.reference_terms = terms
+            self._stage_inputs['terms'] = None  # 직접 불러온 데이터는 자동 재생성하지 않음
+        
+        self.update_terms_table()
+        self.log(f"참조 데이터 로드 완료: {_basename(filename)}")
     
     def update_terms_table(self):
         """참조 데이터 테이블 업데이트"""
-        # 기존 항목 모두 삭제
-        for item in self.terms_tree.get_children():
-            self.terms_tree.delete(item)
+        tree = self.terms_tree
         
-        # 새 항목 추가
-        for original, replacement in self.reference_terms.items():
-            self.terms_tree.insert('', 'end', values=(original, replacement))
+        # 갱신 중 레이아웃 재계산을 막기 위해 화면에서 잠시 분리
+        tree.grid_remove()
+        try:
+            # 기존 항목 모두 삭제 (한 번의 호출)
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+            
+            # 새 항목 추가
+            insert = tree.insert
+            for original, replacement in self.reference_terms.items():
+                insert('', 'end', values=(original, replacement))
+        finally:
+            tree.grid()
+        
+        self._warm_terms_matcher()
     
     def add_term(self):
         """새 참조 항목 추가"""
@@ -651,10 +1018,10 @@ class HWPXAutomationGUI:
         for item in selected:
             values = self.terms_tree.item(item, 'values')
             if values:
-                original = values[0]
-                if original in self.reference_terms:
-                    del self.reference_terms[original]
-                self.terms_tree.delete(item)
+                self.reference_terms.pop(values[0], None)
+        
+        # 트리 항목은 한 번에 삭제
+        self.terms_tree.delete(*selected)
     
     def save_terms(self):
         """참조 데이터 저장"""
@@ -665,23 +1032,28 @@ class HWPXAutomationGUI:
         filename = filedialog.asksaveasfilename(
             title="참조 데이터 저장",
             defaultextension=".json",
-            filetypes=[("JSON 파일", "*.json"), ("CSV 파일", "*.csv")]
+            filetypes=REFERENCE_SAVE_FILETYPES
         )
         
         if filename:
             try:
                 if filename.endswith('.json'):
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(self.reference_terms, f, ensure_ascii=False, indent=2)
+                    if HAS_ORJSON:
+                        Path(filename).write_bytes(orjson.dumps(
+                            self.reference_terms,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                        ))
+                    else:
+                        with open(filename, 'w', encoding='utf-8') as f:
+                            json.dump(self.reference_terms, f, ensure_ascii=False, indent=2)
                 elif filename.endswith('.csv'):
-                    import csv
                     with open(filename, 'w', encoding='utf-8', newline='') as f:
                         writer = csv.writer(f)
                         writer.writerow(['원본텍스트', '치환텍스트'])
                         for original, replacement in self.reference_terms.items():
                             writer.writerow([original, replacement])
                 
-                self.log(f"참조 데이터 저장 완료: {os.path.basename(filename)}")
+                self.log(f"참조 데이터 저장 완료: {_basename(filename)}")
                 messagebox.showinfo("완료", "참조 데이터가 저장되었습니다.")
                 
             except Exception as e:
@@ -691,35 +1063,270 @@ class HWPXAutomationGUI:
         """HWPX 템플릿 파일 선택"""
         filename = filedialog.askopenfilename(
             title="HWPX 템플릿 파일 선택",
-            filetypes=[("HWPX 파일", "*.hwpx"), ("모든 파일", "*.*")]
+            filetypes=HWPX_FILETYPES
         )
         
         if filename:
+            self._build_pending_tabs()
             self.hwpx_template_var.set(filename)
             self.files['hwpx_template'] = filename
             self.process_hwpx_btn.config(state='normal')
             self.analyze_table_btn.config(state='normal')
+            self._prefetch_hash(filename)
             
-            # 기본 출력 파일명 설정
-            base_name = Path(filename).stem
-            output_name = f"{base_name}_processed.hwpx"
-            self.output_hwpx_var.set(output_name)
+            # 기본 출력 파일명 설정 (실행할 때마다 다시 만들지 않도록 미리 계산)
+            base_name = _stem(filename)
+            self._default_output_hwpx = f"{base_name}_processed.hwpx"
+            self._default_final_output = f"{base_name}_processed_final.hwpx"
+            self.output_hwpx_var.set(self._default_output_hwpx)
             
-            self.log(f"HWPX 템플릿 선택: {os.path.basename(filename)}")
+            self.log(f"HWPX 템플릿 선택: {_basename(filename)}")
+    
+    def _final_output_name(self, output_file):
+        """치환 결과 파일에 맞춘 기본 최종 출력 파일명"""
+        if output_file == self._default_output_hwpx:
+            return self._default_final_output
+        return f"{_stem(output_file)}_final.hwpx"
     
     def select_output_location(self):
         """출력 파일 위치 선택"""
         filename = filedialog.asksaveasfilename(
             title="출력 파일 저장 위치",
             defaultextension=".hwpx",
-            filetypes=[("HWPX 파일", "*.hwpx"), ("모든 파일", "*.*")]
+            filetypes=HWPX_FILETYPES
         )
         
         if filename:
             self.output_hwpx_var.set(filename)
     
+    def _replace_options(self):
+        """3단계 화면의 치환 옵션"""
+        return {
+            'case_sensitive': self.case_sensitive_var.get(),
+            'whole_word_only': self.whole_word_var.get(),
+            'backup_original': self.backup_var.get(),
+            'use_advanced_regex': True
+        }
+    
+    def _snapshot_options(self):
+        """실행 시점의 화면 값을 한 번에 읽어 둠 (작업 스레드에서는 Tk 변수를 읽지 않음, 숫자가 아니면 ValueError)"""
+        return {
+            'page_workers': self._page_workers(),
+            'replace': self._replace_options(),
+            'output_hwpx': self.output_hwpx_var.get(),
+            'final_output': self.final_output_var.get(),
+            'position': (
+                int(self.table_index_var.get()),
+                int(self.row_index_var.get()),
+                int(self.col_index_var.get())
+            ),
+            'image': {
+                'width': int(self.img_width_var.get()),
+                'height': int(self.img_height_var.get()),
+                'maintain_ratio': self.maintain_ratio_var.get(),
+                'alignment': self.alignment_var.get()
+            }
+        }
+    
+    def _get_processor(self):
+        """HWPX 치환기 (한 번 만들어 재사용)"""
+        with self._processor_lock:
+            if self._processor is None:
+                from enhanced_hwpx_processor import EnhancedHWPXProcessor
+                self._processor = EnhancedHWPXProcessor(log_level="WARNING")
+            return self._processor
+    
+    def _get_inserter(self):
+        """HWPX 이미지 삽입기 (한 번 만들어 재사용)"""
+        with self._inserter_lock:
+            if self._inserter is None:
+                from hwpx_image_inserter import HWPXImageInserter
+                self._inserter = HWPXImageInserter()
+            return self._inserter
+    
+    def _get_compiled_terms(self, terms, options):
+        """치환기와 컴파일된 참조 데이터 반환 (참조 데이터/옵션이 바뀔 때만 다시 컴파일)
+        
+        terms/options는 메인 스레드에서 떠 둔 스냅샷 (작업 스레드에서 Tk 변수나
+        편집 중인 reference_terms를 직접 읽지 않음)
+        """
+        from enhanced_hwpx_processor import HAS_AHOCORASICK
+        
+        with self._processor_lock:
+            processor = self._get_processor()
+            
+            key = (tuple(terms.items()), tuple(sorted(options.items())))
+            cached = self._compiled_terms
+            if cached is not None and cached[0] == key:
+                return processor, cached[1]
+            
+            compiled = processor._compile_reference(
+                dict(terms), processor._resolve_options(options)
+            )
+            # Aho-Corasick 오토마톤도 미리 만들어 두어 치환 시 문서만 한 번 훑도록 함
+            if HAS_AHOCORASICK:
+                literal_terms = [t for t in compiled['literal_terms'] if t.strip()]
+                if literal_terms:
+                    processor._get_automaton(literal_terms, options['case_sensitive'])
+            
+            self._compiled_terms = (key, compiled)
+            return processor, compiled
+    
+    def _warm_terms_matcher(self):
+        """참조 데이터가 바뀌면 검색 패턴을 백그라운드에서 미리 컴파일"""
+        if threading.current_thread() is not threading.main_thread():
+            # Tk 변수와 참조 데이터 스냅샷은 메인 스레드에서 뜸
+            self.root.after(0, self._warm_terms_matcher)
+            return
+        if not MODULES_AVAILABLE or not self.reference_terms:
+            return
+        self._build_pending_tabs()
+        future = self._io_pool.submit(
+            self._get_compiled_terms, dict(self.reference_terms), self._replace_options()
+        )
+        future.add_done_callback(self._log_warm_error)
+    
+    def _log_warm_error(self, future):
+        """미리 컴파일 중 오류는 버려지지 않도록 로그로 남김 (치환 시 다시 컴파일)"""
+        error = future.exception()
+        if error is not None:
+            self.log(f"⚠️ 참조 데이터 미리 컴파일 실패: {error}")
+    
+    def _hash_file(self, path):
+        """파일 내용의 SHA-256 (큰 파일도 1MiB씩 나눠 읽고, 파일이 바뀌지 않았으면 이전 값 재사용)"""
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        digest = self._file_hash_cache.get(key)
+        if digest is not None:
+            return digest
+        
+        hasher = hashlib.sha256()
+        with open(path, 'rb', buffering=0) as f:
+            for chunk in iter(lambda: f.read(FINGERPRINT_CHUNK), b''):
+                hasher.update(chunk)
+        digest = self._file_hash_cache[key] = hasher.hexdigest()
+        return digest
+    
+    def _prefetch_hash(self, path):
+        """선택한 파일의 해시를 미리 계산 (실행 시점에는 캐시에서 바로 사용)"""
+        self._io_pool.submit(self._hash_file, path)
+    
+    def _stage_key(self, stage, input_files, extra):
+        """단계 이름 + 입력 파일(경로, 내용) + 옵션으로 캐시 키 생성"""
+        hasher = hashlib.sha256(stage.encode('utf-8'))
+        for path in input_files:
+            hasher.update(os.path.abspath(path).encode('utf-8'))
+            hasher.update(self._hash_file(path).encode('ascii'))
+        hasher.update(json.dumps(extra, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+        return hasher.hexdigest()
+    
+    @staticmethod
+    def _slim_result(result):
+        """캐시에 남길 결과 (본문 텍스트와 치환 위치 정보 제외)"""
+        slim = {key: value for key, value in result.items() if key != 'modified_text'}
+        if isinstance(slim.get('replacements'), list):
+            slim['replacements'] = [
+                {k: v for k, v in item.items() if k != 'positions'} if isinstance(item, dict) else item
+                for item in slim['replacements']
+            ]
+        return slim
+    
+    def _run_stage(self, stage, input_files, extra, run, output_file=None):
+        """입력이 같으면 이전 결과(와 출력 파일)를 재사용하고, 아니면 run()을 실행해 캐시에 저장"""
+        try:
+            key = self._stage_key(stage, input_files, extra)
+        except OSError:
+            # 입력 파일을 읽을 수 없으면 캐시 없이 실행 (오류는 run()의 결과로 보고)
+            return run()
+        
+        with self._stage_lock:
+            entry = self._stage_cache.get(key)
+        if entry is not None:
+            if entry['output'] is not None and output_file:
+                Path(output_file).write_bytes(entry['output'])
+            self.log(f"♻️ 캐시 사용: {stage}")
+            return entry['result']
+        
+        result = run()
+        if not result.get('success'):
+            return result
+        
+        # 출력 파일은 내용을 메모리에 남겨 두었다가 다음에 그대로 씀
+        cached_output = None
+        if output_file and os.path.isfile(output_file):
+            cached_output = Path(output_file).read_bytes()
+        
+        with self._stage_lock:
+            self._stage_cache.pop(key, None)
+            self._stage_cache[key] = {'result': self._slim_result(result), 'output': cached_output}
+            
+            # 오래된 항목부터 정리
+            while len(self._stage_cache) > STAGE_CACHE_MAX:
+                del self._stage_cache[next(iter(self._stage_cache))]
+        
+        return result
+    
+    def _extract_invoice(self, page_workers):
+        """세금계산서 분석 (캐시 사용)"""
+        tax_invoice = self.files['tax_invoice']
+        result = self._run_stage(
+            'extract', [tax_invoice], {},
+            lambda: self._get_extractor().extract_from_file(tax_invoice, page_workers=page_workers)
+        )
+        if result['success']:
+            self._stage_inputs['extract'] = self._hash_file(tax_invoice)
+        return result
+    
+    def _stage_unchanged(self, stage, key, output_file=None):
+        """이 단계의 현재 결과가 같은 입력으로 만들어졌는지 (출력 파일이 있으면 존재 여부도 확인)"""
+        if self._stage_inputs[stage] != key:
+            return False
+        return output_file is None or os.path.exists(output_file)
+    
+    def _replace_text(self, output_file, options):
+        """HWPX 텍스트 치환 (캐시 사용)"""
+        hwpx_template = self.files['hwpx_template']
+        self._stage_inputs['replace'] = None  # 출력 파일을 다시 쓰므로 이전 기록 무효화
+        reference_terms = dict(self.reference_terms)
+        
+        def run():
+            # 치환 단계와 전체 프로세스가 동시에 실행되어도 치환기 상태가 섞이지 않도록 잠금
+            with self._processor_lock:
+                processor, compiled = self._get_compiled_terms(reference_terms, options)
+                return processor.search_and_replace_text(
+                    hwpx_file=hwpx_template,
+                    reference_data=reference_terms,
+                    output_file=output_file,
+                    replacement_options=options,
+                    compiled_reference=compiled
+                )
+        
+        extra = {'terms': reference_terms, 'options': options, 'output_suffix': Path(output_file).suffix}
+        return self._run_stage('replace', [hwpx_template], extra, run, output_file)
+    
+    def _insert_image_file(self, final_output, table_index, row_index, col_index, image_options):
+        """표 셀에 이미지 삽입 (캐시 사용)"""
+        hwpx_file = self.files['output_hwpx']
+        self._stage_inputs['image'] = None  # 출력 파일을 다시 쓰므로 이전 기록 무효화
+        image_file = self.files['image_file']
+        
+        def run():
+            return self._get_inserter().insert_image_to_table(
+                hwpx_file=hwpx_file,
+                image_file=image_file,
+                output_file=final_output,
+                table_index=table_index,
+                row_index=row_index,
+                col_index=col_index,
+                image_options=image_options
+            )
+        
+        extra = {'position': [table_index, row_index, col_index], 'options': image_options}
+        return self._run_stage('insert_image', [hwpx_file, image_file], extra, run, final_output)
+    
     def process_hwpx_text(self):
         """HWPX 텍스트 치환 실행"""
+        self._build_pending_tabs()
         if not self.files['hwpx_template']:
             messagebox.showerror("오류", "HWPX 템플릿 파일을 선택해주세요.")
             return
@@ -735,46 +1342,31 @@ class HWPXAutomationGUI:
         
         self.log("HWPX 텍스트 치환 시작...")
         
+        # 치환 옵션
+        options = self._replace_options()
+        
         def process_worker():
             try:
-                processor = EnhancedHWPXProcessor(log_level="WARNING")
-                
-                # 치환 옵션
-                options = {
-                    'case_sensitive': self.case_sensitive_var.get(),
-                    'whole_word_only': self.whole_word_var.get(),
-                    'backup_original': self.backup_var.get(),
-                    'use_advanced_regex': True
-                }
-                
-                result = processor.search_and_replace_text(
-                    hwpx_file=self.files['hwpx_template'],
-                    reference_data=self.reference_terms,
-                    output_file=output_file,
-                    replacement_options=options
-                )
+                result = self._replace_text(output_file, options)
                 
                 if result['success']:
                     self.files['output_hwpx'] = output_file
                     self.insert_image_btn.config(state='normal')
                     
                     # 기본 최종 출력 파일명 설정
-                    base_name = Path(output_file).stem
-                    final_name = f"{base_name}_final.hwpx"
-                    self.final_output_var.set(final_name)
+                    self.root.after(0, self.final_output_var.set, self._final_output_name(output_file))
                     
                     self.log(f"텍스트 치환 완료! {result['total_replacements']}개 항목 치환")
                     self.log(f"출력 파일: {output_file}")
                     
                     # 치환 내역 표시
                     if result.get('replacements'):
-                        self.log("주요 치환 내역:")
-                        for replacement in result['replacements'][:5]:
-                            if isinstance(replacement, dict):
-                                search = replacement['search_term']
-                                replace = replacement['replacement_term']
-                                count = replacement['count']
-                                self.log(f"  '{search}' → '{replace}' ({count}회)")
+                        lines = ["주요 치환 내역:"]
+                        lines.extend(
+                            f"  '{r['search_term']}' → '{r['replacement_term']}' ({r['count']}회)"
+                            for r in result['replacements'][:5] if isinstance(r, dict)
+                        )
+                        self.log("\n".join(lines))
                     
                 else:
                     self.log(f"텍스트 치환 실패: {result.get('error', '알 수 없는 오류')}")
@@ -784,29 +1376,21 @@ class HWPXAutomationGUI:
                 self.log(f"치환 중 오류 발생: {str(e)}")
                 messagebox.showerror("오류", f"치환 중 오류 발생: {str(e)}")
         
-        # 별도 스레드에서 실행
-        thread = threading.Thread(target=process_worker)
-        thread.daemon = True
-        thread.start()
+        # 작업 스레드 풀에서 실행
+        self._submit_task('replace_text', process_worker)
     
     def select_image_file(self):
         """이미지 파일 선택"""
-        filetypes = [
-            ("이미지 파일", "*.png;*.jpg;*.jpeg;*.bmp;*.gif"),
-            ("PNG 파일", "*.png"),
-            ("JPG 파일", "*.jpg;*.jpeg"),
-            ("모든 파일", "*.*")
-        ]
-        
         filename = filedialog.askopenfilename(
             title="삽입할 이미지 선택",
-            filetypes=filetypes
+            filetypes=IMAGE_FILETYPES
         )
         
         if filename:
             self.image_file_var.set(filename)
             self.files['image_file'] = filename
-            self.log(f"이미지 파일 선택: {os.path.basename(filename)}")
+            self._prefetch_hash(filename)
+            self.log(f"이미지 파일 선택: {_basename(filename)}")
     
     def analyze_table_structure(self):
         """표 구조 분석"""
@@ -817,39 +1401,39 @@ class HWPXAutomationGUI:
         # 치환된 파일이 있으면 그것을, 없으면 템플릿 사용
         hwpx_file = self.files.get('output_hwpx') or self.files['hwpx_template']
         
-        self.log(f"표 구조 분석 중: {os.path.basename(hwpx_file)}")
+        self.log(f"표 구조 분석 중: {_basename(hwpx_file)}")
         
         def analyze_worker():
+            def run():
+                return {'success': True, 'tables': self._get_inserter().get_tables_in_hwpx(hwpx_file)}
+            
             try:
-                inserter = HWPXImageInserter()
+                tables = self._run_stage('table_structure', [hwpx_file], {}, run)['tables']
                 
-                # 임시로 로그를 캡처하기 위한 방법
-                import io
-                import contextlib
-                
-                log_capture = io.StringIO()
-                with contextlib.redirect_stdout(log_capture):
-                    inserter.list_tables_in_hwpx(hwpx_file)
-                
-                captured_output = log_capture.getvalue()
-                self.log("표 구조 분석 결과:")
-                self.log(captured_output)
+                # 표 구조를 한 번에 문자열로 만들어 출력
+                lines = ["표 구조 분석 결과:"]
+                for table in tables:
+                    lines.append(f"📊 표 {table['index']}: {table['rows']}행 x {table['cols']}열")
+                    lines.extend(
+                        f"   행 {row_idx}: {cell_count}열"
+                        for row_idx, cell_count in enumerate(table['row_cells'])
+                    )
+                lines.append(f"총 {len(tables)}개의 표가 발견되었습니다.")
+                self.log("\n".join(lines))
                 
             except Exception as e:
                 self.log(f"표 구조 분석 실패: {str(e)}")
                 messagebox.showerror("오류", f"표 구조 분석 실패: {str(e)}")
         
-        # 별도 스레드에서 실행
-        thread = threading.Thread(target=analyze_worker)
-        thread.daemon = True
-        thread.start()
+        # 작업 스레드 풀에서 실행
+        self._submit_task('analyze_table', analyze_worker)
     
     def select_final_output(self):
         """최종 출력 파일 위치 선택"""
         filename = filedialog.asksaveasfilename(
             title="최종 출력 파일 저장 위치",
             defaultextension=".hwpx",
-            filetypes=[("HWPX 파일", "*.hwpx"), ("모든 파일", "*.*")]
+            filetypes=HWPX_FILETYPES
         )
         
         if filename:
@@ -870,37 +1454,22 @@ class HWPXAutomationGUI:
             messagebox.showerror("오류", "최종 출력 파일명을 입력해주세요.")
             return
         
-        # 위치 정보 검증
+        # 위치/크기 정보 검증
         try:
-            table_index = int(self.table_index_var.get())
-            row_index = int(self.row_index_var.get())
-            col_index = int(self.col_index_var.get())
+            snapshot = self._snapshot_options()
         except ValueError:
-            messagebox.showerror("오류", "표, 행, 열 번호는 숫자여야 합니다.")
+            messagebox.showerror("오류", "표, 행, 열 번호와 이미지 크기는 숫자여야 합니다.")
             return
         
+        table_index, row_index, col_index = snapshot['position']
+        image_options = snapshot['image']
+        
         self.log("이미지 삽입 시작...")
         
         def insert_worker():
             try:
-                inserter = HWPXImageInserter()
-                
-                # 이미지 옵션
-                image_options = {
-                    'width': int(self.img_width_var.get()),
-                    'height': int(self.img_height_var.get()),
-                    'maintain_ratio': self.maintain_ratio_var.get(),
-                    'alignment': self.alignment_var.get()
-                }
-                
-                result = inserter.insert_image_to_table(
-                    hwpx_file=self.files['output_hwpx'],
-                    image_file=self.files['image_file'],
-                    output_file=final_output,
-                    table_index=table_index,
-                    row_index=row_index,
-                    col_index=col_index,
-                    image_options=image_options
+                result = self._insert_image_file(
+                    final_output, table_index, row_index, col_index, image_options
                 )
                 
                 if result['success']:
@@ -921,14 +1490,13 @@ class HWPXAutomationGUI:
                 self.log(f"이미지 삽입 중 오류 발생: {str(e)}")
                 messagebox.showerror("오류", f"이미지 삽입 중 오류 발생: {str(e)}")
         
-        # 별도 스레드에서 실행
-        thread = threading.Thread(target=insert_worker)
-        thread.daemon = True
-        thread.start()
+        # 작업 스레드 풀에서 실행
+        self._submit_task('insert_image', insert_worker)
     
     def run_full_process(self):
         """전체 프로세스 자동 실행"""
         self.log("=== 전체 프로세스 시작 ===")
+        self._build_pending_tabs()
         
         # 필수 파일 확인
         if not self.files.get('tax_invoice'):
@@ -939,96 +1507,103 @@ class HWPXAutomationGUI:
             messagebox.showerror("오류", "HWPX 템플릿 파일을 선택해주세요.")
             return
         
+        # 화면 값은 시작할 때 한 번만 읽음
+        try:
+            snapshot = self._snapshot_options()
+        except ValueError:
+            messagebox.showerror("오류", "표, 행, 열 번호와 이미지 크기는 숫자여야 합니다.")
+            return
+        
         def full_process_worker():
+            # 세금계산서 분석과 겹치도록 템플릿 해시 계산과 치환기 준비를 I/O 풀에서 먼저 시작
+            template_hash = self._io_pool.submit(self._hash_file, self.files['hwpx_template'])
+            processor_ready = self._io_pool.submit(self._get_processor)
+            
             try:
                 # 1단계: 세금계산서 분석
                 self.log("1/4 단계: 세금계산서 분석...")
-                if not self.extracted_data:
-                    extractor = UniversalTaxInvoiceExtractor()
-                    result = extractor.extract_from_file(self.files['tax_invoice'])
+                extract_key = self._hash_file(self.files['tax_invoice'])
+                if self.extracted_data and self._stage_unchanged('extract', extract_key):
+                    self.log("⏭️ 세금계산서가 바뀌지 않아 이전 분석 결과 사용")
+                else:
+                    result = self._extract_invoice(snapshot['page_workers'])
                     if result['success']:
-                        self.extracted_data = result
+                        self.extracted_data = self._extracted_view(result)
                         self.log("세금계산서 분석 완료")
                     else:
                         raise Exception(f"세금계산서 분석 실패: {result.get('error')}")
                 
-                # 2단계: 참조 데이터 생성
+                # 2단계: 참조 데이터 생성 (비어 있거나, 다른 분석 결과로 자동 생성된 경우에만)
                 self.log("2/4 단계: 참조 데이터 생성...")
-                if not self.reference_terms:
+                terms_key = self._stage_inputs['terms']
+                if not self.reference_terms or terms_key not in (None, self._extracted_key()):
                     self.auto_generate_terms()
+                else:
+                    self.log("⏭️ 기존 참조 데이터 사용")
                 
                 # 3단계: 텍스트 치환
                 self.log("3/4 단계: 텍스트 치환...")
-                processor = EnhancedHWPXProcessor(log_level="WARNING")
-                
-                output_file = self.output_hwpx_var.get()
-                if not output_file:
-                    base_name = Path(self.files['hwpx_template']).stem
-                    output_file = f"{base_name}_processed.hwpx"
-                    self.output_hwpx_var.set(output_file)
+                output_file = snapshot['output_hwpx'] or self._default_output_hwpx
+                if not snapshot['output_hwpx']:
+                    self.root.after(0, self.output_hwpx_var.set, output_file)
                 
-                options = {
-                    'case_sensitive': self.case_sensitive_var.get(),
-                    'whole_word_only': self.whole_word_var.get(),
-                    'backup_original': self.backup_var.get(),
-                    'use_advanced_regex': True
-                }
-                
-                result = processor.search_and_replace_text(
-                    hwpx_file=self.files['hwpx_template'],
-                    reference_data=self.reference_terms,
-                    output_file=output_file,
-                    replacement_options=options
+                options = snapshot['replace']
+                processor_ready.result()
+                replace_key = (
+                    template_hash.result(),
+                    self._digest(self.reference_terms),
+                    tuple(sorted(options.items())),
+                    output_file
                 )
-                
-                if result['success']:
+                if self._stage_unchanged('replace', replace_key, output_file):
                     self.files['output_hwpx'] = output_file
-                    self.log(f"텍스트 치환 완료: {result['total_replacements']}개 치환")
+                    self.log("⏭️ 템플릿/참조 데이터/옵션이 바뀌지 않아 텍스트 치환 건너뜀")
                 else:
-                    raise Exception(f"텍스트 치환 실패: {result.get('error')}")
+                    result = self._replace_text(output_file, options)
+                    
+                    if result['success']:
+                        self.files['output_hwpx'] = output_file
+                        self._stage_inputs['replace'] = replace_key
+                        self.log(f"텍스트 치환 완료: {result['total_replacements']}개 치환")
+                    else:
+                        raise Exception(f"텍스트 치환 실패: {result.get('error')}")
                 
                 # 4단계: 이미지 삽입 (선택사항)
                 if self.files.get('image_file'):
                     self.log("4/4 단계: 이미지 삽입...")
                     
-                    inserter = HWPXImageInserter()
+                    final_output = snapshot['final_output'] or self._final_output_name(output_file)
+                    if not snapshot['final_output']:
+                        self.root.after(0, self.final_output_var.set, final_output)
                     
-                    final_output = self.final_output_var.get()
-                    if not final_output:
-                        base_name = Path(output_file).stem
-                        final_output = f"{base_name}_final.hwpx"
-                        self.final_output_var.set(final_output)
+                    table_index, row_index, col_index = snapshot['position']
+                    image_options = snapshot['image']
                     
                     try:
-                        table_index = int(self.table_index_var.get())
-                        row_index = int(self.row_index_var.get())
-                        col_index = int(self.col_index_var.get())
-                    except ValueError:
-                        table_index = row_index = col_index = 0
-                        self.log("위치 정보가 잘못되어 기본값(0,0,0) 사용")
-                    
-                    image_options = {
-                        'width': int(self.img_width_var.get()),
-                        'height': int(self.img_height_var.get()),
-                        'maintain_ratio': self.maintain_ratio_var.get(),
-                        'alignment': self.alignment_var.get()
-                    }
-                    
-                    result = inserter.insert_image_to_table(
-                        hwpx_file=self.files['output_hwpx'],
-                        image_file=self.files['image_file'],
-                        output_file=final_output,
-                        table_index=table_index,
-                        row_index=row_index,
-                        col_index=col_index,
-                        image_options=image_options
-                    )
-                    
-                    if result['success']:
+                        image_key = (
+                            self._hash_file(output_file),
+                            self._hash_file(self.files['image_file']),
+                            (table_index, row_index, col_index),
+                            tuple(sorted(image_options.items())),
+                            final_output
+                        )
+                    except OSError:
+                        # 입력 파일이 없으면 건너뛰기 판단 없이 삽입을 시도해 삽입 실패로 기록
+                        image_key = None
+                    if image_key is not None and self._stage_unchanged('image', image_key, final_output):
                         self.files['final_output'] = final_output
-                        self.log(f"이미지 삽입 완료: {final_output}")
+                        self.log("⏭️ 입력이 바뀌지 않아 이미지 삽입 건너뜀")
                     else:
-                        self.log(f"이미지 삽입 실패: {result.get('error')}")
+                        result = self._insert_image_file(
+                            final_output, table_index, row_index, col_index, image_options
+                        )
+                        
+                        if result['success']:
+                            self.files['final_output'] = final_output
+                            self._stage_inputs['image'] = image_key
+                            self.log(f"이미지 삽입 완료: {final_output}")
+                        else:
+                            self.log(f"이미지 삽입 실패: {result.get('error')}")
                 else:
                     self.log("4/4 단계: 이미지 삽입 건너뜀 (이미지 파일 없음)")
                 
@@ -1039,10 +1614,8 @@ class HWPXAutomationGUI:
                 self.log(f"전체 프로세스 실패: {str(e)}")
                 messagebox.showerror("오류", f"전체 프로세스 실패: {str(e)}")
         
-        # 별도 스레드에서 실행
-        thread = threading.Thread(target=full_process_worker)
-        thread.daemon = True
-        thread.start()
+        # 작업 스레드 풀에서 실행
+        self._submit_task('full_process', full_process_worker)
     
     def run(self):
         """GUI 실행"""
@@ -1054,4 +1627,7 @@ def main():
     app.run()
 
 if __name__ == "__main__":
+    # PyInstaller 실행 파일에서 페이지 추출 프로세스를 띄울 수 있도록
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -5,10 +5,11 @@ HWPX 파일의 특정 표 위치에 이미지 삽입하는 도구
 
 import zipfile
 import xml.etree.ElementTree as ET
+from contextlib import contextmanager
 from pathlib import Path
-import tempfile
-import shutil
 import sys
+import threading
+from collections import OrderedDict
 import base64
 import uuid
 from PIL import Image
@@ -20,12 +21,135 @@ try:
 except ImportError:
     HAS_LXML = False
 
+# 요소 생성/파싱에 쓸 XML 모듈 (lxml 요소와 표준 라이브러리 요소가 한 트리에 섞이지 않도록 통일)
+XML = LXML_ET if HAS_LXML else ET
+
+if HAS_LXML:
+    # 표/행/셀 검색 XPath는 한 번만 컴파일 (행과 셀은 직계 자식만 찾아 중첩 표의 행/셀이 섞이지 않도록)
+    _TABLES_XPATH = LXML_ET.XPath('.//TABLE')
+    _ROWS_XPATH = LXML_ET.XPath('./TR')
+    _CELLS_XPATH = LXML_ET.XPath('./TC')
+
+# lxml 파서는 스레드 간에 공유하지 않고 스레드마다 하나씩 만들어 재사용
+_parser_local = threading.local()
+
+# 이미지 목록이 들어 있는 HWPX 항목
+BINDATA_XML = 'DocInfo/BinData.xml'
+
+# HWPX(ZIP) 읽기 버퍼 크기 (항목마다 작은 read 호출이 반복되지 않도록 크게 잡음)
+HWPX_READ_BUFFER = 1 << 20
+
+# 표 셀에 넣을 이미지 요소 (PICTURE 안의 REVERSE가 BinData의 이미지를 참조)
+PICTURE_TEMPLATE = (
+    '<PICTURE id="{id}" href="BinData/{id}.jpg" width="{width}" height="{height}" textAlign="{align}">'
+    '<REVERSE id="{id}"/>'
+    '</PICTURE>'
+)
+
+# 이미 압축된 형식 (다시 deflate 해도 크기가 줄지 않으므로 무압축으로 저장)
+PRECOMPRESSED_SUFFIXES = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.ttf', '.otf', '.woff', '.woff2',
+})
+
+# 변환한 이미지(JPEG)를 보관할 최대 개수 (같은 이미지를 여러 문서에 넣을 때 다시 변환하지 않도록)
+IMAGE_CACHE_MAX = 8
+
+# XML 항목 deflate 수준 (기본값 6보다 훨씬 빠르고 크기 차이는 작음)
+XML_COMPRESS_LEVEL = 1
+
+def _member_compress_type(name: str, original=None) -> int:
+    """HWPX 항목의 압축 방식 결정 (무압축 원본과 이미 압축된 형식은 ZIP_STORED, 나머지는 ZIP_DEFLATED)"""
+    if original == zipfile.ZIP_STORED or Path(name).suffix.lower() in PRECOMPRESSED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+@contextmanager
+def _open_hwpx_zip(hwpx_file):
+    """HWPX(ZIP) 열기 (경로는 큰 읽기 버퍼로, 메모리의 bytes나 파일 객체는 디스크를 거치지 않고 그대로)"""
+    if isinstance(hwpx_file, (bytes, bytearray, memoryview)):
+        hwpx_file = io.BytesIO(hwpx_file)
+    if hasattr(hwpx_file, 'read'):
+        with zipfile.ZipFile(hwpx_file, 'r') as zip_ref:
+            yield zip_ref
+        return
+    
+    with open(hwpx_file, 'rb', buffering=HWPX_READ_BUFFER) as f, zipfile.ZipFile(f, 'r') as zip_ref:
+        yield zip_ref
+
+def _xml_parser():
+    """현재 스레드의 lxml 파서 (본문의 공백 텍스트도 내용이므로 그대로 보존)"""
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _parser_local.parser = LXML_ET.XMLParser()
+    return parser
+
+def _parse_xml_bytes(data: bytes):
+    """XML 바이트열을 파싱해 루트 요소 반환"""
+    if HAS_LXML:
+        return LXML_ET.fromstring(data, _xml_parser())
+    return ET.fromstring(data)
+
+def _find_tables(root):
+    """문서의 모든 표(TABLE) 요소"""
+    if HAS_LXML:
+        return _TABLES_XPATH(root)
+    return root.findall('.//TABLE')
+
+def _table_rows(table):
+    """표의 행(TR) 요소 (중첩 표의 행 제외)"""
+    if HAS_LXML:
+        return _ROWS_XPATH(table)
+    return table.findall('TR')
+
+def _row_cells(row):
+    """행의 셀(TC) 요소 (셀 안에 든 중첩 표의 셀 제외)"""
+    if HAS_LXML:
+        return _CELLS_XPATH(row)
+    return row.findall('TC')
+
+def _section_names(zip_ref):
+    """본문 Section XML 항목 이름 (Section 순서대로)"""
+    return sorted(
+        name for name in zip_ref.namelist()
+        if name.startswith('BodyText/Section') and name.endswith('.xml') and name.count('/') == 1
+    )
+
+def _iter_table_events(fp):
+    """Section XML 스트림을 읽으며 TABLE 요소의 시작/끝 이벤트만 전달 (전체 트리를 먼저 만들지 않음)"""
+    if HAS_LXML:
+        yield from LXML_ET.iterparse(fp, events=('start', 'end'), tag='TABLE')
+    else:
+        for event, elem in ET.iterparse(fp, events=('start', 'end')):
+            if elem.tag == 'TABLE':
+                yield event, elem
+
+def _release_element(elem):
+    """다 읽은 요소와 (lxml이면) 앞쪽 형제 요소를 메모리에서 해제"""
+    elem.clear()
+    if HAS_LXML:
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+def _count_section_tables(fp) -> int:
+    """Section XML 스트림의 표(TABLE) 개수 (중첩된 표 포함, 전체 트리를 만들지 않음)"""
+    count = depth = 0
+    for event, table in _iter_table_events(fp):
+        if event == 'start':
+            count += 1
+            depth += 1
+            continue
+        depth -= 1
+        if not depth:
+            _release_element(table)
+    return count
+
 class HWPXImageInserter:
     """HWPX 파일에 이미지 삽입하는 클래스"""
     
     def __init__(self):
-        self.temp_dir = None
         self.image_counter = 0
+        self._image_cache = OrderedDict()
+        self._image_cache_lock = threading.Lock()
         
     def insert_image_to_table(self, 
                             hwpx_file: str,
@@ -39,7 +163,7 @@ class HWPXImageInserter:
         HWPX 파일의 특정 표 셀에 이미지 삽입
         
         Args:
-            hwpx_file: 원본 HWPX 파일 경로
+            hwpx_file: 원본 HWPX 파일 경로 (또는 메모리의 HWPX bytes, BytesIO)
             image_file: 삽입할 이미지 파일 경로
             output_file: 출력 HWPX 파일 경로
             table_index: 표 번호 (0부터 시작)
@@ -52,7 +176,9 @@ class HWPXImageInserter:
         """
         
         print(f"🖼️  HWPX 이미지 삽입 시작")
-        print(f"   원본: {hwpx_file}")
+        # 메모리의 HWPX(bytes, BytesIO)는 내용 대신 '<memory>'로 표시
+        input_name = hwpx_file if isinstance(hwpx_file, (str, Path)) else '<memory>'
+        print(f"   원본: {input_name}")
         print(f"   이미지: {image_file}")
         print(f"   출력: {output_file}")
         print(f"   위치: 표 {table_index}, 행 {row_index}, 열 {col_index}")
@@ -69,44 +195,44 @@ class HWPXImageInserter:
             default_options.update(image_options)
         
         try:
-            # 1. HWPX 파일 압축 해제
-            self.temp_dir = tempfile.mkdtemp()
-            hwpx_dir = Path(self.temp_dir) / "hwpx"
-            
-            with zipfile.ZipFile(hwpx_file, 'r') as zip_ref:
-                zip_ref.extractall(hwpx_dir)
+            # 출력이 원본과 같은 파일이면 덮어쓰기 전에 원본을 메모리로 읽어 둠
+            if (isinstance(hwpx_file, (str, Path)) and Path(output_file).exists()
+                    and Path(output_file).samefile(hwpx_file)):
+                hwpx_file = Path(hwpx_file).read_bytes()
             
-            print(f"✅ HWPX 압축 해제 완료")
-            
-            # 2. 이미지 파일 처리
-            image_info = self._process_image(image_file, default_options)
-            if not image_info['success']:
-                return image_info
-            
-            # 3. 이미지를 HWPX에 추가
-            self._add_image_to_hwpx(hwpx_dir, image_info)
-            
-            # 4. 표 찾기 및 이미지 삽입
-            result = self._insert_image_to_table_cell(
-                hwpx_dir, 
-                table_index, 
-                row_index, 
-                col_index, 
-                image_info,
-                default_options
-            )
-            
-            if not result['success']:
-                return result
-            
-            # 5. 새로운 HWPX 파일 생성
-            self._create_hwpx_file(hwpx_dir, output_file)
+            # 1. HWPX 파일 열기 (압축 해제 없이 바뀌는 항목만 메모리에서 수정)
+            with _open_hwpx_zip(hwpx_file) as src:
+                
+                # 2. 이미지 파일 처리
+                image_info = self._process_image(image_file, default_options)
+                if not image_info['success']:
+                    return image_info
+                
+                # 3. 이미지를 HWPX에 추가
+                changed = self._add_image_to_hwpx(src, image_info)
+                
+                # 4. 표 찾기 및 이미지 삽입
+                result = self._insert_image_to_table_cell(
+                    src, 
+                    table_index, 
+                    row_index, 
+                    col_index, 
+                    image_info,
+                    default_options
+                )
+                
+                if not result['success']:
+                    return result
+                changed[result['section']] = result['data']
+                
+                # 5. 새로운 HWPX 파일 생성 (바뀌지 않은 항목은 그대로 복사)
+                self._create_hwpx_file(src, output_file, changed)
             
             print(f"✅ 이미지 삽입 완료: {output_file}")
             
             return {
                 'success': True,
-                'input_file': hwpx_file,
+                'input_file': input_name,
                 'output_file': output_file,
                 'image_file': image_file,
                 'position': f"표 {table_index}, 행 {row_index}, 열 {col_index}",
@@ -119,148 +245,148 @@ class HWPXImageInserter:
                 'success': False,
                 'error': str(e)
             }
-        finally:
-            # 임시 디렉토리 정리
-            if self.temp_dir and Path(self.temp_dir).exists():
-                shutil.rmtree(self.temp_dir)
     
     def _process_image(self, image_file: str, options: dict) -> dict:
-        """이미지 파일 처리 및 변환"""
+        """이미지 파일 처리 및 변환 (같은 파일/크기 옵션이면 변환 결과 재사용)"""
         
         try:
             image_path = Path(image_file)
             if not image_path.exists():
                 return {'success': False, 'error': f'이미지 파일을 찾을 수 없습니다: {image_file}'}
             
-            # PIL로 이미지 열기
-            with Image.open(image_path) as img:
-                # RGB로 변환 (HWPX는 JPG 권장)
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # 크기 조정
-                original_width, original_height = img.size
-                
-                if options['maintain_ratio']:
-                    # 비율 유지하면서 크기 조정
-                    ratio = min(options['width'] / (original_width * 0.264583), 
-                              options['height'] / (original_height * 0.264583))  # px to mm 변환
-                    new_width = int(original_width * ratio)
-                    new_height = int(original_height * ratio)
-                else:
-                    # mm를 px로 변환 (72 DPI 기준)
-                    new_width = int(options['width'] * 3.77953)  # mm to px
-                    new_height = int(options['height'] * 3.77953)
-                
-                # 이미지 리사이즈
-                img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                # JPG로 저장 (메모리에)
-                img_buffer = io.BytesIO()
-                img_resized.save(img_buffer, format='JPEG', quality=85)
-                img_data = img_buffer.getvalue()
-                
-                # 고유 ID 생성
-                image_id = f"image_{uuid.uuid4().hex[:8]}"
-                
-                return {
-                    'success': True,
-                    'id': image_id,
-                    'data': img_data,
-                    'width': options['width'],  # mm 단위
-                    'height': options['height'],  # mm 단위
-                    'pixel_width': new_width,
-                    'pixel_height': new_height,
-                    'format': 'jpg',
-                    'size': len(img_data)
-                }
+            # 파일이 바뀌면 수정 시각/크기가 달라지므로 캐시 키에 포함 (정렬은 변환 결과와 무관)
+            stat = image_path.stat()
+            key = (str(image_path.resolve()), stat.st_mtime_ns, stat.st_size,
+                   options['width'], options['height'], bool(options['maintain_ratio']))
+            
+            with self._image_cache_lock:
+                converted = self._image_cache.get(key)
+                if converted is not None:
+                    self._image_cache.move_to_end(key)
+            
+            if converted is None:
+                converted = self._convert_image(image_path, options)
+                with self._image_cache_lock:
+                    self._image_cache[key] = converted
+                    if len(self._image_cache) > IMAGE_CACHE_MAX:
+                        self._image_cache.popitem(last=False)
+            
+            # 고유 ID는 삽입할 때마다 새로 생성 (한 문서에 같은 이미지를 여러 번 넣어도 항목 이름이 겹치지 않도록)
+            image_id = f"image_{uuid.uuid4().hex[:8]}"
+            
+            return {'success': True, 'id': image_id, **converted}
             
         except Exception as e:
             return {'success': False, 'error': f'이미지 처리 실패: {e}'}
     
-    def _add_image_to_hwpx(self, hwpx_dir: Path, image_info: dict):
-        """이미지 파일을 HWPX 구조에 추가"""
-        
-        # BinData 폴더 생성
-        bindata_dir = hwpx_dir / "BinData"
-        bindata_dir.mkdir(exist_ok=True)
+    def _convert_image(self, image_path: Path, options: dict) -> dict:
+        """이미지를 지정 크기의 JPEG로 변환"""
+        
+        # PIL로 이미지 열기 (헤더만 읽은 상태라 크기는 디코딩 없이 알 수 있음)
+        with Image.open(image_path) as img:
+            # 크기 조정
+            original_width, original_height = img.size
+            
+            if options['maintain_ratio']:
+                # 비율 유지하면서 크기 조정
+                ratio = min(options['width'] / (original_width * 0.264583), 
+                          options['height'] / (original_height * 0.264583))  # px to mm 변환
+                new_width = int(original_width * ratio)
+                new_height = int(original_height * ratio)
+            else:
+                # mm를 px로 변환 (72 DPI 기준)
+                new_width = int(options['width'] * 3.77953)  # mm to px
+                new_height = int(options['height'] * 3.77953)
+            
+            # JPEG은 목표 크기 이상인 가장 작은 DCT 축소 배율로 디코딩 (다른 형식은 영향 없음)
+            img.draft('RGB', (new_width, new_height))
+            
+            # RGB로 변환 (HWPX는 JPG 권장)
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            
+            # 이미지 리사이즈 (크게 줄일 때는 정수배 축소를 먼저 한 뒤 LANCZOS 적용)
+            img_resized = img.resize(
+                (new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=3.0
+            )
+            
+            # JPG로 저장 (메모리에)
+            img_buffer = io.BytesIO()
+            img_resized.save(img_buffer, format='JPEG', quality=85)
+            img_data = img_buffer.getvalue()
+            
+            return {
+                'data': img_data,
+                'width': options['width'],  # mm 단위
+                'height': options['height'],  # mm 단위
+                'pixel_width': new_width,
+                'pixel_height': new_height,
+                'format': 'jpg',
+                'size': len(img_data)
+            }
+    
+    def _add_image_to_hwpx(self, src: zipfile.ZipFile, image_info: dict) -> dict:
+        """이미지 파일과 BinData.xml 갱신 내용 반환 (ZIP 항목 이름 → 새 내용)"""
         
-        # 이미지 파일 저장
+        # 이미지 파일 추가
         image_filename = f"{image_info['id']}.jpg"
-        image_path = bindata_dir / image_filename
-        
-        with open(image_path, 'wb') as f:
-            f.write(image_info['data'])
+        changed = {f"BinData/{image_filename}": image_info['data']}
         
         print(f"📁 이미지 파일 추가: {image_filename}")
         
         # DocInfo/BinData.xml에 이미지 정보 추가
-        self._update_bindata_xml(hwpx_dir, image_info, image_filename)
+        changed[BINDATA_XML] = self._update_bindata_xml(src, image_info, image_filename)
+        return changed
     
-    def _update_bindata_xml(self, hwpx_dir: Path, image_info: dict, image_filename: str):
-        """BinData.xml 파일 업데이트"""
-        
-        bindata_xml_path = hwpx_dir / "DocInfo" / "BinData.xml"
-        
-        # BinData.xml이 없으면 생성
-        if not bindata_xml_path.exists():
-            self._create_bindata_xml(bindata_xml_path)
+    def _update_bindata_xml(self, src: zipfile.ZipFile, image_info: dict, image_filename: str) -> bytes:
+        """BinData.xml 갱신 내용 생성"""
         
-        # XML 파싱
-        if HAS_LXML:
-            tree = LXML_ET.parse(str(bindata_xml_path))
-            root = tree.getroot()
-        else:
-            tree = ET.parse(bindata_xml_path)
-            root = tree.getroot()
+        # XML 파싱 (BinData.xml이 없으면 새로 만듦)
+        try:
+            root = _parse_xml_bytes(src.read(BINDATA_XML))
+        except KeyError:
+            root = self._create_bindata_xml()
         
         # BINDATASTORAGE 요소 찾기 또는 생성
         bindata_storage = root.find('BINDATASTORAGE')
         if bindata_storage is None:
-            bindata_storage = ET.SubElement(root, 'BINDATASTORAGE')
+            bindata_storage = XML.SubElement(root, 'BINDATASTORAGE')
         
         # BINDATA 요소 추가
-        bindata = ET.SubElement(bindata_storage, 'BINDATA')
+        bindata = XML.SubElement(bindata_storage, 'BINDATA')
         bindata.set('id', image_info['id'])
         bindata.set('href', f"BinData/{image_filename}")
         bindata.set('type', 'jpg')
         bindata.set('size', str(image_info['size']))
         
-        # XML 저장
-        if HAS_LXML:
-            tree.write(str(bindata_xml_path), encoding='utf-8', xml_declaration=True, pretty_print=True)
-        else:
-            self._indent_xml(root)
-            tree.write(bindata_xml_path, encoding='utf-8', xml_declaration=True)
-        
         print(f"📝 BinData.xml 업데이트 완료")
+        return self._serialize_xml(root)
     
-    def _create_bindata_xml(self, bindata_xml_path: Path):
-        """기본 BinData.xml 파일 생성"""
-        
-        bindata_xml_path.parent.mkdir(exist_ok=True)
-        
-        root = ET.Element('BINDATASTORAGE')
-        tree = ET.ElementTree(root)
-        
-        if HAS_LXML:
-            tree.write(str(bindata_xml_path), encoding='utf-8', xml_declaration=True, pretty_print=True)
-        else:
-            tree.write(bindata_xml_path, encoding='utf-8', xml_declaration=True)
+    def _create_bindata_xml(self):
+        """기본 BinData.xml 루트 요소 생성"""
+        return XML.Element('BINDATASTORAGE')
     
-    def _insert_image_to_table_cell(self, hwpx_dir: Path, table_index: int, row_index: int, col_index: int, image_info: dict, options: dict):
-        """표 셀에 이미지 삽입"""
+    def _insert_image_to_table_cell(self, src: zipfile.ZipFile, table_index: int, row_index: int, col_index: int, image_info: dict, options: dict):
+        """표 셀에 이미지 삽입 (성공하면 수정된 Section 항목 이름과 내용 반환)"""
         
-        # BodyText 폴더에서 Section 파일들 찾기
-        bodytext_dir = hwpx_dir / "BodyText"
-        section_files = sorted(bodytext_dir.glob("Section*.xml"))
+        # BodyText 폴더의 Section 파일들 찾기
+        section_names = _section_names(src)
         
         table_found = False
         current_table_index = 0
         
-        for section_file in section_files:
+        for section_name in section_names:
+            # 목표 표가 없는 Section은 트리를 만들지 않고 스트림으로 표 개수만 세고 넘어감 (마지막 Section은 셀 필요 없음)
+            if section_name != section_names[-1]:
+                with src.open(section_name) as fp:
+                    table_count = _count_section_tables(fp)
+                if current_table_index + table_count <= table_index:
+                    current_table_index += table_count
+                    continue
+            
             result = self._process_section_file(
-                section_file, 
+                section_name, 
+                src.read(section_name), 
                 table_index, 
                 row_index, 
                 col_index, 
@@ -272,7 +398,7 @@ class HWPXImageInserter:
             if result['found']:
                 table_found = True
                 current_table_index = result['next_table_index']
-                print(f"✅ {section_file.name}에서 이미지 삽입 완료")
+                print(f"✅ {Path(section_name).name}에서 이미지 삽입 완료")
                 break
             
             current_table_index = result['next_table_index']
@@ -283,22 +409,17 @@ class HWPXImageInserter:
                 'error': f'표 {table_index}를 찾을 수 없습니다. 총 {current_table_index}개의 표가 있습니다.'
             }
         
-        return {'success': True}
+        return {'success': True, 'section': section_name, 'data': result['data']}
     
-    def _process_section_file(self, section_file: Path, target_table: int, target_row: int, target_col: int, current_table_index: int, image_info: dict, options: dict):
-        """Section 파일에서 표 처리"""
+    def _process_section_file(self, section_name: str, section_data: bytes, target_table: int, target_row: int, target_col: int, current_table_index: int, image_info: dict, options: dict):
+        """Section XML에서 표 처리"""
         
         try:
             # XML 파싱
-            if HAS_LXML:
-                tree = LXML_ET.parse(str(section_file))
-                root = tree.getroot()
-            else:
-                tree = ET.parse(section_file)
-                root = tree.getroot()
+            root = _parse_xml_bytes(section_data)
             
             # 표(TABLE) 요소들 찾기
-            tables = root.findall('.//TABLE')
+            tables = _find_tables(root)
             
             for table in tables:
                 if current_table_index == target_table:
@@ -306,16 +427,11 @@ class HWPXImageInserter:
                     result = self._insert_image_to_table(table, target_row, target_col, image_info, options)
                     
                     if result['success']:
-                        # 수정된 XML 저장
-                        if HAS_LXML:
-                            tree.write(str(section_file), encoding='utf-8', xml_declaration=True, pretty_print=True)
-                        else:
-                            self._indent_xml(root)
-                            tree.write(section_file, encoding='utf-8', xml_declaration=True)
-                        
+                        # 수정된 XML 직렬화
                         return {
                             'found': True,
-                            'next_table_index': current_table_index + 1
+                            'next_table_index': current_table_index + 1,
+                            'data': self._serialize_xml(root)
                         }
                     else:
                         return {
@@ -332,7 +448,7 @@ class HWPXImageInserter:
             }
             
         except Exception as e:
-            print(f"❌ {section_file.name} 처리 실패: {e}")
+            print(f"❌ {Path(section_name).name} 처리 실패: {e}")
             return {
                 'found': False,
                 'next_table_index': current_table_index,
@@ -344,7 +460,7 @@ class HWPXImageInserter:
         
         try:
             # 행(TR) 요소들 찾기
-            rows = table_element.findall('.//TR')
+            rows = _table_rows(table_element)
             
             if target_row >= len(rows):
                 return {
@@ -355,7 +471,7 @@ class HWPXImageInserter:
             target_row_element = rows[target_row]
             
             # 셀(TC) 요소들 찾기
-            cells = target_row_element.findall('.//TC')
+            cells = _row_cells(target_row_element)
             
             if target_col >= len(cells):
                 return {
@@ -385,62 +501,80 @@ class HWPXImageInserter:
             }
     
     def _create_image_element(self, image_info: dict, options: dict):
-        """이미지 XML 요소 생성"""
-        
-        # PICTURE 요소 생성
-        picture = ET.Element('PICTURE')
-        picture.set('id', image_info['id'])
-        picture.set('href', f"BinData/{image_info['id']}.jpg")
-        
-        # 크기 설정 (HWPX 단위는 1/100mm)
-        width_hwp = int(image_info['width'] * 100)
-        height_hwp = int(image_info['height'] * 100)
-        
-        picture.set('width', str(width_hwp))
-        picture.set('height', str(height_hwp))
-        
-        # 정렬 설정
-        if options['alignment'] == 'center':
-            picture.set('textAlign', 'center')
-        elif options['alignment'] == 'right':
-            picture.set('textAlign', 'right')
-        else:
-            picture.set('textAlign', 'left')
-        
-        # REVERSE 요소 추가 (이미지 참조)
-        reverse = ET.SubElement(picture, 'REVERSE')
-        reverse.set('id', image_info['id'])
-        
-        return picture
+        """이미지 XML 요소 생성 (구조가 고정이라 템플릿 문자열을 한 번에 파싱)"""
+        
+        # 크기는 HWPX 단위(1/100mm), 정렬은 center/right 외에는 left
+        return XML.fromstring(PICTURE_TEMPLATE.format(
+            id=image_info['id'],
+            width=int(image_info['width'] * 100),
+            height=int(image_info['height'] * 100),
+            align=options['alignment'] if options['alignment'] in ('center', 'right') else 'left'
+        ))
     
-    def _create_hwpx_file(self, hwpx_dir: Path, output_file: str):
-        """수정된 디렉토리로부터 새로운 HWPX 파일 생성"""
+    def _create_hwpx_file(self, src: zipfile.ZipFile, output_file: str, changed: dict):
+        """원본 HWPX의 항목을 순서대로 옮겨 쓰면서 바뀐 항목만 새 내용으로 교체하고, 새 항목은 뒤에 추가"""
         
         print(f"📦 HWPX 파일 생성 중...")
         
-        with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in hwpx_dir.rglob('*'):
-                if file_path.is_file():
-                    relative_path = file_path.relative_to(hwpx_dir)
-                    zipf.write(file_path, relative_path)
+        pending = dict(changed)
+        with zipfile.ZipFile(output_file, 'w') as dst:
+            for info in src.infolist():
+                if info.is_dir():
+                    continue
+                data = pending.pop(info.filename, None)
+                if data is None:
+                    data = src.read(info)
+                
+                # 원본 항목의 속성 유지 (mimetype처럼 무압축이어야 하는 항목은 그대로 무압축)
+                out_info = zipfile.ZipInfo(info.filename, info.date_time)
+                out_info.compress_type = _member_compress_type(info.filename, info.compress_type)
+                out_info.external_attr = info.external_attr
+                out_info.create_system = info.create_system
+                dst.writestr(out_info, data, compresslevel=XML_COMPRESS_LEVEL)
+            
+            for name, data in pending.items():
+                dst.writestr(name, data, compress_type=_member_compress_type(name),
+                             compresslevel=XML_COMPRESS_LEVEL)
         
         print(f"✅ HWPX 파일 생성 완료")
     
-    def _indent_xml(self, elem, level=0):
-        """XML 요소에 들여쓰기 추가"""
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-            for child in elem:
-                self._indent_xml(child, level + 1)
-            if not child.tail or not child.tail.strip():
-                child.tail = i
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = i
+    def _serialize_xml(self, root) -> bytes:
+        """XML 요소를 들여쓰기 없이 바이트열로 직렬화 (본문 공백이 바뀌지 않도록 원래 모양 그대로)"""
+        if HAS_LXML:
+            return LXML_ET.tostring(root, encoding='utf-8', xml_declaration=True)
+        return ET.tostring(root, encoding='utf-8', xml_declaration=True)
+    
+    def get_tables_in_hwpx(self, hwpx_file: str) -> list:
+        """HWPX 파일의 표 구조 반환 (표마다 행 수, 최대 열 수, 행별 열 수)"""
+        
+        tables = []
+        
+        # 전체 압축 해제 없이 섹션 XML을 압축 파일에서 스트림으로 읽으며 표만 처리
+        with _open_hwpx_zip(hwpx_file) as zip_ref:
+            for name in _section_names(zip_ref):
+                with zip_ref.open(name) as fp:
+                    open_tables = []
+                    for event, table in _iter_table_events(fp):
+                        if event == 'start':
+                            # 중첩된 표도 문서 순서(바깥 표 먼저)대로 번호를 매기도록 시작 시점에 자리 확보
+                            open_tables.append(len(tables))
+                            tables.append(None)
+                            continue
+                        
+                        row_cells = [len(_row_cells(row)) for row in _table_rows(table)]
+                        index = open_tables.pop()
+                        tables[index] = {
+                            'index': index,
+                            'rows': len(row_cells),
+                            'cols': max(row_cells, default=0),
+                            'row_cells': row_cells
+                        }
+                        
+                        # 가장 바깥 표를 다 읽었으면 해제해 메모리를 표 하나 크기로 유지
+                        if not open_tables:
+                            _release_element(table)
+        
+        return tables
     
     def list_tables_in_hwpx(self, hwpx_file: str):
         """HWPX 파일의 표 구조 분석"""
@@ -448,44 +582,18 @@ class HWPXImageInserter:
         print(f"📋 HWPX 표 구조 분석: {hwpx_file}")
         
         try:
-            temp_dir = tempfile.mkdtemp()
-            hwpx_dir = Path(temp_dir) / "hwpx"
-            
-            with zipfile.ZipFile(hwpx_file, 'r') as zip_ref:
-                zip_ref.extractall(hwpx_dir)
+            tables = self.get_tables_in_hwpx(hwpx_file)
             
-            bodytext_dir = hwpx_dir / "BodyText"
-            section_files = sorted(bodytext_dir.glob("Section*.xml"))
-            
-            table_index = 0
-            
-            for section_file in section_files:
-                if HAS_LXML:
-                    tree = LXML_ET.parse(str(section_file))
-                    root = tree.getroot()
-                else:
-                    tree = ET.parse(section_file)
-                    root = tree.getroot()
-                
-                tables = root.findall('.//TABLE')
+            for table in tables:
+                print(f"📊 표 {table['index']}: {table['rows']}행")
                 
-                for table in tables:
-                    rows = table.findall('.//TR')
-                    print(f"📊 표 {table_index}: {len(rows)}행")
-                    
-                    for row_idx, row in enumerate(rows):
-                        cells = row.findall('.//TC')
-                        print(f"   행 {row_idx}: {len(cells)}열")
-                    
-                    table_index += 1
+                for row_idx, cell_count in enumerate(table['row_cells']):
+                    print(f"   행 {row_idx}: {cell_count}열")
             
-            print(f"총 {table_index}개의 표가 발견되었습니다.")
+            print(f"총 {len(tables)}개의 표가 발견되었습니다.")
             
         except Exception as e:
             print(f"❌ 표 분석 실패: {e}")
-        finally:
-            if Path(temp_dir).exists():
-                shutil.rmtree(temp_dir)
 
 def main():
     """CLI 인터페이스"""
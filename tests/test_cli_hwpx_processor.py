@@ -0,0 +1,94 @@
+"""cli_hwpx_processor 테스트 (참조 데이터 캐시, 일괄 처리 출력 경로)"""
+
+import os
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import cli_hwpx_processor
+
+
+class _CountingProcessor:
+    """load_reference_data 호출 횟수를 세는 가짜 프로세서"""
+
+    def __init__(self):
+        self.loads = 0
+
+    def load_reference_data(self, path):
+        self.loads += 1
+        return {"구": "신"}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setattr(cli_hwpx_processor, "REFERENCE_CACHE_DIR", path)
+    return path
+
+
+@pytest.fixture
+def reference_csv(tmp_path):
+    path = tmp_path / "terms.csv"
+    path.write_text("검색어,치환어\n구,신\n", encoding="utf-8")
+    return path
+
+
+def test_reference_cache_is_keyed_by_loader_version(cache_dir, reference_csv, monkeypatch):
+    """같은 파일이면 캐시를 쓰고, 로더 버전이 바뀌면 다시 파싱"""
+    processor = _CountingProcessor()
+
+    assert cli_hwpx_processor.load_reference_with_cache(processor, reference_csv) == {"구": "신"}
+    assert cli_hwpx_processor.load_reference_with_cache(processor, reference_csv) == {"구": "신"}
+    assert processor.loads == 1
+
+    monkeypatch.setattr(cli_hwpx_processor, "REFERENCE_CACHE_VERSION",
+                        cli_hwpx_processor.REFERENCE_CACHE_VERSION + 1)
+    cli_hwpx_processor.load_reference_with_cache(processor, reference_csv)
+    assert processor.loads == 2
+
+
+def test_prune_reference_cache_keeps_most_recent(cache_dir):
+    """최대 개수를 넘는 캐시 파일은 오래 쓰지 않은 것부터 삭제"""
+    cache_dir.mkdir()
+    for i in range(5):
+        path = cache_dir / f"{i}.json"
+        path.write_text("{}", encoding="utf-8")
+        os.utime(path, (1000 + i, 1000 + i))
+
+    cli_hwpx_processor.prune_reference_cache(max_entries=2)
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["3.json", "4.json"]
+
+
+def _write_hwpx(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("mimetype", "application/hwp+zip")
+        zf.writestr("BodyText/Section0.xml", f"<SEC><P><T>{text}</T></P></SEC>")
+
+
+def test_recursive_batch_mirrors_subfolders(tmp_path, reference_csv, monkeypatch):
+    """--recursive 일괄 처리 시 하위 폴더의 같은 이름 파일이 서로 덮어쓰지 않음"""
+    docs = tmp_path / "docs"
+    _write_hwpx(docs / "report.hwpx", "최상위 구")
+    _write_hwpx(docs / "a" / "report.hwpx", "A 구")
+    _write_hwpx(docs / "b" / "report.hwpx", "B 구")
+    out = tmp_path / "out"
+
+    monkeypatch.setattr(sys, "argv", [
+        "cli_hwpx_processor.py", "-b", str(docs), "--recursive", "-j", "1",
+        "-r", str(reference_csv), "--output-dir", str(out), "--no-cache", "--no-backup",
+    ])
+    cli_hwpx_processor.main()
+
+    outputs = {
+        p.relative_to(out).as_posix(): p.read_text(encoding="utf-8")
+        for p in out.rglob("*_processed.txt")
+    }
+    assert sorted(outputs) == ["a/report_processed.txt", "b/report_processed.txt", "report_processed.txt"]
+    assert "A 신" in outputs["a/report_processed.txt"]
+    assert "B 신" in outputs["b/report_processed.txt"]
+    assert "최상위 신" in outputs["report_processed.txt"]
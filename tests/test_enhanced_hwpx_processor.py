@@ -0,0 +1,102 @@
+"""EnhancedHWPXProcessor 테스트 (참조 데이터 로드와 치환 경로)"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import enhanced_hwpx_processor
+from enhanced_hwpx_processor import EnhancedHWPXProcessor
+
+
+def _use_csv_backend(monkeypatch, backend):
+    """CSV 로더 선택 (pyarrow → pandas → csv 모듈 순서로 쓰이므로 앞쪽 가용성 플래그를 끔)"""
+    if backend == "pyarrow" and not enhanced_hwpx_processor.HAS_PYARROW:
+        pytest.skip("pyarrow 미설치")
+    if backend == "pandas" and not enhanced_hwpx_processor.HAS_PANDAS:
+        pytest.skip("pandas 미설치")
+    if backend != "pyarrow":
+        monkeypatch.setattr(enhanced_hwpx_processor, "HAS_PYARROW", False)
+    if backend == "csv":
+        monkeypatch.setattr(enhanced_hwpx_processor, "HAS_PANDAS", False)
+
+
+@pytest.fixture
+def reference_csv(tmp_path):
+    path = tmp_path / "reference.csv"
+    path.write_text("검색어,치환어\n001,1.50\n010,2.00\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("backend", ["pyarrow", "pandas", "csv"])
+def test_csv_reference_keeps_values_as_strings(reference_csv, monkeypatch, backend):
+    """어느 CSV 로더로 읽어도 숫자처럼 보이는 검색어/치환어가 원래 문자열 그대로 유지"""
+    _use_csv_backend(monkeypatch, backend)
+
+    terms = EnhancedHWPXProcessor().load_reference_data(str(reference_csv))
+    assert terms == {"001": "1.50", "010": "2.00"}
+
+
+@pytest.mark.parametrize("backend", ["pyarrow", "pandas", "csv"])
+def test_single_column_csv_reference_is_empty(tmp_path, monkeypatch, backend):
+    """검색어 컬럼만 있는 CSV는 오류 없이 빈 참조 데이터"""
+    _use_csv_backend(monkeypatch, backend)
+
+    path = tmp_path / "reference.csv"
+    path.write_text("검색어\n가나\n다라\n", encoding="utf-8")
+    assert EnhancedHWPXProcessor().load_reference_data(str(path)) == {}
+
+
+@pytest.mark.skipif(not enhanced_hwpx_processor.HAS_AHOCORASICK, reason="pyahocorasick 미설치")
+@pytest.mark.parametrize("text, term", [
+    ("a -x b", "-x"),
+    ("a-x b", "-x"),
+    ("-x", "-x"),
+    ("x. y", "x."),
+    ("ab x_y x", "x"),
+    ("가나 가나다", "가나"),
+])
+def test_whole_word_automaton_matches_regex(text, term):
+    """전체 단어 매칭 결과가 Aho-Corasick 경로와 결합 정규식 경로에서 같음 (\\b 의미)"""
+    processor = EnhancedHWPXProcessor()
+    options = processor._resolve_options({'whole_word_only': True})
+    compiled = processor._compile_reference({term: "Y"}, options)
+
+    by_automaton, _ = processor._replace_with_automaton(text, compiled['literal_terms'], options)
+    by_regex, _ = processor._replace_with_pattern(text, compiled['literal_terms'], compiled['combined'])
+    assert by_automaton == by_regex
+
+
+def _replace_literals(processor, text, reference, options):
+    """search_and_replace_text와 같은 순서로 리터럴 치환 (한 글자 str.translate → 결합 정규식)"""
+    compiled = processor._compile_reference(reference, options)
+    if compiled['translate_table'] is not None:
+        text, _ = processor._apply_translate(text, compiled)
+    text, _ = processor._replace_with_pattern(text, compiled['literal_terms'], compiled['combined'])
+    return text
+
+
+@pytest.mark.parametrize("reference, text", [
+    ({" ": "_", "a": "A"}, "a b c"),
+    ({"\t": "", "가": "나"}, "가\t가"),
+    ({"a": "b", "b": "c"}, "ab"),
+    ({"-": "", "x-y": "z"}, "x-y -"),
+    ({"가": "나", "나": "다라"}, "가나"),
+])
+def test_translate_split_matches_pattern_path(reference, text):
+    """한 글자 치환을 str.translate로 분리해도 결합 정규식만 쓸 때와 결과가 같음 (공백 검색어는 치환하지 않음)"""
+    processor = EnhancedHWPXProcessor()
+    options = processor._resolve_options({'case_sensitive': True})
+    combined = processor.build_search_pattern([t for t in reference if t.strip()], options)
+
+    expected, _ = processor._replace_with_pattern(text, reference, combined)
+    assert _replace_literals(processor, text, reference, options) == expected
+
+
+def test_compile_reference_accepts_non_string_replacements():
+    """JSON 숫자 같은 문자열이 아닌 치환어도 오류 없이 문자열로 치환"""
+    processor = EnhancedHWPXProcessor()
+    options = processor._resolve_options({})
+    assert _replace_literals(processor, "a b 가", {"a": 1, "가": 2.5, "b": None}, options) == "1  2.5"
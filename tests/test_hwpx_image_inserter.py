@@ -0,0 +1,68 @@
+"""HWPXImageInserter 테스트"""
+
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PIL import Image
+
+from hwpx_image_inserter import HWPXImageInserter
+
+SECTION_HEAD = b"<?xml version='1.0' encoding='utf-8'?>\n<SEC><P><T>Hello</T> <T>World</T></P>\n<TABLE><TR>"
+SECTION_TAIL = b"</TR></TABLE>\n</SEC>"
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    path = tmp_path / "image.png"
+    Image.new("RGB", (40, 30), "red").save(path)
+    return path
+
+
+@pytest.fixture
+def hwpx_file(tmp_path):
+    path = tmp_path / "document.hwpx"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("mimetype", "application/hwp+zip")
+        zf.writestr("BodyText/Section0.xml", SECTION_HEAD + b"<TC/>" + SECTION_TAIL,
+                    compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("BinData/logo.png", b"\x89PNG" + bytes(64), compress_type=zipfile.ZIP_DEFLATED)
+    return path
+
+
+def test_insert_keeps_section_xml_byte_identical(hwpx_file, image_file, tmp_path):
+    """이미지를 넣은 셀 밖의 Section XML(혼합 내용 <P>의 공백 포함)은 바이트 단위로 그대로 유지"""
+    output = tmp_path / "output.hwpx"
+    result = HWPXImageInserter().insert_image_to_table(str(hwpx_file), str(image_file), str(output))
+    assert result["success"], result
+
+    with zipfile.ZipFile(output) as zf:
+        section = zf.read("BodyText/Section0.xml")
+    assert section.startswith(SECTION_HEAD + b"<TC><PICTURE ")
+    assert section.endswith(b"</PICTURE></TC>" + SECTION_TAIL)
+
+
+def test_insert_sets_compression_per_member(hwpx_file, image_file, tmp_path):
+    """mimetype과 이미지 항목은 무압축(ZIP_STORED), XML 항목은 ZIP_DEFLATED로 저장"""
+    output = tmp_path / "output.hwpx"
+    result = HWPXImageInserter().insert_image_to_table(str(hwpx_file), str(image_file), str(output))
+    assert result["success"], result
+
+    with zipfile.ZipFile(output) as zf:
+        infos = zf.infolist()
+        compress_types = {info.filename: info.compress_type for info in infos}
+        assert zf.testzip() is None
+
+    assert infos[0].filename == "mimetype"
+    assert compress_types["mimetype"] == zipfile.ZIP_STORED
+    assert compress_types["BodyText/Section0.xml"] == zipfile.ZIP_DEFLATED
+    assert compress_types["BinData/logo.png"] == zipfile.ZIP_STORED
+
+    new_images = [name for name in compress_types
+                  if name.startswith("BinData/") and name != "BinData/logo.png"]
+    assert new_images
+    assert all(compress_types[name] == zipfile.ZIP_STORED for name in new_images)
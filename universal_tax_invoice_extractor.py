@@ -6,10 +6,61 @@
 
 import re
 import json
+from concurrent.futures import ProcessPoolExecutor
 import pdfplumber
 
+try:
+    import pymupdf
+    HAS_PYMUPDF = True
+except ImportError:
+    try:
+        import fitz as pymupdf  # PyMuPDF 1.24.3 이전 버전의 모듈 이름
+        HAS_PYMUPDF = True
+    except ImportError:
+        HAS_PYMUPDF = False
+
+# 라벨 정규식은 모듈을 불러올 때 한 번만 컴파일
+# 공급자/공급받는자 항목은 '라벨[\s\S]*?값' 한 패턴 대신 라벨을 먼저 찾고 그 뒤에서 값을 찾음
+# (결과는 같고, 값이 없을 때 라벨 위치마다 문서 끝까지 다시 훑는 역추적이 없음)
+_SUPPLIER_LABEL = re.compile(r'공\s*급\s*자')
+_BUYER_LABEL = re.compile(r'공\s*급\s*받\s*는\s*자')
+_REG_NUMBER = re.compile(r'등록번호\s*(\d{3}-\d{2}-\d{5})')
+_COMPANY_NAME = re.compile(r'상호[\s\S]*?([^\n]+)')
+_ADDRESS = re.compile(r'사업장\s*주소\s*([^\n]+)')
+_CEO_NAME = re.compile(r'성명\s*([^\n]+)')
+_BUSINESS_TYPE = re.compile(r'업태\s*([^\n]+)')
+_ITEM_TYPE = re.compile(r'종목\s*([^\n]+)')
+_ITEM_ROW = re.compile(r'(\d{2})\s(\d{2})\s([\w\-/]+)(?:\s([^\n]+))?\s(\d+)\s([0-9,]+)\s([0-9,]+)\s([0-9,]+)')
+
+# PyMuPDF 텍스트의 열 맞춤 공백 (pdfplumber처럼 공백 하나로 맞춤)
+_SPACE_RUN = re.compile(r'[ \t]+')
+
+
+def _label_end(label, text):
+    """label이 처음 나온 곳의 끝 위치 (없으면 -1)"""
+    match = label.search(text)
+    return match.end() if match else -1
+
+
+def _search_from(pos, pattern, text):
+    """pos(_label_end 결과) 뒤에서 pattern 검색 (label[\s\S]*?pattern 검색과 같은 결과)"""
+    return pattern.search(text, pos) if pos >= 0 else None
+
+
+def _normalize_spacing(text):
+    """연속 공백/탭을 공백 하나로 줄이고 줄 앞뒤 공백과 빈 줄 제거 (pdfplumber 출력과 같은 형태로)"""
+    lines = (_SPACE_RUN.sub(' ', line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _extract_page_range(file_path, start, stop):
+    """지정한 페이지 범위의 텍스트 추출 (프로세스 작업 단위)"""
+    with pdfplumber.open(file_path) as pdf:
+        return [page.extract_text() or '' for page in pdf.pages[start:stop]]
+
+
 class UniversalTaxInvoiceExtractor:
-    def extract_from_file(self, file_path):
+    def extract_from_file(self, file_path, page_workers=1):
         result = {
             "success": True,
             "supplier": {},
@@ -19,48 +70,50 @@ class UniversalTaxInvoiceExtractor:
         }
 
         try:
-            with pdfplumber.open(file_path) as pdf:
-                text = "\n".join([page.extract_text() or '' for page in pdf.pages])
+            text = self._extract_text(file_path, page_workers)
+
+            # 라벨은 한 번씩만 찾고 그 위치를 등록번호/상호 검색에 함께 사용
+            supplier_at = _label_end(_SUPPLIER_LABEL, text)
+            buyer_at = _label_end(_BUYER_LABEL, text)
 
             # 공급자 정보
-            supplier_reg = re.search(r'공\s*급\s*자[\s\S]*?등록번호\s*(\d{3}-\d{2}-\d{5})', text)
+            supplier_reg = _search_from(supplier_at, _REG_NUMBER, text)
             if supplier_reg:
                 result["supplier"]["registration_number"] = supplier_reg.group(1).strip()
             else:
                 raise ValueError("공급자 사업자등록번호를 찾을 수 없습니다")
 
-            supplier_name = re.search(r'공\s*급\s*자[\s\S]*?상호[\s\S]*?([^\n]+)', text)
+            supplier_name = _search_from(supplier_at, _COMPANY_NAME, text)
             if supplier_name:
                 result["supplier"]["company_name"] = supplier_name.group(1).strip()
             else:
                 raise ValueError("공급자 상호를 찾을 수 없습니다")
 
             # 공급받는자 정보
-            buyer_reg = re.search(r'공\s*급\s*받\s*는\s*자[\s\S]*?등록번호\s*(\d{3}-\d{2}-\d{5})', text)
+            buyer_reg = _search_from(buyer_at, _REG_NUMBER, text)
             if buyer_reg:
                 result["buyer"]["registration_number"] = buyer_reg.group(1).strip()
             else:
                 raise ValueError("공급받는자 사업자등록번호를 찾을 수 없습니다")
 
-            buyer_name = re.search(r'공\s*급\s*받\s*는\s*자[\s\S]*?상호[\s\S]*?([^\n]+)', text)
+            buyer_name = _search_from(buyer_at, _COMPANY_NAME, text)
             if buyer_name:
                 result["buyer"]["company_name"] = buyer_name.group(1).strip()
             else:
                 raise ValueError("공급받는자 상호를 찾을 수 없습니다")
 
             # 나머지 정보
-            result["supplier"]["address"] = self._find(r'사업장\s*주소\s*([^\n]+)', text)
-            result["supplier"]["ceo_name"] = self._find(r'성명\s*([^\n]+)', text)
-            result["supplier"]["business_type"] = self._find(r'업태\s*([^\n]+)', text)
-            result["supplier"]["item_type"] = self._find(r'종목\s*([^\n]+)', text)
+            result["supplier"]["address"] = self._find(_ADDRESS, text)
+            result["supplier"]["ceo_name"] = self._find(_CEO_NAME, text)
+            result["supplier"]["business_type"] = self._find(_BUSINESS_TYPE, text)
+            result["supplier"]["item_type"] = self._find(_ITEM_TYPE, text)
 
-            buyer_addr_match = re.findall(r'사업장\s*주소\s*([^\n]+)', text)
+            buyer_addr_match = _ADDRESS.findall(text)
             if len(buyer_addr_match) >= 2:
                 result["buyer"]["address"] = buyer_addr_match[1]
 
             # 품목 정보
-            item_pattern = r'(\d{2})\s(\d{2})\s([\w\-/]+)(?:\s([^\n]+))?\s(\d+)\s([0-9,]+)\s([0-9,]+)\s([0-9,]+)'
-            items = re.findall(item_pattern, text)
+            items = _ITEM_ROW.findall(text)
             for it in items:
                 month, day, name, spec, qty, unit_price, supply_amt, tax_amt = it
                 result["items"].append({
@@ -80,8 +133,30 @@ class UniversalTaxInvoiceExtractor:
 
         return result
 
+    def _extract_text(self, file_path, page_workers=1):
+        # PyMuPDF가 있으면 C로 구현된 MuPDF로 추출 (충분히 빨라 페이지를 프로세스로 나누지 않음)
+        if HAS_PYMUPDF:
+            with pymupdf.open(file_path) as doc:
+                # 정규식이 단일 공백 구분을 가정하므로 열 맞춤 공백과 빈 줄을 정리
+                return _normalize_spacing("\n".join([page.get_text('text', sort=True) for page in doc]))
+
+        # 여러 페이지 PDF는 페이지 구간을 나눠 프로세스별로 추출 (pdfminer는 순수 파이썬이라 스레드로는 빨라지지 않음)
+        with pdfplumber.open(file_path) as pdf:
+            page_count = len(pdf.pages)
+            if page_workers <= 1 or page_count < 2:
+                return "\n".join([page.extract_text() or '' for page in pdf.pages])
+
+        workers = min(page_workers, page_count)
+        step = -(-page_count // workers)
+        starts = list(range(0, page_count, step))
+        stops = [min(start + step, page_count) for start in starts]
+
+        with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+            chunks = executor.map(_extract_page_range, [file_path] * len(starts), starts, stops)
+            return "\n".join(text for chunk in chunks for text in chunk)
+
     def _find(self, pattern, text):
-        match = re.search(pattern, text)
+        match = pattern.search(text)
         return match.group(1).strip() if match else None
 
 
@@ -90,10 +165,11 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("input_file", help="PDF 파일 경로")
     parser.add_argument("-o", "--output", help="출력 JSON 파일", default="output.json")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="페이지 텍스트 추출 프로세스 수")
     args = parser.parse_args()
 
     extractor = UniversalTaxInvoiceExtractor()
-    result = extractor.extract_from_file(args.input_file)
+    result = extractor.extract_from_file(args.input_file, page_workers=args.jobs)
 
     with open(args.output, "w", encoding="utf-8") as f:
         json.dump(result, f, ensure_ascii=False, indent=2)